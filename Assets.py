@@ -0,0 +1,65 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: Resolves the bundled images and caches their pixmaps and icons.
+
+import os
+from PyQt5.QtGui import QIcon, QPixmap
+from PyQt5.QtCore import Qt
+
+try:
+    import assets_rc  # noqa: F401  optional, generated with: pyrcc5 assets.qrc -o assets_rc.py
+    HAS_RESOURCES = True
+except ImportError:
+    HAS_RESOURCES = False
+
+
+class Assets:
+    """Single place the GUI gets its images from.
+
+       Paths resolve to the compiled Qt resource bundle when assets_rc is importable,
+       otherwise to the PNGs next to this file. Each file is read once; pixmaps are
+       cached per (asset, size) and icons per asset, so rebuilding a screen never
+       touches the filesystem again.
+    """
+
+    ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+    FILES = {
+        "home_logo": "Home_Logo.png",
+        "usb_logo": "USB_logo.png",
+        "dongle_locker": "STM_DONGLE_LOCKER.png",
+    }
+
+    _pixmaps = {}  # (asset, size or None) -> QPixmap
+    _icons = {}    # asset -> QIcon
+
+    @staticmethod
+    def path(asset):
+        file_name = Assets.FILES[asset]
+        if HAS_RESOURCES:
+            return f":/assets/{file_name}"
+        return os.path.join(Assets.ASSET_DIR, file_name)
+
+    @staticmethod
+    def pixmap(asset, size=None):
+        """Returns the asset scaled to fit size (an int or a (w, h) tuple), smooth and cached."""
+        if isinstance(size, int):
+            size = (size, size)
+        key = (asset, size)
+        pixmap = Assets._pixmaps.get(key)
+        if pixmap is None:
+            if size is None:
+                pixmap = QPixmap(Assets.path(asset))
+                if pixmap.isNull():
+                    print(f"[WARNING] Asset not found: {Assets.path(asset)}")
+            else:
+                pixmap = Assets.pixmap(asset).scaled(*size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            Assets._pixmaps[key] = pixmap
+        return pixmap
+
+    @staticmethod
+    def icon(asset="dongle_locker"):
+        icon = Assets._icons.get(asset)
+        if icon is None:
+            icon = Assets._icons[asset] = QIcon(Assets.pixmap(asset))
+        return icon
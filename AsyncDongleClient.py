@@ -0,0 +1,105 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: asyncio front end to DongleClient, shared by the Frontend GUI and headless code.
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from DongleClient import DongleClient, DeviceStatus, Handshake, Reply, SlotRead, SlotWrite, Snapshot
+
+
+class AsyncDongleClient:
+    """Awaitable version of DongleClient for asyncio code, with or without Qt.
+
+       Usage:
+           async with AsyncDongleClient("COM7") as dongle:
+               read = await dongle.get_code(1)
+
+       Every call runs on the session's own I/O thread, one at a time in the order
+       awaited, so commands never overlap on the firmware's single RX buffer while
+       the event loop stays free. list_ports() uses the loop's default executor
+       instead and can run alongside a command in flight.
+
+       Cancelling an await returns control at once. The command itself still
+       finishes, or times out, on the I/O thread: DongleClient.request() clears
+       stale input before each write, so the link stays usable, and the cache is
+       updated by whatever actually reached the device. aclose() queues DISCONNECT
+       behind anything in flight.
+    """
+
+    CLOSE_TIMEOUT = 3.0  # seconds aclose() waits for DISCONNECT behind an in-flight command
+
+    def __init__(self, port=None, client: Optional[DongleClient] = None, **client_kwargs):
+        self.client = client or DongleClient(port=port, **client_kwargs)
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dongle-io")
+
+    async def __aenter__(self):
+        if not self.client.connected:
+            await self.open(self.client.requested_port)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+        return False
+
+    @property
+    def connected(self) -> bool:
+        return self.client.connected
+
+    @property
+    def metrics(self):
+        return self.client.metrics
+
+    @staticmethod
+    def _loop():
+        """The loop running this coroutine. qasync also steps tasks from
+           app.processEvents() outside run_*(); the thread's loop is that same loop.
+        """
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.get_event_loop()
+
+    async def _run(self, func, *args):
+        return await self._loop().run_in_executor(self._io, func, *args)
+
+    # PORTS
+    @staticmethod
+    async def list_ports() -> List[Tuple[str, str]]:
+        return await AsyncDongleClient._loop().run_in_executor(None, DongleClient.list_ports)
+
+    # SESSION
+    async def open(self, port=None, remembered=None) -> Handshake:
+        return await self._run(self.client.open, port, remembered)
+
+    async def close(self) -> Optional[Reply]:
+        return await self._run(self.client.close)
+
+    async def get_code(self, code_id, use_cache=True) -> SlotRead:
+        return await self._run(self.client.get_code, code_id, use_cache)
+
+    async def set_code(self, code_id, value) -> SlotWrite:
+        return await self._run(self.client.set_code, code_id, value)
+
+    async def clear_code(self, code_id) -> SlotWrite:
+        return await self._run(self.client.clear_code, code_id)
+
+    async def status(self) -> DeviceStatus:
+        return await self._run(self.client.status)
+
+    async def prefetch(self) -> Snapshot:
+        return await self._run(self.client.prefetch)
+
+    async def aclose(self) -> Optional[Reply]:
+        """Says goodbye to the device if connected and releases the I/O thread.
+           Gives up after CLOSE_TIMEOUT and drops the port instead.
+        """
+        try:
+            return await asyncio.wait_for(self.close(), self.CLOSE_TIMEOUT)
+        except (asyncio.TimeoutError, OSError):
+            self._io.submit(self.client.drop)
+            return None
+        finally:
+            self._io.shutdown(wait=False)
@@ -1,5 +1,5 @@
 # Authors: Buqwana Xolisile and Kagiso Dube
-# Version: 06/10/2025
+# Version: 19/10/2026
 # Project: EEE3095S Project
 # Class Description: Parent class in which all interfaces inherit from.
 
@@ -14,9 +14,8 @@ class BaseInterface(QWidget):
         self.handler = handler
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
-        self.setStyleSheet(ThemeUI.get_stylesheet())
         self.setWindowIcon(Icon.get_icon())
-        self.setStyleSheet(ThemeUI.get_stylesheet())
+        ThemeUI.apply()  # no-op after the first screen; the theme lives on the QApplication
 
     def build(self):
         """Each child interface implements this."""
@@ -0,0 +1,390 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: Micro and macro benchmarks with JSON baselines and regression compare.
+
+import os
+import sys
+import json
+import time
+import timeit
+import platform
+import argparse
+import statistics
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+FRONTEND_DIR = os.path.join(ROOT_DIR, "Frontend")
+BASELINE_DIR = os.path.join(ROOT_DIR, "benchmarks")
+if FRONTEND_DIR not in sys.path:
+    sys.path.append(FRONTEND_DIR)
+
+
+class BenchmarkSuite:
+    """Runs grouped benchmarks, saves results as JSON baselines and compares runs.
+
+       Usage:
+           python BenchmarkSuite.py                        run every group
+           python BenchmarkSuite.py -g protocol comm       run selected groups
+           python BenchmarkSuite.py --save baseline        store benchmarks/baseline.json
+           python BenchmarkSuite.py --compare baseline     flag regressions against it
+    """
+
+    GROUPS = ("protocol", "comm", "eventlog", "gui")
+
+    def __init__(self, min_time=0.2, repeat=5):
+        self.min_time = min_time
+        self.repeat = repeat
+        self.results = {}
+        self.skipped = {}
+
+    # MEASUREMENT
+    def measure(self, name, func, number=None):
+        """Times func() and records the median and best per-call cost in microseconds."""
+        timer = timeit.Timer(func)
+        if number is None:
+            number, elapsed = timer.autorange()
+            if elapsed < self.min_time:
+                number = max(1, int(number * self.min_time / max(elapsed, 1e-9)))
+        runs = timer.repeat(repeat=self.repeat, number=number)
+        per_call = [r / number * 1e6 for r in runs]
+        self.results[name] = {
+            "median_us": statistics.median(per_call),
+            "min_us": min(per_call),
+            "loops": number,
+        }
+        print(f"  {name:<45} {self.results[name]['median_us']:>12.2f} us/op")
+        return self.results[name]
+
+    def run(self, groups=None):
+        for group in groups or self.GROUPS:
+            print(f"[{group}]")
+            try:
+                getattr(self, f"bench_{group}")()
+            except ImportError as e:
+                self.skipped[group] = str(e)
+                print(f"  skipped: {e}")
+        return self.results
+
+    # PROTOCOL
+    def bench_protocol(self):
+        from Protocol_Handler import ProtocolHandler, Message
+
+        self.measure("protocol.create_get_code", lambda: ProtocolHandler.create_get_code_message(2))
+        self.measure("protocol.create_set_code", lambda: ProtocolHandler.create_set_code_message(2, "secret123"))
+        self.measure("protocol.parse_response", lambda: ProtocolHandler.parse_response("CODE:secret123"))
+        self.measure("protocol.extract_code", lambda: ProtocolHandler.extract_code_from_response("CODE:secret123"))
+        self.measure("protocol.validate_code_value", lambda: ProtocolHandler.validate_code_value("secret123"))
+        self.measure("message.from_string", lambda: Message.from_string("SET_CODE_1:secret123"))
+        msg = Message("SET_CODE_1", "secret123")
+        self.measure("message.to_string", msg.to_string)
+
+    # COMMUNICATION (emulated dongle)
+    def bench_comm(self):
+        from Dongle_Emulator import EmulatedCommunicationPorts
+
+        comm = EmulatedCommunicationPorts(verbose=False)
+        comm.open_connection()
+        comm.send_command("SET_CODE_1:secret123")
+        self.measure("comm.roundtrip_get", lambda: comm.send_command("GET_CODE_1"))
+        self.measure("comm.roundtrip_set", lambda: comm.send_command("SET_CODE_2:secret123"))
+        self.measure("comm.roundtrip_status", lambda: comm.send_command("STATUS"))
+
+        # Contention: threads sharing one port, each reading its own slot. Per-command cost
+        # should stay at the single-thread figure and every reply must be the caller's own.
+        import threading
+
+        for slot in (1, 2, 3):
+            comm.send_command(f"SET_CODE_{slot}:value{slot}")
+        total = 6000
+        for threads in (1, 2, 8):
+            per_thread = total // threads
+            crossed = []
+
+            def worker(slot):
+                expected = f"CODE_{slot}:value{slot}"
+                crossed.append(sum(comm.send_command(f"GET_CODE_{slot}") != expected for _ in range(per_thread)))
+
+            runs = []
+            for _ in range(self.repeat):
+                workers = [threading.Thread(target=worker, args=(i % 3 + 1,)) for i in range(threads)]
+                started = time.perf_counter()
+                for thread in workers:
+                    thread.start()
+                for thread in workers:
+                    thread.join()
+                runs.append((time.perf_counter() - started) / (per_thread * threads) * 1e6)
+            name = f"comm.contention_{threads}_threads"
+            self.results[name] = {"median_us": statistics.median(runs), "min_us": min(runs),
+                                  "loops": per_thread * threads, "crossed_replies": sum(crossed)}
+            print(f"  {name:<45} {self.results[name]['median_us']:>12.2f} us/op  ({sum(crossed)} crossed replies)")
+            if sum(crossed):
+                print(f"  \033[93m[WARNING] {sum(crossed)} replies reached the wrong thread\033[0m")
+        comm.close_connection()
+
+        # Qt-free core on the same emulated firmware
+        from DongleClient import DongleClient
+        from Dongle_Emulator import DongleEmulator
+
+        client = DongleClient(port_factory=lambda port, baud, timeout: DongleEmulator(port, baud, timeout))
+        client.open("EMU")
+        client.set_code(1, "secret123")
+        self.measure("client.get_code_cached", lambda: client.get_code(1))
+        self.measure("client.get_code_wire", lambda: client.get_code(1, use_cache=False))
+        self.measure("client.set_code", lambda: client.set_code(2, "secret123"))
+        client.close()
+
+        # The Frontend's async path: the same core awaited from asyncio through its I/O thread
+        import asyncio
+        from AsyncDongleClient import AsyncDongleClient
+
+        loop = asyncio.new_event_loop()
+        session = AsyncDongleClient(port_factory=lambda port, baud, timeout: DongleEmulator(port, baud, timeout))
+        loop.run_until_complete(session.open("EMU"))
+        loop.run_until_complete(session.set_code(1, "secret123"))
+        self.measure("client.async_get_code_cached", lambda: loop.run_until_complete(session.get_code(1)))
+        self.measure("client.async_get_code_wire",
+                     lambda: loop.run_until_complete(session.get_code(1, use_cache=False)))
+
+        async def get_during_port_scan():
+            # refresh_ports() and a GET in flight together, as when the user clicks both
+            await asyncio.gather(session.get_code(1, use_cache=False),
+                                 loop.run_in_executor(None, time.sleep, 0.001))
+
+        self.measure("client.async_get_during_port_scan", lambda: loop.run_until_complete(get_during_port_scan()))
+        loop.run_until_complete(session.aclose())
+        loop.close()
+
+        # Cold import of the core in fresh interpreters; it must not pull in Qt or pyserial
+        import subprocess
+        probe = ("import sys, time; t = time.perf_counter(); import DongleClient; "
+                 "print((time.perf_counter() - t) * 1e6, 'PyQt5' in sys.modules or 'serial' in sys.modules)")
+        runs = []
+        for _ in range(self.repeat):
+            out = subprocess.run([sys.executable, "-c", probe], cwd=ROOT_DIR, capture_output=True,
+                                 text=True).stdout.split()
+            runs.append(float(out[0]))
+            if out[1] == "True":
+                print("  \033[93m[WARNING] importing DongleClient loaded Qt or pyserial\033[0m")
+        self.results["client.cold_import"] = {"median_us": statistics.median(runs), "min_us": min(runs),
+                                              "loops": 1}
+        print(f"  {'client.cold_import':<45} {self.results['client.cold_import']['median_us']:>12.2f} us/op")
+
+    # EVENT LOG
+    def bench_eventlog(self):
+        import tempfile
+        from EventLogWriter import EventLogWriter
+
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = EventLogWriter(os.path.join(tmp, "events.jsonl"), max_bytes=1024 * 1024,
+                                    queue_size=0)
+            self.measure("eventlog.record", lambda: writer.record(
+                port="EMU", command="GET_CODE_1", reply="CODE_1", latency_ms=2.5, outcome="ok"),
+                number=20000)
+
+            # Writer side: time until a fixed burst is on disk, including rotation and gzip
+            backlog = 50000
+            writer.close(timeout=60)
+            writer = EventLogWriter(os.path.join(tmp, "drain.jsonl"), max_bytes=1024 * 1024,
+                                    queue_size=0, flush_interval=0.05)
+            started = time.perf_counter()
+            for _ in range(backlog):
+                writer.record(port="EMU", command="GET_CODE_1", reply="CODE_1", latency_ms=2.5, outcome="ok")
+            writer.close(timeout=120)
+            per_record = (time.perf_counter() - started) / backlog * 1e6
+            self.results["eventlog.write_per_record"] = {"median_us": per_record, "min_us": per_record,
+                                                         "loops": backlog}
+            print(f"  {'eventlog.write_per_record':<45} {per_record:>12.2f} us/op")
+
+    # GUI (offscreen Qt)
+    def bench_gui(self):
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt5.QtWidgets import QApplication
+
+        app = QApplication.instance() or QApplication(sys.argv[:1])
+        from DongleSTMHandler import DongleSTMHandler
+        from DongleInterfaceInit import DongleInterfaceInit
+        from LogPanel import LogPanel
+
+        panel = LogPanel()
+        handler = DongleSTMHandler(None, panel)
+        self.measure("gui.log_event", lambda: handler.log_event("[Get Code 1] Checking STM storage..."))
+
+        def log_frame():
+            for _ in range(50):
+                handler.log_event("[DEBUG] STM replied to GET_CODE_1: CODE_1:secret (3.1 ms)")
+            panel.flush()
+
+        self.measure("gui.log_50_lines_and_flush", log_frame)
+        self.measure("gui.clipboard_copy_secret", lambda: handler.clipboard.copy_secret("secret123"))
+        handler.clipboard.clear()
+
+        main_gui = DongleInterfaceInit()
+        # A built STM screen binds the shared handler's callbacks and log panel to
+        # itself; put them back before the screen is deleted so nothing later in the
+        # run calls into a deleted widget.
+        bound = ("on_slots_changed", "on_status_changed", "on_connect_failed", "log_panel")
+        for screen in ("home", "connected", "help", "stm"):
+            def build_screen(screen=screen):
+                saved = {name: getattr(main_gui.handler, name) for name in bound}
+                main_gui.build_screen(screen).deleteLater()
+                for name, value in saved.items():
+                    setattr(main_gui.handler, name, value)
+                app.processEvents()
+
+            def show_screen(screen=screen):
+                main_gui.show_screen(screen)
+                app.processEvents()
+
+            self.measure(f"gui.build_{screen}_screen", build_screen, number=20)
+            self.measure(f"gui.show_{screen}_screen", show_screen)
+        main_gui.window.close()
+
+        # Theme: stylesheet rendering, popup construction and status variants
+        from ThemeUI import ThemeUI
+        from PopupBase import PopupBase
+        from CodeSelectPopup import CodeSelectPopup
+        from DongleInputPopup import DongleInputPopup
+        from main import StatusLabel
+
+        self.measure("gui.theme_get_stylesheet", ThemeUI.get_stylesheet)
+        self.measure("gui.build_popup", lambda: PopupBase("Code Retrieved", "Code 1: secret").deleteLater(),
+                     number=50)
+        self.measure("gui.build_code_select_popup",
+                     lambda: CodeSelectPopup("Edit Code", "Enter code number (1-3):").deleteLater(), number=50)
+        self.measure("gui.build_input_popup", lambda: DongleInputPopup(1, handler).deleteLater(), number=50)
+
+        # Toasts: what a retrieve/save/clear notification costs now that it no longer blocks
+        from PyQt5.QtWidgets import QWidget
+        from ToastNotifier import ToastNotifier
+
+        host = QWidget()
+        host.resize(800, 600)
+        host.show()
+        notifier = ToastNotifier.for_widget(host)
+        notifier.MIN_INTERVAL = 0
+
+        def toast_show():
+            notifier.notify("Code Retrieved", "Code 1: secret", "success")
+            notifier.clear()
+            app.processEvents()
+
+        self.measure("gui.toast_show", toast_show, number=50)
+        notifier.notify("Code Retrieved", "Code 1: secret", "success")
+        self.measure("gui.toast_repeat_dedup",
+                     lambda: notifier.notify("Code Retrieved", "Code 1: secret", "success"))
+        notifier.clear()
+        host.close()
+
+        label = StatusLabel("Ready to connect")
+        label.show()
+
+        def status_update():
+            label.set_status("Connected successfully!", "success")
+            label.set_status("No response from dongle", "error")
+
+        def status_update_stylesheet():
+            # What set_status() used to do: a fresh stylesheet per change
+            for color in ("#10B981", "#EF4444"):
+                label.setStyleSheet(f"QLabel {{ background: {color}22; border-left: 4px solid {color};"
+                                    f" border-radius: 8px; padding: 10px 15px; font-size: 13px;"
+                                    f" color: {color}; font-weight: 600; }}")
+
+        self.measure("gui.status_update", status_update)
+        self.measure("gui.status_update_stylesheet", status_update_stylesheet)
+        label.close()
+        app.processEvents()
+
+        # Frontend repaint cost with cached shadow tiles vs per-widget blur effects
+        from main import DongleLockGUI
+        from Shadow_Renderer import ShadowRenderer
+
+        default_mode = ShadowRenderer.mode
+        for mode in ShadowRenderer.MODES:
+            ShadowRenderer.set_mode(mode)
+            window = DongleLockGUI()
+            window.controls_frame.show()
+            window.show()
+            app.processEvents()
+            self.measure(f"gui.frontend_repaint_{mode}", window.repaint)
+            window.runtime.loop.run_until_complete(window.shut_down())  # waits for the port scan
+            window.deleteLater()
+            app.processEvents()
+        ShadowRenderer.set_mode(default_mode)
+
+        handler.shutdown()
+        main_gui.handler.shutdown()
+
+    # BASELINES
+    @staticmethod
+    def baseline_path(name):
+        if name.endswith(".json") or os.sep in name:
+            return name
+        return os.path.join(BASELINE_DIR, f"{name}.json")
+
+    def save(self, name):
+        path = self.baseline_path(name)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        data = {
+            "meta": {
+                "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "results": self.results,
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        print(f"[Saved] Baseline written to {path}")
+
+    def compare(self, name, threshold=0.10):
+        """Prints a comparison table and returns the names that regressed beyond threshold.
+           Best-of-repeats times are compared since they are the least sensitive to system noise.
+        """
+        path = self.baseline_path(name)
+        with open(path) as f:
+            baseline = json.load(f)["results"]
+
+        regressions = []
+        print(f"\nCompared with {path} (threshold {threshold:.0%}):")
+        print(f"  {'benchmark':<45} {'baseline':>12} {'current':>12} {'change':>9}")
+        for bench, current in sorted(self.results.items()):
+            if bench not in baseline:
+                print(f"  {bench:<45} {'--':>12} {current['min_us']:>12.2f}       new")
+                continue
+            before = baseline[bench]["min_us"]
+            change = (current["min_us"] - before) / before if before else 0.0
+            flag = ""
+            if change > threshold:
+                flag = "  REGRESSION"
+                regressions.append(bench)
+            elif change < -threshold:
+                flag = "  improved"
+            print(f"  {bench:<45} {before:>12.2f} {current['min_us']:>12.2f} {change:>+8.1%}{flag}")
+        return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="STM32 Dongle Lock benchmark suite")
+    parser.add_argument("-g", "--groups", nargs="+", choices=BenchmarkSuite.GROUPS,
+                        help="groups to run (default: all)")
+    parser.add_argument("--save", metavar="NAME", help="save results as a JSON baseline")
+    parser.add_argument("--compare", metavar="NAME", help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown flagged as a regression (default: 0.10)")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats per benchmark")
+    args = parser.parse_args()
+
+    suite = BenchmarkSuite(repeat=args.repeat)
+    suite.run(args.groups)
+    if args.save:
+        suite.save(args.save)
+    if args.compare:
+        regressions = suite.compare(args.compare, args.threshold)
+        if regressions:
+            print(f"\n[Error] {len(regressions)} benchmark(s) regressed beyond {args.threshold:.0%}.")
+            sys.exit(1)
+        print("\nNo regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: Shared Qt clipboard service that wipes copied codes after a timeout.
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QObject, QTimer
+
+
+class ClipboardService(QObject):
+    """Copies codes through Qt's in-process clipboard, without spawning a helper process.
+
+       copy_secret() (re)starts a single-shot timer. When it fires, the clipboard is
+       cleared only if it still holds the code put there, so anything the user copied
+       since is left alone. Both front ends share the instance from instance().
+    """
+
+    CLEAR_AFTER = 30.0  # seconds before a copied code is wiped, 0 to keep it
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Returns the application-wide service, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls(parent=QApplication.instance())
+        return cls._instance
+
+    def __init__(self, clear_after=CLEAR_AFTER, parent=None):
+        super().__init__(parent)
+        self.clear_after = clear_after
+        self._secret = None
+        self._clear_timer = QTimer(self)
+        self._clear_timer.setSingleShot(True)
+        self._clear_timer.timeout.connect(self._expire)
+
+    def copy(self, text):
+        """Copies non-sensitive text; it is never cleared automatically."""
+        QApplication.clipboard().setText(text)
+
+    def copy_secret(self, text, clear_after=None):
+        """Copies a code and schedules its removal after clear_after seconds."""
+        QApplication.clipboard().setText(text)
+        self._secret = text
+        delay = self.clear_after if clear_after is None else clear_after
+        if delay:
+            self._clear_timer.start(int(delay * 1000))
+        else:
+            self._clear_timer.stop()
+
+    def clear(self):
+        """Empties the clipboard now and cancels any pending clear."""
+        self._clear_timer.stop()
+        self._secret = None
+        QApplication.clipboard().clear()
+
+    def _expire(self):
+        if self._secret is not None and QApplication.clipboard().text() == self._secret:
+            QApplication.clipboard().clear()
+        self._secret = None
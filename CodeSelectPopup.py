@@ -1,11 +1,12 @@
 # Authors: Buqwana Xolisile and Kagiso Dube
-# Version: 22/10/2025
+# Version: 19/10/2026
 # Project: EEE3095S Project
 # Class Description: STM-themed popup for selecting which code to edit or clear.
 
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QLineEdit, QPushButton, QHBoxLayout
 from PyQt5.QtCore import Qt
 from Icon import Icon
+from ThemeUI import ThemeUI
 
 class CodeSelectPopup(QDialog):
     """STM-styled popup for choosing which code to edit or clear."""
@@ -24,65 +25,7 @@ class CodeSelectPopup(QDialog):
 
     def _apply_style(self):
         """Applies STM navy and button theme."""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #05244b;  /* deep navy theme */
-                border-radius: 10px;
-                font-family: Segoe UI, Arial;
-                color: white;
-            }
-
-            QLabel {
-                color: #dee6f3;
-                font-weight: 600;
-                font-size: 13px;
-            }
-
-            QLineEdit {
-                background-color: #ffffff;
-                border: 1px solid #0077b6;
-                border-radius: 6px;
-                padding: 6px;
-                font-size: 13px;
-                color: #05244b;
-                qproperty-alignment: AlignCenter;
-            }
-            QLineEdit:focus {
-                border: 1px solid #1a9ee9;
-                background-color: #f0faff;
-            }
-
-            QPushButton {
-                border: none;
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 13px;
-                padding: 6px 14px;
-                min-width: 80px;
-            }
-
-            QPushButton#ok_btn {
-                background-color: #c2c43f;   /* lime green */
-                color: white;
-            }
-            QPushButton#ok_btn:hover {
-                background-color: #d0d246;
-            }
-            QPushButton#ok_btn:pressed {
-                background-color: #a8aa36;
-            }
-
-            QPushButton#cancel_btn {
-                background-color: #1184d5;   /* STM blue */
-                color: #dee4e7;
-            }
-            QPushButton#cancel_btn:hover {
-                background-color: #1a9ee9;
-            }
-            QPushButton#cancel_btn:pressed {
-                background-color: #0f6bab;
-            }
-        """)
+        ThemeUI.set_role(self, "prompt")
 
     def _build_ui(self, message):
         layout = QVBoxLayout()
@@ -97,6 +40,7 @@ class CodeSelectPopup(QDialog):
         # Input
         self.input = QLineEdit()
         self.input.setPlaceholderText("Enter code number (1–3)")
+        self.input.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.input)
 
         # Buttons
@@ -105,9 +49,11 @@ class CodeSelectPopup(QDialog):
 
         ok_btn = QPushButton("OK")
         ok_btn.setObjectName("ok_btn")
+        ThemeUI.set_role(ok_btn, "confirm")
 
         cancel_btn = QPushButton("Cancel")
         cancel_btn.setObjectName("cancel_btn")
+        ThemeUI.set_role(cancel_btn, "standard")
 
         ok_btn.clicked.connect(self._on_ok)
         cancel_btn.clicked.connect(self.reject)
@@ -0,0 +1,53 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: Immutable snapshot of the COM port settings shown in the STM interface.
+
+from typing import NamedTuple
+
+
+class ComStatus(NamedTuple):
+    """COM port settings and connection state. Snapshots compare by value, so the
+       I/O layer can publish a new one only when something actually changed.
+    """
+
+    connected: bool = False
+    port: str = "--"
+    baud: str = "115200"
+    parity: str = "None"
+    data_bits: str = "8"
+    stop_bits: str = "1"
+    timeout: str = "OFF"
+    xonxoff: str = "--"
+    rtscts: str = "--"
+    dsrdtr: str = "--"
+
+    @classmethod
+    def idle(cls, baud):
+        """Defaults shown while no port is open."""
+        return cls(baud=str(baud))
+
+    @classmethod
+    def from_serial(cls, ser, timeout):
+        """Reads the settings of an open pyserial port. timeout is the port's base
+           read timeout, since the live value changes with every command deadline.
+        """
+        return cls(
+            connected=True,
+            port=str(ser.port),
+            baud=str(ser.baudrate),
+            parity=str(ser.parity),
+            data_bits=str(ser.bytesize),
+            stop_bits=str(ser.stopbits),
+            timeout=str(timeout),
+            xonxoff=str(ser.xonxoff),
+            rtscts=str(ser.rtscts),
+            dsrdtr=str(ser.dsrdtr),
+        )
+
+    def display_values(self):
+        """Values in the order of the panel: Baud, Parity, Data Bits, Stop Bits,
+           Timeout, XON/XOFF, CTS Handshake, DSR Handshake.
+        """
+        return (self.baud, self.parity, self.data_bits, self.stop_bits,
+                self.timeout, self.xonxoff, self.rtscts, self.dsrdtr)
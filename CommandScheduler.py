@@ -0,0 +1,157 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: Priority queue in front of the serial link that merges duplicate reads and superseded writes.
+
+import queue
+import threading
+from collections import deque
+
+
+class CancelToken:
+    """Shared cancellation flag. Jobs submitted with a cancelled token are skipped
+       if still queued, and never call their on_done once cancelled.
+    """
+
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class CommandScheduler:
+    """Thread-safe job queue for the serial worker.
+
+       get() hands out groups of jobs that share one exchange:
+         - identical pending reads (GET_CODE_N, STATUS) join one group, and a read
+           already on the wire still accepts new waiters until it finishes;
+         - a SET to a slot that already has a SET queued supersedes it, so only the
+           last value is sent;
+         - a read and a write to the same slot never merge across each other, so
+           every waiter sees the replies in the order it submitted them.
+       DISCONNECT is served before anything else. Writes already queued when it
+       arrives still go out ahead of it: the user was told the code was saved.
+       STATUS waits its turn like any read, so its slot count includes the writes
+       queued before it. The idle heartbeat does not go through the queue: the
+       worker thread sends it itself when get() times out (DongleSerialWorker._supervise).
+    """
+
+    URGENT, NORMAL = 0, 1
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._queues = {self.URGENT: deque(), self.NORMAL: deque()}
+        self._pending = {}  # coalescing key -> group (list of jobs) still accepting jobs
+        self._closed = False
+
+    # PRODUCER SIDE
+    def put(self, job):
+        with self._cond:
+            key = self._key(job)
+            self._invalidate(job)
+            group = self._pending.get(key) if key else None
+            if job.kind == "disconnect":
+                self._flush_writes()
+            if group is None:
+                group = [job]
+                self._queues[self._priority(job)].append(group)
+                if key:
+                    self._pending[key] = group
+            else:
+                if key[0] == "write":
+                    for earlier in group:
+                        earlier.superseded = True
+                group.append(job)
+            self._cond.notify()
+
+    def close(self):
+        """get() returns None once the queued groups are drained."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def __len__(self):
+        with self._cond:
+            return sum(len(q) for q in self._queues.values())
+
+    # CONSUMER SIDE
+    def get(self, timeout=None):
+        """Returns the next group of jobs, or None after close().
+           Raises queue.Empty if nothing arrives within timeout.
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._closed or any(self._queues.values()), timeout):
+                raise queue.Empty
+            for priority in (self.URGENT, self.NORMAL):
+                if self._queues[priority]:
+                    group = self._queues[priority].popleft()
+                    key = self._key(group[0])
+                    if key and key[0] == "write" and self._pending.get(key) is group:
+                        del self._pending[key]  # a SET on the wire can no longer change value
+                    return group
+            return None
+
+    def leader(self, group):
+        """Returns the job whose exchange serves the group, or None to skip it.
+           A read runs for its newest live waiter. A write sends only its newest
+           value, so if that job was cancelled the values it superseded are not
+           sent either.
+        """
+        key = self._key(group[0])
+        if key and key[0] == "write":
+            return None if group[-1].cancelled else group[-1]
+        live = [job for job in group if not job.cancelled]
+        return live[-1] if live else None
+
+    def done(self, group):
+        """Closes a group once its exchange finished and returns every job in it,
+           including reads that joined while it was on the wire.
+        """
+        with self._cond:
+            key = self._key(group[0])
+            if key and self._pending.get(key) is group:
+                del self._pending[key]
+            return list(group)
+
+    # POLICY
+    def _priority(self, job):
+        if job.kind == "disconnect":
+            return self.URGENT
+        return self.NORMAL
+
+    @staticmethod
+    def _key(job):
+        if job.kind != "command" or not job.command:
+            return None
+        if job.command == "STATUS" or job.command.startswith("GET_CODE_"):
+            return ("read", job.command)
+        if job.command.startswith("SET_CODE_"):
+            return ("write", job.command.partition(":")[0])
+        return None
+
+    def _flush_writes(self):
+        """Moves queued writes to the urgent queue, ahead of the DISCONNECT being queued."""
+        normal = self._queues[self.NORMAL]
+        writes = [group for group in normal if (self._key(group[0]) or ("",))[0] == "write"]
+        for group in writes:
+            normal.remove(group)
+            self._queues[self.URGENT].append(group)
+
+    def _invalidate(self, job):
+        """Stops later jobs from merging into groups queued before this one
+           when the two touch the same slot in opposite directions.
+        """
+        key = self._key(job)
+        if key is None:
+            return
+        kind, command = key
+        if kind == "write":
+            slot = command.rsplit("_", 1)[1]
+            stale = [("read", f"GET_CODE_{slot}"), ("read", "STATUS")]
+        elif command == "STATUS":
+            stale = [k for k in self._pending if k[0] == "write"]
+        else:
+            stale = [("write", f"SET_CODE_{command.rsplit('_', 1)[1]}")]
+        for k in stale:
+            self._pending.pop(k, None)
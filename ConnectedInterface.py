@@ -1,13 +1,14 @@
 # Authors: Buqwana Xolisile and Kagiso Dube
-# Version: 06/10/2025
+# Version: 19/10/2026
 # Project: EEE3095S Project
 # Class Description: Initializes the Connected Interface class.
 
 from PyQt5.QtWidgets import QLabel, QPushButton, QHBoxLayout, QSizePolicy
-from PyQt5.QtGui import QPixmap
 from PyQt5.QtCore import Qt
 
 from BaseInterface import BaseInterface
+from ThemeUI import ThemeUI
+from Assets import Assets
 
 class ConnectedInterface(BaseInterface):
     """Connected screen interface."""
@@ -17,8 +18,7 @@ class ConnectedInterface(BaseInterface):
     def build(self):
         title_layout = QHBoxLayout()
         usb_icon = QLabel()
-        usb_icon.setPixmap(QPixmap("C:/Users/xolisile/OneDrive - University of Cape Town/EEE3095S/EEE3095S PROJECT/assets/USB_logo.png").scaled(
-            30, 30, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        usb_icon.setPixmap(Assets.pixmap("usb_logo", 30))
         text_label = QLabel("Dongle — connection options")
         text_label.setAlignment(Qt.AlignCenter)
 
@@ -36,52 +36,13 @@ class ConnectedInterface(BaseInterface):
         exit_btn = QPushButton("Exit")
 
         # Connect button 
-        connect_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #c2c43f;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                min-width: 140px;
-                min-height: 42px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QPushButton:hover { background-color: #d0d246; }
-            QPushButton:pressed { background-color: #a8aa36; }
-        """)
+        ThemeUI.set_role(connect_btn, "confirm")
 
         # Help button
-        help_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f2e36b;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                min-width: 140px;
-                min-height: 42px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QPushButton:hover { background-color: #f7eb7a; }
-            QPushButton:pressed { background-color: #e5d85d; }
-        """)
+        ThemeUI.set_role(help_btn, "help")
 
         # Exit button (blue)
-        exit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1184d5;
-                color: #dee4e7;
-                border: none;
-                border-radius: 8px;
-                min-width: 140px;
-                min-height: 42px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QPushButton:hover { background-color: #1a9ee9; }
-            QPushButton:pressed { background-color: #0f6bab; }
-        """)
+        ThemeUI.set_role(exit_btn, "standard")
 
         # Connect signals
         connect_btn.clicked.connect(self.handler.attempt_connect)
@@ -1,25 +1,39 @@
 # Authors: Buqwana Xolisile and Kagiso Dube
-# Version: 06/10/2025
+# Version: 19/10/2026
 # Project: EEE3035S Project
 # Class Description: Creates DongleInterfaceInit object which initializes the GUI.
 
+import os
 import sys
 from PyQt5.QtWidgets import QApplication  # imports QApplication
 
 from DongleInterfaceInit import DongleInterfaceInit  # import your main GUI container
 from Icon import Icon
+from ThemeUI import ThemeUI
 
 class Dongle:
     @staticmethod
-    def init():
-        app = QApplication(sys.argv)
+    def create(argv=None):
+        """Builds the application and shows the home screen; returns (app, main_GUI)."""
+        app = QApplication(argv if argv is not None else sys.argv)
         app.setWindowIcon(Icon.get_icon())
+        ThemeUI.apply(app)
+        if os.environ.get("DONGLE_STALL_DETECT", "") not in ("", "0"):
+            from StallDetector import StallDetector  # before the GUI exists, so its slots are timed
+            app.stall_detector = StallDetector.from_env()
+            app.stall_detector.install(app)
         main_GUI = DongleInterfaceInit()  
-        print("[DBG] Dongle: initialized main container (DongleInterfaceInit)")
         main_GUI.show()
+        return app, main_GUI
+
+    @staticmethod
+    def init():
+        app, main_GUI = Dongle.create()
         sys.exit(app.exec_())
         
 def main():
     Dongle.init()
-main()
+
+if __name__ == "__main__":
+    main()
 
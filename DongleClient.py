@@ -0,0 +1,576 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: Qt-free dongle core (link, protocol, slot cache and metrics) shared by both GUIs and scripts.
+
+import time
+import random
+import threading
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from SlotCache import SlotCache
+
+# pyserial is imported on first use, so scripts that only parse replies, or use an
+# emulated port, never load it.
+
+
+# RESULTS
+class Reply(NamedTuple):
+    """One reply line. command is the name only; payloads never end up in here."""
+    command: str
+    line: str
+    latency_ms: float
+
+    @property
+    def is_error(self) -> bool:
+        return self.line.startswith("ERR")
+
+
+class Handshake(NamedTuple):
+    port: str
+    device: Dict[str, object]  # fingerprint: port, vid, pid, serial_number, baud
+    fast_path: bool            # the remembered port answered, no discovery ran
+    latency_ms: float
+
+
+class DeviceStatus(NamedTuple):
+    occupied: int
+    capacity: int
+
+
+class SlotRead(NamedTuple):
+    code_id: int
+    value: str                 # "" when the slot is empty
+    cached: bool               # served from the session cache, no exchange
+    latency_ms: float = 0.0
+
+    @property
+    def empty(self) -> bool:
+        return self.value == ""
+
+
+class SlotWrite(NamedTuple):
+    code_id: int
+    saved: bool
+    reply: str
+    latency_ms: float
+
+
+class Snapshot(NamedTuple):
+    """STATUS plus every slot, read in one burst."""
+    status: Optional[DeviceStatus]
+    slots: Dict[int, str]
+    latency_ms: float
+
+
+class CommandStats:
+    """Counters of one command name. Metrics.snapshot() hands out copies."""
+
+    __slots__ = ("count", "errors", "timeouts", "total_ms", "max_ms")
+
+    def __init__(self, count=0, errors=0, timeouts=0, total_ms=0.0, max_ms=0.0):
+        self.count = count
+        self.errors = errors
+        self.timeouts = timeouts
+        self.total_ms = total_ms
+        self.max_ms = max_ms
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def __repr__(self):
+        return (f"CommandStats(count={self.count}, errors={self.errors}, timeouts={self.timeouts}, "
+                f"avg_ms={self.avg_ms:.3f}, max_ms={self.max_ms:.3f})")
+
+
+# ERRORS
+class DongleError(Exception):
+    """A dongle operation failed. port is the port involved (None when no port was
+       found) and reply whatever the STM sent, possibly a partial line.
+    """
+
+    def __init__(self, message, port=None, reply=""):
+        super().__init__(message)
+        self.port = port
+        self.reply = reply
+
+
+class NotConnected(DongleError):
+    pass
+
+
+class DongleTimeout(DongleError):
+    pass
+
+
+class PortRegistry:
+    """Serial ports held by clients in this process. The main screen and every
+       workspace tab run their own client; the registry stops two of them from
+       opening the same port and reading each other's replies.
+    """
+
+    _lock = threading.Lock()
+    _owners = {}  # port -> client holding it
+
+    @classmethod
+    def claim(cls, port, owner) -> bool:
+        """Reserves port for owner. False if another client holds it."""
+        with cls._lock:
+            holder = cls._owners.setdefault(port, owner)
+            return holder is owner
+
+    @classmethod
+    def release(cls, port, owner):
+        with cls._lock:
+            if cls._owners.get(port) is owner:
+                del cls._owners[port]
+
+    @classmethod
+    def owner(cls, port):
+        with cls._lock:
+            return cls._owners.get(port)
+
+
+class Metrics:
+    """Per-command counters of every exchange the client ran."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.commands: Dict[str, CommandStats] = {}
+
+    def record(self, command, latency_ms, outcome):
+        with self._lock:
+            stats = self.commands.setdefault(command, CommandStats())
+            stats.count += 1
+            stats.total_ms += latency_ms
+            stats.max_ms = max(stats.max_ms, latency_ms)
+            if outcome == "timeout":
+                stats.timeouts += 1
+            elif outcome == "error":
+                stats.errors += 1
+
+    def snapshot(self) -> Dict[str, CommandStats]:
+        with self._lock:
+            return {name: CommandStats(*(getattr(stats, slot) for slot in CommandStats.__slots__))
+                    for name, stats in self.commands.items()}
+
+    def reset(self):
+        with self._lock:
+            self.commands.clear()
+
+
+class DongleClient:
+    """Talks to one dongle over a serial port, with no GUI toolkit involved.
+
+       Usage:
+           with DongleClient("COM7") as dongle:
+               read = dongle.get_code(1)
+               if read.empty:
+                   dongle.set_code(1, "secret123")
+
+       The high-level calls (open, close, get_code, set_code, clear_code, status,
+       prefetch) keep a per-session SlotCache and raise DongleError subclasses.
+       The low-level calls (handshake, request, read_all, hangup, reconnect) never
+       touch the cache; the serial worker drives the GUI handler through them.
+       A client is not thread-safe: one thread at a time may use it.
+
+       port_factory(port, baud, timeout) opens the port, pyserial by default; pass
+       one returning a DongleEmulator to run without hardware.
+    """
+
+    SLOTS = (1, 2, 3)
+    MAX_CODE_LENGTH = 19  # firmware truncates longer values (MAX_CODE_LENGTH in main.c)
+
+    # Per-command reply deadlines in seconds. The firmware answers within a few ms,
+    # but stalls its main loop for 1 s after CONNECT/DISCONNECT, so a command sent
+    # right behind them needs more than that.
+    DEFAULT_DEADLINE = 1.5
+    DEADLINES = {"CONNECT": 2.0, "DISCONNECT": 1.0}
+    PORT_TIMEOUT = 1
+    # CONNECT on a remembered port: the firmware replies before its 1 s stall
+    FAST_DEADLINE = 0.5
+    # Opening the port does not reset the board, but some USB-serial adapters drop
+    # bytes written right after open. Discovery has no faster fallback, so it waits
+    # before its first command. The remembered-port and reconnect paths skip the
+    # wait: a lost CONNECT there just falls back to discovery or the next attempt.
+    SETTLE_DELAY = 1.5
+
+    BACKOFF_BASE = 0.5
+    BACKOFF_MAX = 30.0
+
+    def __init__(self, port=None, baud=115200, event_log=None, cache_ttl=300.0,
+                 port_factory: Optional[Callable] = None, verbose=False):
+        self.requested_port = port
+        self.baud = baud
+        self.event_log = event_log  # optional EventLogWriter, one record per exchange
+        self.port_factory = port_factory
+        self.verbose = verbose
+        self.ser = None
+        self.port = None
+        self._claimed_port = None   # port this client holds in the PortRegistry
+        self.device = None          # fingerprint of the connected dongle
+        self.cache = SlotCache(ttl=cache_ttl)
+        self.metrics = Metrics()
+        self.last_traffic = 0.0     # time.monotonic() of the last reply
+
+    # CONTEXT MANAGER
+    def __enter__(self):
+        if not self.connected:
+            self.open(self.requested_port)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            self.close()
+        except (DongleError, OSError):
+            pass  # the link is gone either way
+        return False
+
+    @property
+    def connected(self) -> bool:
+        return self.ser is not None and self.ser.is_open
+
+    # PORTS
+    @staticmethod
+    def list_ports() -> List[Tuple[str, str]]:
+        """(device, description) of every serial port on the system."""
+        import serial.tools.list_ports
+        return [(info.device, info.description) for info in serial.tools.list_ports.comports()]
+
+    @staticmethod
+    def _comports():
+        import serial.tools.list_ports
+        return list(serial.tools.list_ports.comports())
+
+    def _open_port(self, port, baud):
+        """Opens port once the PortRegistry grants it; drop() gives it back."""
+        if not PortRegistry.claim(port, self):
+            raise DongleError(f"{port} is already open in this application.", port)
+        self._claimed_port = port
+        try:
+            if self.port_factory:
+                return self.port_factory(port, baud, self.PORT_TIMEOUT)
+            import serial
+            return serial.Serial(port, baud, timeout=self.PORT_TIMEOUT)
+        except BaseException:
+            self._release_port()
+            raise
+
+    def _release_port(self):
+        if self._claimed_port is not None:
+            PortRegistry.release(self._claimed_port, self)
+            self._claimed_port = None
+
+    def port_present(self) -> bool:
+        """False once the connected port disappeared from the system."""
+        if self.port_factory:
+            return self.connected
+        return self.port in {info.device for info in self._comports()}
+
+    # HIGH LEVEL (session cache)
+    def open(self, port=None, remembered=None) -> Handshake:
+        """Connects and starts a fresh cache session."""
+        result = self.handshake(port, remembered)
+        self.cache.new_session()
+        return result
+
+    def close(self) -> Optional[Reply]:
+        """Sends DISCONNECT if connected, closes the port and wipes the cache."""
+        self.cache.end_session()
+        if not self.connected:
+            self.drop()
+            return None
+        return self.hangup()
+
+    def get_code(self, code_id, use_cache=True) -> SlotRead:
+        self._check_slot(code_id)
+        if use_cache:
+            cached = self.cache.get(code_id)
+            if cached is not None:
+                return SlotRead(code_id, cached, cached=True)
+        reply = self.request(f"GET_CODE_{code_id}")
+        if not reply.line.startswith("CODE_"):
+            raise DongleError(f"Unexpected reply to GET_CODE_{code_id}: {reply.line}", self.port, reply.line)
+        value = reply.line.partition(":")[2]
+        self.cache.put(code_id, value)
+        return SlotRead(code_id, value, cached=False, latency_ms=reply.latency_ms)
+
+    def set_code(self, code_id, value) -> SlotWrite:
+        self._check_slot(code_id)
+        error = self.validate_code(value, allow_empty=True)
+        if error:
+            raise ValueError(error)
+        try:
+            reply = self.request(f"SET_CODE_{code_id}:{value}")
+        except DongleError:
+            self.cache.forget(code_id)  # the device state is unknown now
+            raise
+        saved = reply.line == "SAVED"
+        if saved:
+            self.cache.put(code_id, value)
+        else:
+            self.cache.forget(code_id)
+        return SlotWrite(code_id, saved, reply.line, reply.latency_ms)
+
+    def clear_code(self, code_id) -> SlotWrite:
+        """An empty SET clears the slot on the STM."""
+        return self.set_code(code_id, "")
+
+    def status(self) -> DeviceStatus:
+        reply = self.request("STATUS")
+        status = self.parse_status(reply.line)
+        if status is None:
+            raise DongleError(f"Unexpected reply to STATUS: {reply.line}", self.port, reply.line)
+        return status
+
+    def prefetch(self) -> Snapshot:
+        """Reads STATUS and every slot into the cache."""
+        snapshot = self.read_all()
+        for code_id, value in snapshot.slots.items():
+            self.cache.put(code_id, value)
+        return snapshot
+
+    # LOW LEVEL (no cache)
+    def handshake(self, port=None, remembered=None) -> Handshake:
+        """Opens port, or the first one found, and performs the CONNECT handshake.
+           A remembered fingerprint's port is tried first, and discovery only runs
+           if it misses.
+        """
+        if remembered:
+            result = self._fast_handshake(remembered)
+            if result:
+                return result
+
+        info = None
+        if self.port_factory and port:
+            candidate = port  # emulated or injected port: nothing to enumerate
+        else:
+            available = self._comports()
+            self._debug(f"[DEBUG] Available ports: {[p.device for p in available]}")
+            if port:
+                available = [p for p in available if p.device == port]
+                if not available:
+                    raise DongleError(f"{port} not found.")
+            else:
+                # Discovery skips ports another client (e.g. a workspace tab) holds
+                available = [p for p in available if PortRegistry.owner(p.device) in (None, self)]
+            if not available:
+                raise DongleError("No COM ports found.")
+            info = available[0]
+            candidate = info.device
+
+        self.drop()
+        self.port = candidate
+        self._debug(f"[DEBUG] Trying port: {candidate}")
+        try:
+            self.ser = self._open_port(candidate, self.baud)
+            if not self.port_factory:
+                time.sleep(self.SETTLE_DELAY)
+            self._debug(f"[DEBUG] Serial port {candidate} opened.")
+            reply = self.request("CONNECT")
+        except (DongleError, OSError) as e:
+            self.drop()
+            raise DongleError(str(e), candidate, getattr(e, "reply", "")) from e
+        self._debug(f"[DEBUG] Handshake response: {reply.line}")
+        if reply.line != "OK":
+            self.drop()
+            raise DongleError(f"Unexpected STM response: {reply.line}", candidate, reply.line)
+
+        self.device = {
+            "port": candidate,
+            "vid": info.vid if info else None,
+            "pid": info.pid if info else None,
+            "serial_number": info.serial_number if info else None,
+            "baud": self.baud,
+        }
+        return Handshake(candidate, dict(self.device), False, reply.latency_ms)
+
+    def _fast_handshake(self, fingerprint) -> Optional[Handshake]:
+        """Handshakes on the remembered port straight away: no settle delay and a
+           short deadline. Returns None on a miss, including when the device now on
+           that port is not the remembered one.
+        """
+        self.drop()
+        port = fingerprint["port"]
+        identity = {key: fingerprint.get(key) for key in ("vid", "pid", "serial_number")}
+        if not self.port_factory:
+            info = next((p for p in self._comports() if p.device == port), None)
+            if info is None:
+                self._debug(f"[DEBUG] Remembered port {port} is gone, scanning...")
+                return None
+            live = {"vid": info.vid, "pid": info.pid, "serial_number": info.serial_number}
+            if any(value is not None and live[key] != value for key, value in identity.items()):
+                self._debug(f"[DEBUG] {port} now holds a different device ({live}), scanning...")
+                return None
+            identity = live
+        try:
+            self.ser = self._open_port(port, fingerprint.get("baud", self.baud))
+            self.port = port
+            reply = self.request("CONNECT", self.FAST_DEADLINE)
+        except (DongleError, OSError) as e:
+            self._debug(f"[DEBUG] Remembered port {port} missed ({e}), scanning...")
+            self.drop()
+            return None
+        if reply.line != "OK":
+            self._debug(f"[DEBUG] Remembered port {port} missed ({reply.line}), scanning...")
+            self.drop()
+            return None
+
+        self.device = dict(identity, port=port, baud=fingerprint.get("baud", self.baud))
+        self._debug(f"[DEBUG] Remembered port {port} answered in {reply.latency_ms:.1f} ms")
+        return Handshake(port, dict(self.device), True, reply.latency_ms)
+
+    def request(self, command, deadline=None) -> Reply:
+        """Writes command and returns as soon as a full reply line arrives.
+           Raises DongleTimeout if none arrives before the command's deadline, and
+           lets the port's OSError through so callers can tell a dead link.
+        """
+        if not self.connected:
+            raise NotConnected("STM not connected.", self.port)
+        name = command.split(":")[0]
+        deadline = deadline or self.DEADLINES.get(command, self.DEFAULT_DEADLINE)
+        self.ser.reset_input_buffer()  # drop late replies to earlier timed-out commands
+        self.ser.timeout = deadline
+        started = time.perf_counter()
+        self.ser.write((command + "\r\n").encode())
+        line = self.ser.read_until(b"\n")
+        self.last_traffic = time.monotonic()
+        latency_ms = (time.perf_counter() - started) * 1000
+        text = line.decode(errors="replace").strip()
+
+        timed_out = not line.endswith(b"\n")
+        if timed_out:
+            outcome = "timeout"
+        elif text.startswith("ERR"):
+            outcome = "error"
+        else:
+            outcome = "ok"
+        self.metrics.record(name, latency_ms, outcome)
+        if self.event_log:
+            # Code values never reach the log: only the part before ':' is kept
+            self.event_log.record(
+                port=self.port, command=name, reply=text.split(":")[0],
+                latency_ms=round(latency_ms, 3), outcome=outcome,
+            )
+        if timed_out:
+            raise DongleTimeout(f"No reply to {name} within {deadline:g} s.", self.port, text)
+        return Reply(name, text, latency_ms)
+
+    def read_all(self) -> Snapshot:
+        """Reads STATUS and every slot in one burst.
+           The firmware keeps a single RX buffer, so pipelined commands would
+           overwrite each other; each one is written as soon as the previous
+           reply lands instead.
+        """
+        started = time.perf_counter()
+        status = self.parse_status(self.request("STATUS").line)
+        slots = {}
+        for code_id in self.SLOTS:
+            reply = self.request(f"GET_CODE_{code_id}")
+            if reply.line.startswith("CODE_"):
+                slots[code_id] = reply.line.partition(":")[2]
+        return Snapshot(status, slots, (time.perf_counter() - started) * 1000)
+
+    def hangup(self) -> Reply:
+        """Sends DISCONNECT, reads the optional BYE and closes the port."""
+        self.device = None
+        if not self.connected:
+            raise NotConnected("No active STM connection to disconnect.", self.port)
+        try:
+            return self.request("DISCONNECT")
+        finally:
+            self.drop()
+
+    def drop(self):
+        """Closes the port without telling the STM, e.g. after the link died."""
+        if self.ser is not None and self.ser.is_open:
+            self.ser.close()
+        self.ser = None
+        self._release_port()
+
+    # RECONNECT
+    def find_device(self) -> Optional[str]:
+        """Returns the port the connected dongle is enumerated on now, or None.
+           Matches on USB serial number, or VID/PID on the old port when the
+           adapter reports none.
+        """
+        if self.device is None:
+            return None
+        if self.port_factory:
+            return self.device["port"]
+        serial_number = self.device.get("serial_number")
+        for info in self._comports():
+            if serial_number:
+                if info.serial_number == serial_number:
+                    return info.device
+            elif info.device == self.device["port"] and (info.vid, info.pid) == (self.device.get("vid"),
+                                                                                  self.device.get("pid")):
+                return info.device
+        return None
+
+    def reconnect(self, abort: Optional[threading.Event] = None, max_attempts=None) -> Optional[str]:
+        """Retries the handshake with jittered exponential backoff until the same
+           device answers again. Returns its port, or None once abort is set or
+           max_attempts ran out. Cached slots are dropped once the link is back:
+           an unplug usually power-cycles the board, which keeps its codes in RAM.
+        """
+        if self.device is None:
+            return None
+        abort = abort or threading.Event()
+        self.drop()
+        attempt = 0
+        while max_attempts is None or attempt < max_attempts:
+            delay = min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.5)
+            attempt += 1
+            if abort.wait(delay):
+                return None
+            port = self.find_device()
+            if port is None:
+                continue
+            self._debug(f"[DEBUG] Reconnect attempt {attempt} on {port}")
+            try:
+                # No settle delay (see SETTLE_DELAY): a lost CONNECT just means another attempt
+                self.ser = self._open_port(port, self.baud)
+                self.port = port
+                if self.request("CONNECT").line == "OK":
+                    self.device["port"] = port
+                    if self.cache.session_id is not None:
+                        self.cache.new_session()
+                    return port
+            except (DongleError, OSError):
+                pass
+            self.drop()
+        return None
+
+    # PROTOCOL
+    @classmethod
+    def _check_slot(cls, code_id):
+        if code_id not in cls.SLOTS:
+            raise ValueError(f"Code number must be one of {cls.SLOTS}, got {code_id!r}")
+
+    @classmethod
+    def validate_code(cls, value, allow_empty=False) -> Optional[str]:
+        """Returns why value cannot be stored, or None if it can."""
+        if not value and not allow_empty:
+            return "Code cannot be empty"
+        if len(value) > cls.MAX_CODE_LENGTH:
+            return f"Code is too long (max {cls.MAX_CODE_LENGTH} characters)"
+        if "\n" in value or "\r" in value:
+            return "Code cannot contain newline characters"
+        return None
+
+    @staticmethod
+    def parse_status(line) -> Optional[DeviceStatus]:
+        """'STATUS:OK,CODES:2/3' -> DeviceStatus(2, 3), None for anything else."""
+        if ",CODES:" not in line:
+            return None
+        occupied, _, capacity = line.split(",CODES:")[1].partition("/")
+        try:
+            return DeviceStatus(int(occupied), int(capacity))
+        except ValueError:
+            return None
+
+    def _debug(self, message):
+        if self.verbose:
+            print(message)
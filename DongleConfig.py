@@ -0,0 +1,61 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: Local store of dongle fingerprints used to fast-path reconnects.
+
+import os
+import json
+import time
+
+from EventLogWriter import APP_DIR
+
+DEFAULT_CONFIG_PATH = os.path.join(APP_DIR, "devices.json")
+
+
+class DongleConfig:
+    """Remembers every dongle that completed a handshake, persisted as JSON.
+
+       Entries are keyed by USB serial number (port path when the adapter reports
+       none) and hold the port, VID/PID, serial number, baud, capability descriptor
+       and when the dongle was last seen. The file is re-read before every write so
+       handlers in several workspace tabs do not overwrite each other's entries.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path=DEFAULT_CONFIG_PATH):
+        self.path = path
+        self.devices = self._load()
+
+    def lookup(self, port=None):
+        """Returns the most recently seen fingerprint, on port if given, or None."""
+        candidates = [fp for fp in self.devices.values() if port is None or fp.get("port") == port]
+        return max(candidates, key=lambda fp: fp.get("last_seen", 0), default=None)
+
+    def remember(self, fingerprint):
+        """Merges fingerprint into its device entry and saves the file."""
+        key = fingerprint.get("serial_number") or fingerprint["port"]
+        self.devices = self._load()
+        entry = self.devices.setdefault(key, {})
+        entry.update(fingerprint)
+        entry["last_seen"] = time.time()
+        self._save()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        devices = data.get("devices") if isinstance(data, dict) else None
+        return devices if isinstance(devices, dict) else {}
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": self.VERSION, "devices": self.devices}, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"\033[91m[Error] Could not save dongle config: {e}\033[0m")
@@ -1,11 +1,12 @@
 # Authors: Buqwana Xolisile and Kagiso Dube 
-# Version: 22/10/2025
+# Version: 19/10/2026
 # Project: EEE3095S Project
 # Class Description: Popup to prompt user to input or edit a code value (STM-themed).
 
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QLineEdit, QHBoxLayout, QPushButton, QFrame
 from PyQt5.QtCore import Qt
 from Icon import Icon
+from ThemeUI import ThemeUI
 
 
 class DongleInputPopup(QDialog):
@@ -27,60 +28,7 @@ class DongleInputPopup(QDialog):
 
     def _apply_style(self):
         """Applies STM consistent color scheme and button styling."""
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #05244b;  /* deep navy like interface panels */
-                border-radius: 10px;
-                font-family: Segoe UI, Arial;
-                color: white;
-            }
-
-            QLabel {
-                color: #dee6f3;
-                font-weight: 600;
-                font-size: 13px;
-            }
-
-            QLineEdit {
-                background-color: #ffffff;
-                border: 1px solid #0077b6;
-                border-radius: 6px;
-                padding: 6px;
-                font-size: 13px;
-                color: #05244b;
-            }
-
-            QPushButton {
-                border: none;
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 13px;
-                padding: 6px 14px;
-                min-width: 80px;
-            }
-
-            QPushButton#save_btn {
-                background-color: #c2c43f;   /* lime green */
-                color: white;
-            }
-            QPushButton#save_btn:hover {
-                background-color: #d0d246;
-            }
-            QPushButton#save_btn:pressed {
-                background-color: #a8aa36;
-            }
-
-            QPushButton#cancel_btn {
-                background-color: #1184d5;   /* STM blue */
-                color: #dee4e7;
-            }
-            QPushButton#cancel_btn:hover {
-                background-color: #1a9ee9;
-            }
-            QPushButton#cancel_btn:pressed {
-                background-color: #0f6bab;
-            }
-        """)
+        ThemeUI.set_role(self, "prompt")
 
     def _build_ui(self):
         layout = QVBoxLayout()
@@ -103,9 +51,11 @@ class DongleInputPopup(QDialog):
 
         save_btn = QPushButton("Save")
         save_btn.setObjectName("save_btn")
+        ThemeUI.set_role(save_btn, "confirm")
 
         cancel_btn = QPushButton("Cancel")
         cancel_btn.setObjectName("cancel_btn")
+        ThemeUI.set_role(cancel_btn, "standard")
 
         save_btn.clicked.connect(self._on_save)
         cancel_btn.clicked.connect(self.reject)
@@ -1,30 +1,39 @@
 # Authors: Buqwana Xolisile and Kagiso Dube
-# Version: 06/10/2025
+# Version: 19/10/2026
 # Project: EEE3095S Project
 # Class Description: Renders the Dongle Interface.
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout
-from PyQt5.QtGui import QFont, QPixmap
+import importlib
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QStackedWidget
+from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
 
 from Icon import Icon
+from Assets import Assets
 from ThemeUI import ThemeUI
-from HomeInterface import HomeInterface
-from HelpInterface import HelpInterface
-from ConnectedInterface import ConnectedInterface
-from DongleSTMInterface import DongleSTMInterface
 from DongleSTMHandler import DongleSTMHandler
 
 
 class DongleInterfaceInit:
     """Sets up the main GUI container window.
        Delegates each interface (Home, Connected, Help, Exit).
+       Screens are built once, on first visit, and kept in a stacked widget,
+       so navigating between them only flips the current page. Only the home
+       screen is imported up front; the others load with their first visit.
     """
 
+    SCREENS = {
+        "home": "HomeInterface",
+        "connected": "ConnectedInterface",
+        "help": "HelpInterface",
+        "stm": "DongleSTMInterface",
+        "workspace": "DongleWorkspace",
+    }
+
     def __init__(self):
         # use unified handler (DongleSTMHandler)
         self.handler = DongleSTMHandler(self, None)
-        print("[DBG] DongleInterfaceInit: created self.handler (DongleSTMHandler)")
+        self.screens = {}  # name -> screen widget, built on first use
 
         self.window = QWidget()
         self.window.setWindowTitle("STM32DongleLock")
@@ -42,11 +51,7 @@ class DongleInterfaceInit:
         banner_layout.setSpacing(8)
 
         banner_icon = QLabel()
-        banner_icon.setPixmap(
-            QPixmap(
-                "C:/Users/xolisile/OneDrive - University of Cape Town/EEE3095S/EEE3095S PROJECT/assets/STM_DONGLE_LOCKER.png"
-            ).scaled(24, 24, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        )
+        banner_icon.setPixmap(Assets.pixmap("dongle_locker", 24))
 
         banner_text = QLabel()
         banner_text.setText(
@@ -62,13 +67,15 @@ class DongleInterfaceInit:
 
         banner_container = QWidget()
         banner_container.setLayout(banner_layout)
-        banner_container.setStyleSheet("background-color: white;")
+        ThemeUI.set_role(banner_container, "banner")
         self.layout.addWidget(banner_container)
 
         # Central Widget 
         self.central_widget = QWidget()
         self.central_layout = QVBoxLayout(self.central_widget)
         self.central_layout.setContentsMargins(20, 20, 20, 20)
+        self.stack = QStackedWidget()
+        self.central_layout.addWidget(self.stack)
         self.layout.addWidget(self.central_widget, stretch=1)
 
         self.status_label = QLabel("")
@@ -79,38 +86,53 @@ class DongleInterfaceInit:
         self.setup_home_interface()
 
     def _apply_styles(self):
-        self.window.setStyleSheet(ThemeUI.get_stylesheet())
+        ThemeUI.apply()  # once per application; every screen and popup inherits it
+
+    # SCREENS
+    def build_screen(self, name):
+        """Constructs a fresh screen without showing it, importing its module on first use."""
+        module_name = self.SCREENS[name]
+        screen_class = getattr(importlib.import_module(module_name), module_name)
+        if name == "stm":
+            return screen_class(self.handler)  # builds itself
+        if name == "workspace":
+            screen = screen_class(self.handler, self.window)
+        else:
+            screen = screen_class(self.handler)
+        screen.build()
+        return screen
 
-    def clear_central(self):
-        """Removes all widgets from the central area."""
-        while self.central_layout.count():
-            item = self.central_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.setParent(None)
+    def get_screen(self, name):
+        """Returns the cached screen, building and stacking it on first use."""
+        screen = self.screens.get(name)
+        if screen is None:
+            screen = self.screens[name] = self.build_screen(name)
+            self.stack.addWidget(screen)
+        return screen
+
+    def show_screen(self, name):
+        screen = self.get_screen(name)
+        self.stack.setCurrentWidget(screen)
+        return screen
 
     def setup_home_interface(self):
-        self.clear_central()
-        screen = HomeInterface(self.handler)
-        screen.build()
-        self.central_layout.addWidget(screen)
+        self.show_screen("home")
 
     def setup_connected_interface(self):
-        self.clear_central()
-        screen = ConnectedInterface(self.handler)
-        screen.build()
-        self.central_layout.addWidget(screen)
+        self.show_screen("connected")
 
     def setup_help_interface(self):
-        self.clear_central()
-        screen = HelpInterface(self.handler)
-        screen.build()
-        self.central_layout.addWidget(screen)
+        self.show_screen("help")
+
+    def setup_workspace_interface(self):
+        self.show_screen("workspace")
+
+    def prepare_stm_interface(self):
+        """Builds the STM screen ahead of time, while the handshake is in flight."""
+        self.get_screen("stm")
 
     def setup_stm_interface(self):
-        self.clear_central()
-        screen = DongleSTMInterface(self.handler)
-        self.central_layout.addWidget(screen)
+        self.show_screen("stm").start_session()
 
     def show(self):
         self.window.show()
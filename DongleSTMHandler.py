@@ -1,35 +1,105 @@
 # Authors: Buqwana Xolisile and Kagiso Dube 
-# Version: 23/10/2025
+# Version: 19/10/2026
 # Project: EEE3095S Project
 # Class Description: Unified handler for GUI, STM communication, and UI logging (Real Version).
 
-import time
-import serial
-import pyperclip
-import serial.tools.list_ports
-from PyQt5.QtWidgets import QDialog
-from PyQt5.QtGui import QTextCursor
+from PyQt5.QtWidgets import QDialog, QApplication
 from PyQt5.QtCore import QTimer, QDateTime
 
-from DongleInputPopup import DongleInputPopup
-from CodeSelectPopup import CodeSelectPopup
-from PopupBase import PopupBase
-from ExitPopup import ExitPopup
+from ComStatus import ComStatus
+from CommandScheduler import CancelToken
+from SlotCache import SlotCache
+from EventLogWriter import EventLogWriter
+from DongleConfig import DongleConfig
+from DongleClient import DongleClient
+
+# The serial worker (pyserial), clipboard service and popups are imported on first
+# use so the home screen can paint before they load.
 
 
 class DongleSTMHandler:
     """Handles STM communication, GUI switching, clipboard operations, and logging."""
 
-    def __init__(self, gui, log_panel):
+    # Log colour category per message [Tag], looked up once instead of scanning every line
+    LOG_CATEGORIES = {
+        "Error": "error",
+        "Code Saved": "success",
+        "Retrieved": "success",
+        "Connected": "success",
+        "Edit Code": "action",
+        "Get Code": "action",
+        "User Input": "action",
+    }
+
+    def __init__(self, gui, log_panel, cache_ttl=300.0, event_log=None, popups=True):
         self.gui = gui
         self.log_panel = log_panel
-        self.codes = {}
-        self.ser = None
+        self.popups = popups  # False: notifications go to the log instead of toasts (workspace tabs)
+        self.codes = SlotCache(ttl=cache_ttl)
+        self.on_slots_changed = None  # set by the STM interface to refresh its slot buttons
+        self.on_connect_failed = None  # called with the failed connect job
         self.is_connected = False
         self.port = "COM7"
         self.baud = 115200
-
-        print(f"[DBG] DongleSTMHandler.__init__ called: log_panel is {'set' if log_panel else 'None'}")
+        self.config = DongleConfig()  # last good port per dongle, tried before discovery
+        self.device = None  # fingerprint of the connected dongle
+        self._clipboard = None
+        self.session_token = CancelToken()  # cancelled on disconnect to drop the session's queued commands
+
+        # Persistent record of every exchange, written off the GUI thread.
+        # Workspace tabs share the main handler's writer, which only it closes.
+        self._owns_event_log = event_log is None
+        self.event_log = event_log or EventLogWriter()
+
+        self._worker = None
+        self.link_up = True  # False while the worker is reconnecting a dropped link
+        self.on_status_changed = None  # set by the STM interface to refresh its COM panel
+        self.on_shutdown = None  # set by the workspace to stop its tabs before the event log closes
+        app = QApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def shutdown(self, wait=True):
+        """Stops the serial worker, then drains the event log if this handler owns it.
+           wait=False leaves the worker to finish on its own (DongleSerialWorker.stop).
+        """
+        app = QApplication.instance()
+        if app:
+            try:
+                app.aboutToQuit.disconnect(self.shutdown)
+            except TypeError:
+                pass  # already disconnected
+        if self.on_shutdown:
+            self.on_shutdown()
+        if self._worker:
+            self._worker.stop(wait)
+        if self._owns_event_log:
+            self.event_log.close()
+
+    @property
+    def worker(self):
+        """Serial worker thread, created on first use. All serial I/O runs there
+           so button slots never block the GUI.
+        """
+        if self._worker is None:
+            from DongleSerialWorker import DongleSerialWorker
+            self._worker = DongleSerialWorker(self.baud, self.event_log)
+            self._worker.status_changed.connect(self._on_status_changed)
+            self._worker.link_state_changed.connect(self._on_link_state_changed)
+            self._worker.start()
+        return self._worker
+
+    @property
+    def clipboard(self):
+        if self._clipboard is None:
+            from ClipboardService import ClipboardService
+            self._clipboard = ClipboardService.instance()
+        return self._clipboard
+
+    @property
+    def ser(self):
+        """Serial port owned by the worker thread (read-only from the GUI)."""
+        return self._worker.ser if self._worker else None
 
     # GUI NAVIGATION 
     def show_first_interface(self):
@@ -41,86 +111,85 @@ class DongleSTMHandler:
     def show_help(self):
         self.gui.setup_help_interface()
 
+    def show_workspace(self):
+        self.gui.setup_workspace_interface()
+
     def confirm_and_exit(self):
+        from ExitPopup import ExitPopup
         ExitPopup(self.gui.window)
 
     # STM CONNECTION LOGIC 
-    def attempt_connect(self):
-        """Auto-scan and connect to STM32 dongle safely."""
-        ports = serial.tools.list_ports.comports()
-        available = [p.device for p in ports]
-        print(f"[DEBUG] Available ports: {available}")
-
-        if not available:
+    def attempt_connect(self, port=None):
+        """Connect to the STM32 dongle on port, or the first one found, on the serial worker.
+           The last dongle seen (on that port) is tried first without discovery.
+        """
+        self.worker.submit("connect", on_done=self._on_connect_done, port=port,
+                           remembered=self.config.lookup(port))
+        # The GUI thread is idle during the handshake, so build the STM screen now
+        QTimer.singleShot(0, self.gui.prepare_stm_interface)
+
+    def _on_connect_done(self, job):
+        if job.ok:
+            self.port = job.port
+            self.is_connected = True
+            self.link_up = True
+            self.device = job.device
+            self.config.remember(self.device)
+            route = "remembered port" if job.fast_path else "discovery"
+            print(f"[DEBUG] Handshake on {self.port} via {route}: {job.latency_ms:.1f} ms")
+            session_id = self.codes.new_session()
+            self.session_token = CancelToken()
+            self.worker.submit("prefetch", on_done=lambda job: self._on_prefetch_done(session_id, job),
+                               token=self.session_token)
+            print("\033[92m[Connected] STM Dongle connection established successfully.\033[0m")
+            self._notify("Connected", "STM Dongle connected successfully.", "success")
+            QTimer.singleShot(500, self.gui.setup_stm_interface)
+        elif job.port is None:
             print("\033[91m[Error] No COM ports found.\033[0m")  # Red text
-            self._show_popup(
-                "Connection Failed",
-                '<span style="color:red;">Device Not Found.</span>'
-            )
-            return False
-
-        self.port = available[0]
-        print(f"[DEBUG] Trying port: {self.port}")
-
-        try:
-            self.ser = serial.Serial(self.port, self.baud, timeout=1)
-            time.sleep(1.5)
-            print(f"[DEBUG] Serial port {self.port} opened.")
-
-            self.ser.write(b'CONNECT\n')
-            response = self.ser.readline().decode().strip()
-            print(f"[DEBUG] Handshake response: {response}")
-
-            if response == "OK":
-                self.is_connected = True
-                print("\033[92m[Connected] STM Dongle connection established successfully.\033[0m")
-                self._show_popup(
-                    "Connected",
-                    '<span style="color:green;">STM Dongle connected successfully.</span>'
-                )
-                QTimer.singleShot(500, self.gui.setup_stm_interface)
-                return True
-            else:
-                print(f"\033[91m[Error] Unexpected STM response: {response}\033[0m")
-                self._show_popup(
-                    "Connection Failed",
-                    '<span style="color:red;">Unexpected STM response.<br>'
-                    'Please try again.</span>'
-                )
-                self.ser.close()
-                return False
-
-        except Exception as e:
-            print(f"\033[91m[Error] Could not connect to STM: {e}\033[0m")
-            self._show_popup(
-                "Connection Failed",
-                f'<span style="color:red;">Could not connect to STM.<br><br>Details: {e}</span>'
+            self._notify("Connection Failed", "Device Not Found.", "error")
+        elif job.response:
+            print(f"\033[91m[Error] Unexpected STM response: {job.response}\033[0m")
+            self._notify("Connection Failed", "Unexpected STM response. Please try again.", "error")
+        else:
+            print(f"\033[91m[Error] Could not connect to STM: {job.error}\033[0m")
+            self._notify("Connection Failed", f"Could not connect to STM. Details: {job.error}", "error")
+        if not job.ok and self.on_connect_failed:
+            self.on_connect_failed(job)
+
+    def _on_prefetch_done(self, session_id, job):
+        if session_id != self.codes.session_id:
+            return  # disconnected or reconnected while the burst was in flight
+        for code_id, value in job.slots.items():
+            self.codes.put(code_id, value)
+        if job.capacity and self.device:
+            self.config.remember(dict(self.device, capabilities={"slots": job.capacity}))
+        if job.ok:
+            self.log_event(
+                f"[DEBUG] Prefetched {len(job.slots)} slots, {job.occupied}/3 stored ({job.latency_ms:.1f} ms)"
             )
-            return False
-
+        else:
+            self.log_event(f"[Error] Slot prefetch failed: {job.error}")
+        self._notify_slots()
 
     def disconnect_stm(self):
         """Disconnect from STM32 and return to home interface."""
-        if self.ser and self.ser.is_open:
-            try:
-                print("\033[94m[Disconnecting] Disconnecting from STM...\033[0m")
-                self.ser.write(b"DISCONNECT\n")
-
-                time.sleep(0.3)
-                response = self.ser.readline().decode().strip()
-                if response:
-                    print(response)  
-
-                self.ser.close()
-                print("\033[92m[Disconnected] STM Dongle disconnected successfully.\033[0m")
-
-            except Exception as e:
-                print(f"\033[91m[Error] Disconnect failed: {e}\033[0m")
-
+        print("\033[94m[Disconnecting] Disconnecting from STM...\033[0m")
+        # DISCONNECT jumps the queue; reads still waiting behind it are dropped and
+        # queued writes go out first (CommandScheduler), reporting through their on_done
+        self.session_token.cancel()
+        self.worker.submit("disconnect", on_done=self._on_disconnect_done)
+
+    def _on_disconnect_done(self, job):
+        if job.ok:
+            if job.response:
+                print(job.response)
+            print("\033[92m[Disconnected] STM Dongle disconnected successfully.\033[0m")
         else:
-            print("\033[91m[Error] No active STM connection to disconnect.\033[0m")
+            print(f"\033[91m[Error] Disconnect failed: {job.error}\033[0m")
 
         self.is_connected = False
+        self.codes.end_session()
+        self._notify_slots()
         self.log_event("[Disconnected] STM Dongle disconnected successfully.")
         QTimer.singleShot(700, self.gui.setup_home_interface)
 
@@ -130,93 +199,129 @@ class DongleSTMHandler:
         """Retrieve a stored code from STM."""
         self.log_event(f"[Get Code {code_id}] Checking STM storage...")
 
-        if self.is_connected and self.ser:
-            cmd = f"GET_CODE_{code_id}"
-            try:
-                self.ser.write((cmd + "\r\n").encode())
-                time.sleep(0.2)
-                resp = self.ser.readline().decode().strip()
-                print(f"[DEBUG] STM replied to {cmd}: {resp}")
-                self.log_event(f"[DEBUG] STM replied to {cmd}: {resp}")
-
-                if resp and "CODE_" in resp:
-                    parts = resp.split(":")
-                    if len(parts) == 2:
-                        self.codes[code_id] = parts[1]
-                        pyperclip.copy(parts[1])
-                        self._show_popup("Code Retrieved", f"Code {code_id}: {parts[1]}")
-                        self.log_event(f"[Retrieved] Code {code_id}: {parts[1]}")
-            except Exception as e:
-                self.log_event(f"[Error] Could not read STM: {e}")
+        cached = self.codes.get(code_id) if self.is_connected else None
+        if cached is not None:
+            self.log_event(f"[DEBUG] Code {code_id} served from cache.")
+            self._show_code(code_id, cached)
+        elif self.is_connected:
+            self.worker.submit(
+                "command", f"GET_CODE_{code_id}",
+                on_done=lambda job: self._on_code_received(code_id, job),
+                token=self.session_token
+            )
         else:
             self.log_event("[Error] STM not connected.")
+
+    def _on_code_received(self, code_id, job):
+        if not job.ok:
+            self.log_event(f"[Error] Could not read STM: {job.error}")
+            return
+
+        resp = job.response
+        print(f"[DEBUG] STM replied to {job.command}: {resp}")
+        self.log_event(f"[DEBUG] STM replied to {job.command}: {resp} ({job.latency_ms:.1f} ms)")
+
+        if resp and "CODE_" in resp:
+            _, _, value = resp.partition(":")
+            self.codes.put(code_id, value)
+            self._notify_slots()
+            self._show_code(code_id, value)
+
+    def fetch_code(self, code_id: int, on_done):
+        """Reads a slot without popups or clipboard, for operations across many dongles.
+           on_done(value, error) runs on the GUI thread; value is "" for an empty slot.
+        """
+        cached = self.codes.get(code_id) if self.is_connected else None
+        if cached is not None:
+            on_done(cached, None)
+        elif not self.is_connected:
+            on_done(None, "STM not connected.")
+        else:
+            self.worker.submit(
+                "command", f"GET_CODE_{code_id}",
+                on_done=lambda job: self._on_code_fetched(code_id, job, on_done),
+                token=self.session_token
+            )
+
+    def _on_code_fetched(self, code_id, job, on_done):
+        if job.ok and job.response.startswith("CODE_"):
+            value = job.response.partition(":")[2]
+            self.codes.put(code_id, value)
+            self._notify_slots()
+            on_done(value, None)
+        else:
+            on_done(None, job.error or job.response)
+
+    def _show_code(self, code_id, value):
+        self.clipboard.copy_secret(value)
+        self._notify("Code Retrieved", f"Code {code_id}: {value}", "success")
+        self.log_event(f"[Retrieved] Code {code_id}: {value}")
     
     def handle_set_code(self, code_id: int):
         """Prompt user to enter and send a real code value to the STM."""
         self.log_event(f"[Set Code {code_id}] Prompting user for input...")
 
+        from DongleInputPopup import DongleInputPopup
         popup = DongleInputPopup(code_id, self, parent=self.gui.window)
-        if popup.exec_() == QDialog.Accepted:
-            code_value = popup.input_field.text().strip()
-            if not code_value:
-                self._show_popup("Invalid Input", "Code value cannot be empty.")
-                self.log_event(f"[Error] Empty code entered for Code {code_id}.")
-                return
-
-            # Save locally and log
-            self.codes[code_id] = code_value
-            pyperclip.copy(code_value)
-
-            # Send to STM
-            if self.is_connected and self.ser:
-                try:
-                    cmd = f"SET_CODE_{code_id}:{code_value}"
-                    self.ser.write((cmd + "\r\n").encode())
-                    time.sleep(0.2)
-                    resp = self.ser.readline().decode().strip()
-                    self.log_event(f"[DEBUG] STM replied to SET_CODE_{code_id}: {resp}")
-
-                except Exception as e:
-                    self.log_event(f"[Error] Could not send to STM: {e}")
-            else:
-                self.log_event("[Error] STM not connected.")
-        else:
-            self.log_event(f"[Set Code {code_id}] User cancelled input.")
+        if popup.exec_() != QDialog.Accepted:  # Save already went through save_new_code()
+            self.log_event(f"[Set Code {code_id}] User cancelled input.", "action")
 
     def save_new_code(self, code_id: int, code_value: str):
-        """Save new code and send it to STM."""
-        self.codes[code_id] = code_value
-        pyperclip.copy(code_value)
-        self._show_popup("Code Saved", f"Code {code_id} stored and copied to clipboard.")
+        """Save new code and send it to STM. The cache is written once the STM confirms.
+           Values the firmware would truncate or reject are refused before sending.
+        """
+        error = DongleClient.validate_code(code_value)
+        if error:
+            self._notify("Invalid Input", f"{error}.", "error")
+            self.log_event(f"[Error] Code {code_id} not saved: {error}.")
+            return
+
+        self.clipboard.copy_secret(code_value)
+        self._notify("Code Saved", f"Code {code_id} stored and copied to clipboard.", "success")
         self.log_event(f"[Code Saved] Stored new value for Code {code_id}.")
   
-        if self.is_connected and self.ser:
-            try:
-                cmd = f"SET_CODE_{code_id}:{code_value}"
-                self.ser.write((cmd + "\r\n").encode())
-                time.sleep(0.2)
-                resp = self.ser.readline().decode().strip()
-            except Exception as e:
-                self.log_event(f"[Error] Could not verify STM: {e}")
+        if self.is_connected:
+            self.worker.submit(
+                "command", f"SET_CODE_{code_id}:{code_value}",
+                on_done=lambda job: self._on_code_verified(code_id, code_value, job)
+            )  # no session token: a DISCONNECT sends queued writes first instead of dropping them
+        else:
+            self.log_event("[Error] STM not connected.")
+
+    def _on_code_verified(self, code_id, code_value, job):
+        if job.ok and job.response == "SAVED":
+            self.codes.put(code_id, code_value)
+            self._notify_slots()
+            self.log_event(f"[DEBUG] STM replied to SET_CODE_{code_id}: {job.response} ({job.latency_ms:.1f} ms)")
+        else:
+            # The device state is unknown now, re-read it on the next Get
+            self.codes.forget(code_id)
+            self.log_event(f"[Error] Could not verify STM: {job.error or job.response}")
 
     def handle_exit(self):
-        pyperclip.copy("")
+        self.clipboard.clear()
         self.log_event("[Exit] Sent DISCONNECT to STM, clearing clipboard and returning home.")
-        self._show_popup("Disconnected", "STM Dongle disconnected.")
+        self._notify("Disconnected", "STM Dongle disconnected.")
         self.disconnect_stm()
     
+    def _may_hold_code(self, code_id):
+        """False only for a slot the STM reported empty; a slot never read may hold one."""
+        return self.codes.occupied(code_id) is not False
+
     def handle_edit_code(self):
         """Edit existing code."""
-        if not self.codes:
-            self._show_popup("Something went wrong", "No codes available to edit.")
+        if not any(self._may_hold_code(code_id) for code_id in (1, 2, 3)):
+            self._notify("Something went wrong", "No codes available to edit.", "error")
             self.log_event("[Edit Code] Attempted to edit but no codes stored.")
             return
 
+        from CodeSelectPopup import CodeSelectPopup
+        from DongleInputPopup import DongleInputPopup
         popup = CodeSelectPopup("Edit Code", "Enter code number (1–3):", self.gui.window)
         if popup.exec_() == QDialog.Accepted:
             code_id = popup.code_id
-            if code_id not in self.codes:
-                self._show_popup("Not Found", f"Code {code_id} not yet stored.")
+            if not self._may_hold_code(code_id):
+                self._notify("Not Found", f"Code {code_id} not yet stored.", "error")
                 self.log_event(f"[Edit Code] Code {code_id} not found for editing.")
                 return
 
@@ -228,80 +333,97 @@ class DongleSTMHandler:
 
     def handle_clear_code(self):
         """Clear existing stored code."""
-        if not self.codes:
-            self._show_popup("Something went wrong", "No codes to clear.")
+        if not any(self._may_hold_code(code_id) for code_id in (1, 2, 3)):
+            self._notify("Something went wrong", "No codes to clear.", "error")
             self.log_event("[Clear Code] No codes found to clear.")
             return
 
+        from CodeSelectPopup import CodeSelectPopup
         popup = CodeSelectPopup("Clear Code", "Enter code number to clear (1–3):", self.gui.window)
         if popup.exec_() == QDialog.Accepted:
             code_id = popup.code_id
-            if code_id not in self.codes:
-                self._show_popup("Not Found", f"Code {code_id} not stored.")
+            if not self._may_hold_code(code_id):
+                self._notify("Not Found", f"Code {code_id} not stored.", "error")
                 self.log_event(f"[Clear Code] Tried to clear Code {code_id}, but it doesn't exist.")
                 return
 
-            del self.codes[code_id]
-            self._show_popup("Code Cleared", f"Code {code_id} has been cleared.")
-            self.log_event(f"[Clear Code] Code {code_id} cleared successfully.")
+            # An empty SET clears the slot on the STM as well
+            self.worker.submit(
+                "command", f"SET_CODE_{code_id}:",
+                on_done=lambda job: self._on_code_cleared(code_id, job)
+            )  # flushed before a DISCONNECT, like save_new_code()
         else:
             self.log_event("[Clear Code] User cancelled clear operation.")
 
+    def _on_code_cleared(self, code_id, job):
+        if job.ok and job.response == "SAVED":
+            self.codes.put(code_id, "")
+            self._notify_slots()
+            self._notify("Code Cleared", f"Code {code_id} has been cleared.", "success")
+            self.log_event(f"[Clear Code] Code {code_id} cleared successfully.", "success")
+        else:
+            self.codes.forget(code_id)
+            self.log_event(f"[Error] Could not clear Code {code_id} on STM: {job.error or job.response}")
+
+
+    def _notify_slots(self):
+        if self.on_slots_changed:
+            self.on_slots_changed()
 
     # LOGGING 
-    def log_event(self, message: str):
-        """Appends log message with timestamp to the log panel."""
+    def log_event(self, message: str, category: str = None):
+        """Queues a timestamped log message on the log panel.
+           category is one of LogPanel.COLORS; when omitted it comes from the message's [Tag].
+        """
         if not self.log_panel:
             print(message)
             return
 
+        if category is None:
+            tag = message[1:message.find("]")] if message.startswith("[") else ""
+            category = self.LOG_CATEGORIES.get(tag.rstrip(" 0123456789"), "info")
         timestamp = QDateTime.currentDateTime().toString("hh:mm:ss")
-        color = "#003344"
-        if "[Error]" in message:
-            color = "#E63946"
-        elif any(w in message for w in ["Saved", "Retrieved", "Connected", "Cleared"]):
-            color = "#007F00"
-        elif any(w in message for w in ["Edit", "Get", "User"]):
-            color = "#0077B6"
-
-        html_line = (
-            f'<span style="color:gray;">[{timestamp}]</span> '
-            f'<span style="color:{color};">{message}</span><br>'
-        )
-        self.log_panel.moveCursor(QTextCursor.End)
-        self.log_panel.insertHtml(html_line)
-        self.log_panel.moveCursor(QTextCursor.End)
+        self.log_panel.append_event(timestamp, message, category)
 
     # UTILITIES 
-    def get_com_status(self) -> str:
-        """Return current COM port settings (live)."""
-        try:
-            if self.ser and self.ser.is_open:
-                return (
-                    f"Baud: {self.ser.baudrate}\n"
-                    f"Parity: {self.ser.parity}\n"
-                    f"Data Bits: {self.ser.bytesize}\n"
-                    f"Stop Bits: {self.ser.stopbits}\n"
-                    f"Timeout: {self.ser.timeout}\n"
-                    f"XON/XOFF: {self.ser.xonxoff}\n"
-                    f"CTS Handshake: {self.ser.rtscts}\n"
-                    f"DSR Handshake: {self.ser.dsrdtr}"
-                )
-            else:
-                return (
-                    f"Baud: {self.baud}\n"
-                    f"Parity: None\n"
-                    f"Data Bits: 8\n"
-                    f"Stop Bits: 1\n"
-                    f"Timeout: OFF\n"
-                    f"XON/XOFF: --\n"
-                    f"CTS Handshake: --\n"
-                    f"DSR Handshake: --"
-                )
-        except Exception as e:
-            return f"[Error] Could not read COM port info: {e}"
-
-
-    def _show_popup(self, title, message):
-        popup = PopupBase(title, message, parent=self.gui.window)
-        popup.exec_()
+    def get_com_status(self):
+        """Return the last ComStatus published by the serial worker."""
+        return self._worker.status if self._worker else ComStatus.idle(self.baud)
+
+    def _on_status_changed(self, status):
+        if self.on_status_changed:
+            self.on_status_changed(status)
+
+    def _on_link_state_changed(self, state, detail):
+        """Queued commands survive a dropped link, so the handler stays connected and
+           reports what the worker is doing. The cache does not: an unplug usually
+           power-cycles the board, which keeps its codes in RAM, so a restored link
+           starts a fresh cache session and reads every slot again.
+        """
+        if not self.is_connected:
+            return
+        if state == "lost":
+            self.link_up = False
+            self.log_event(f"[Error] Link lost, reconnecting... ({detail})")
+        elif state == "restored":
+            self.link_up = True
+            self.port = detail
+            if self.device:
+                self.device["port"] = detail
+                self.config.remember(self.device)
+            self.log_event(f"[Connected] Link restored on {detail}.")
+            session_id = self.codes.new_session()
+            self._notify_slots()
+            self.worker.submit("prefetch", on_done=lambda job: self._on_prefetch_done(session_id, job),
+                               token=self.session_token)
+
+
+    def _notify(self, title, message, level="info"):
+        """Shows a non-blocking toast in the window (level: info, success or error),
+           or only logs it when this handler runs without popups.
+        """
+        if not self.popups:
+            self.log_event(f"[{title}] {message}")
+            return
+        from ToastNotifier import ToastNotifier
+        ToastNotifier.for_widget(self.gui.window).notify(title, message, level)
@@ -1,24 +1,27 @@
 # Authors: Buqwana Xolisile and Kagiso Dube
-# Version: 23/10/2025
+# Version: 19/10/2026
 # Project: EEE3095S Project
 # Class Description: Displays Interface after successful STM connection.
 
 from PyQt5.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton, QLabel,
-    QSizePolicy, QTextEdit, QFrame
+    QSizePolicy, QFrame
 )
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 from BaseInterface import BaseInterface
+from LogPanel import LogPanel
+from ThemeUI import ThemeUI
 
 
 class DongleSTMInterface(BaseInterface):
     """Interface displayed after successful STM connection, with COM and Target info."""
 
-    def __init__(self, handler_parent):
+    def __init__(self, handler_parent, log_lines=LogPanel.MAX_LINES):
         super().__init__(handler_parent)
         self.handler_parent = handler_parent
         self.handler = None
+        self.log_lines = log_lines
         self.build()
 
     def build(self):
@@ -41,55 +44,32 @@ class DongleSTMInterface(BaseInterface):
         mem_label = QLabel("Memory & Code Editing")
         for lbl in (log_label, mem_label):
             lbl.setFont(QFont("Segoe UI", 11, QFont.Bold))
-            lbl.setStyleSheet("color: white;")
+            ThemeUI.set_role(lbl, "section")
         grid.addWidget(log_label, 0, 0)
         grid.addWidget(mem_label, 0, 1)
 
         # LEFT PANEL: LOG BOX
         left_box = QFrame()
-        left_box.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #f2f2f2, stop:1 #e6e6e6);
-                border-radius: 10px;
-            }
-        """)
+        ThemeUI.set_role(left_box, "card")
         left_layout = QVBoxLayout(left_box)
         left_layout.setContentsMargins(10, 10, 10, 10)
         left_layout.setSpacing(8)
 
-        self.log_panel = QTextEdit()
-        self.log_panel.setReadOnly(True)
-        self.log_panel.setStyleSheet("""
-            QTextEdit {
-                background-color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                font-family: Consolas, monospace;
-                font-size: 12px;
-                color: #1a1a1a;
-                padding: 8px;
-            }
-        """)
+        self.log_panel = LogPanel(self.log_lines)
+        ThemeUI.set_role(self.log_panel, "log")
         left_layout.addWidget(self.log_panel)
         grid.addWidget(left_box, 1, 0)
 
         # RIGHT PANEL: MEMORY & CODE EDITING 
         right_box = QFrame()
-        right_box.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                            stop:0 #f2f2f2, stop:1 #e6e6e6);
-                border-radius: 10px;
-            }
-        """)
+        ThemeUI.set_role(right_box, "card")
         right_layout = QVBoxLayout(right_box)
         right_layout.setContentsMargins(10, 10, 10, 10)
         right_layout.setSpacing(10)
 
         # MEMORY PANEL 
         mem_panel = QFrame()
-        mem_panel.setStyleSheet("QFrame { background-color: #05244b; border-radius: 8px; }")
+        ThemeUI.set_role(mem_panel, "panel")
         mem_inner = QHBoxLayout(mem_panel)
         mem_inner.setContentsMargins(10, 10, 10, 10)
         mem_inner.setSpacing(12)
@@ -116,7 +96,7 @@ class DongleSTMInterface(BaseInterface):
 
         # EDIT/CLEAR PANEL 
         edit_panel = QFrame()
-        edit_panel.setStyleSheet("QFrame { background-color: #05244b; border-radius: 8px; }")
+        ThemeUI.set_role(edit_panel, "panel")
         edit_inner = QHBoxLayout(edit_panel)
         edit_inner.setContentsMargins(10, 10, 10, 10)
         edit_inner.setSpacing(12)
@@ -130,20 +110,13 @@ class DongleSTMInterface(BaseInterface):
 
         # COM PORT STATUS PANEL 
         com_panel = QFrame()
-        com_panel.setStyleSheet("""
-            QFrame { background-color: #001f3f; border-radius: 8px; }
-            QLabel {
-                color: #dee6f3;
-                font-family: Consolas, monospace;
-                font-size: 12px;
-            }
-        """)
+        ThemeUI.set_role(com_panel, "info")
         com_layout = QVBoxLayout(com_panel)
         com_layout.setContentsMargins(10, 8, 10, 8)
         com_layout.setSpacing(6)
 
         com_title = QLabel("COM Port Status")
-        com_title.setStyleSheet("color: #7ec8ff; font-weight: 600; font-size: 13px;")
+        ThemeUI.set_role(com_title, "info-title")
         com_layout.addWidget(com_title)
 
         com_grid = QGridLayout()
@@ -157,8 +130,8 @@ class DongleSTMInterface(BaseInterface):
             row, col = i // 2, (i % 2) * 2
             key_lbl = QLabel(key)
             val_lbl = QLabel("--")
-            key_lbl.setStyleSheet("color: #9fc4e3;")
-            val_lbl.setStyleSheet("color: #ffffff; font-weight: 500;")
+            ThemeUI.set_role(key_lbl, "info-key")
+            ThemeUI.set_role(val_lbl, "info-value")
             com_grid.addWidget(key_lbl, row, col)
             com_grid.addWidget(val_lbl, row, col + 1)
             self.com_labels.append(val_lbl)
@@ -168,20 +141,13 @@ class DongleSTMInterface(BaseInterface):
 
         # TARGET INFORMATION PANEL
         target_panel = QFrame()
-        target_panel.setStyleSheet("""
-            QFrame { background-color: #001f3f; border-radius: 8px; }
-            QLabel {
-                color: #dee6f3;
-                font-family: Consolas, monospace;
-                font-size: 12px;
-            }
-        """)
+        ThemeUI.set_role(target_panel, "info")
         target_layout = QVBoxLayout(target_panel)
         target_layout.setContentsMargins(10, 8, 10, 8)
         target_layout.setSpacing(6)
 
         target_title = QLabel("Target Information")
-        target_title.setStyleSheet("color: #7ec8ff; font-weight: 600; font-size: 13px;")
+        ThemeUI.set_role(target_title, "info-title")
         target_layout.addWidget(target_title)
 
         self.target_info_label = QLabel(
@@ -195,20 +161,7 @@ class DongleSTMInterface(BaseInterface):
 
         # DISCONNECT BUTTON 
         self.exit_btn = QPushButton("Disconnect")
-        self.exit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #c2c43f;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 13px;
-                padding: 8px 16px;
-                min-height: 38px;
-            }
-            QPushButton:hover { background-color: #d0d246; }
-            QPushButton:pressed { background-color: #a8aa36; }
-        """)
+        ThemeUI.set_role(self.exit_btn, "disconnect")
         hl = QHBoxLayout()
         hl.addStretch()
         hl.addWidget(self.exit_btn)
@@ -219,9 +172,6 @@ class DongleSTMInterface(BaseInterface):
         if self.handler.log_panel is None:
             self.handler.log_panel = self.log_panel
 
-        # INITIAL LOG MESSAGE
-        self.handler.log_event("[Connected] STM Dongle connection established successfully.")
-
         # BUTTON CONNECTIONS 
         self.get1_btn.clicked.connect(lambda: self.handler.handle_code_request(1))
         self.get2_btn.clicked.connect(lambda: self.handler.handle_code_request(2))
@@ -233,34 +183,37 @@ class DongleSTMInterface(BaseInterface):
         self.edit_btn.clicked.connect(self.handler.handle_edit_code)
         self.exit_btn.clicked.connect(self.handler.handle_exit)
 
-        # COM INFO REFRESH 
-        self.update_com_info()
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_com_info)
-        self.timer.start(2000)
+        # SLOT STATE (filled by the prefetch that runs after the handshake)
+        self.handler.on_slots_changed = self.update_slot_marks
+
+        # COM INFO (pushed by the serial worker when a setting or the link changes)
+        self._com_values = [None] * len(self.com_labels)
+        self.handler.on_status_changed = self.update_com_info
+
+    def start_session(self):
+        """Refreshes the screen for a new connection; the screen itself is reused."""
+        self.handler.log_event("[Connected] STM Dongle connection established successfully.")
+        self.update_slot_marks()
+        self.update_com_info(self.handler.get_com_status())
 
     # BUTTON STYLE HELPER 
     def _style_standard_button(self, btn: QPushButton):
         btn.setMinimumHeight(36)
-        btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1184d5;
-                color: #dee4e7;
-                border: none;
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QPushButton:hover { background-color: #1a9ee9; }
-            QPushButton:pressed { background-color: #0f6bab; }
-        """)
+        ThemeUI.set_role(btn, "standard")
         btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
 
-    # LIVE COM INFO REFRESH 
-    def update_com_info(self):
-        """Updates the COM status panel dynamically."""
-        status = self.handler.get_com_status().split("\n")
-        for i, line in enumerate(status[:len(self.com_labels)]):
-            parts = line.split(":", 1)
-            if len(parts) == 2:
-                self.com_labels[i].setText(parts[1].strip())
+    # SLOT MARKS
+    def update_slot_marks(self):
+        """Marks Get buttons of slots the STM reported as empty."""
+        for code_id, btn in enumerate((self.get1_btn, self.get2_btn, self.get3_btn), start=1):
+            empty = self.handler.codes.occupied(code_id) is False
+            btn.setText(f"Get Code {code_id} (empty)" if empty else f"Get Code {code_id}")
+            btn.setToolTip("Slot is empty on the STM." if empty else "")
+
+    # LIVE COM INFO 
+    def update_com_info(self, status):
+        """Updates the COM labels whose value differs from the published ComStatus."""
+        for i, value in enumerate(status.display_values()):
+            if value != self._com_values[i]:
+                self._com_values[i] = value
+                self.com_labels[i].setText(value)
@@ -0,0 +1,276 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: Worker thread that owns the STM serial port and runs every exchange off the GUI thread.
+
+import time
+import queue
+import threading
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from ComStatus import ComStatus
+from CommandScheduler import CommandScheduler
+from DongleClient import DongleClient, DongleError
+
+
+class SerialJob:
+    """One unit of work for the serial worker and, once finished, its result."""
+
+    def __init__(self, kind, command=None, on_done=None, port=None, remembered=None, token=None):
+        self.kind = kind            # "connect", "command", "prefetch" or "disconnect"
+        self.command = command      # protocol line without terminator
+        self.on_done = on_done      # called on the GUI thread with the finished job
+        self.token = token          # optional CancelToken
+        self.superseded = False     # a later SET to the same slot replaced this one
+        self.response = ""
+        self.error = None
+        self.port = port            # connect: requested port (None = first found), then the opened one
+        self.remembered = remembered  # connect: DongleConfig fingerprint to try before discovery
+        self.device = None          # connect: fingerprint of the dongle that answered
+        self.fast_path = False      # connect: True when the remembered port answered
+        self.latency_ms = None      # write-to-reply time of the exchange
+        self.slots = {}             # prefetch: code_id -> stored value ("" when empty)
+        self.occupied = None        # prefetch: slot count reported by STATUS
+        self.capacity = None        # prefetch: total slots reported by STATUS
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    @property
+    def cancelled(self):
+        return self.token is not None and self.token.cancelled
+
+    def copy_result(self, other):
+        """Takes the outcome of the exchange another job in the same group ran."""
+        self.response, self.error, self.latency_ms = other.response, other.error, other.latency_ms
+
+
+class DongleSerialWorker(QThread):
+    """Owns the dongle's DongleClient. Jobs are queued from the GUI thread with submit(),
+       scheduled by a CommandScheduler (urgent first, duplicate reads merged,
+       superseded writes dropped), executed here and handed back through job_finished.
+       Cancelled and superseded jobs never call their on_done.
+
+       While connected and idle the worker also supervises the link: it checks that
+       the port is still enumerated and sends a STATUS heartbeat after a quiet spell.
+       A read/write error, a vanished port or an unanswered heartbeat starts the
+       client's reconnect loop, which waits for the same device (matched by USB
+       serial number) to reappear. Queued jobs stay queued and the job that hit the
+       error is retried once the link is back.
+    """
+
+    job_finished = pyqtSignal(object)
+    status_changed = pyqtSignal(object)  # ComStatus, emitted only when it differs from the last one
+    link_state_changed = pyqtSignal(str, str)  # ("lost", reason) or ("restored", port)
+
+    # The worker only runs shallow Python frames, so a small stack keeps the
+    # per-device cost low when many dongles are open at once.
+    STACK_SIZE = 512 * 1024
+
+    # Link supervision, in seconds. HEARTBEAT_INTERVAL = 0 disables the heartbeat;
+    # each one shows "Status Check" on the dongle's LCD.
+    SUPERVISE_INTERVAL = 2.0
+    HEARTBEAT_INTERVAL = 15.0
+
+    _detached = set()  # workers stopped without waiting, kept alive until their thread ends
+
+    def __init__(self, baud=115200, event_log=None, parent=None):
+        super().__init__(parent)
+        self.baud = baud
+        # Protocol, deadlines and reconnect policy live in the Qt-free client
+        self.client = DongleClient(baud=baud, event_log=event_log, verbose=True)
+        self.jobs = CommandScheduler()
+        self._abort_reconnect = threading.Event()
+        self.status = ComStatus.idle(baud)
+        self.setStackSize(self.STACK_SIZE)
+        self.job_finished.connect(self._dispatch)
+
+    @property
+    def ser(self):
+        return self.client.ser
+
+    @property
+    def port(self):
+        return self.client.port
+
+    # GUI THREAD API
+    def submit(self, kind, command=None, on_done=None, port=None, remembered=None, token=None):
+        """Queues a job and returns immediately."""
+        job = SerialJob(kind, command, on_done, port, remembered, token)
+        if kind == "disconnect":
+            self._abort_reconnect.set()  # the user gave up on the link; don't wait for it
+        self.jobs.put(job)
+        return job
+
+    def stop(self, wait=True):
+        """Stops the worker after the queued jobs and closes the port.
+           With wait=False it returns at once: nothing is reported back any more and
+           the worker deletes itself when its thread ends, so a handshake or reconnect
+           still in flight never blocks the GUI. join_detached() waits for those.
+        """
+        if not self.isRunning():
+            return
+        self._abort_reconnect.set()
+        self.jobs.close()
+        if wait:
+            self.wait()
+            return
+        for signal in (self.job_finished, self.status_changed, self.link_state_changed):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass  # nothing connected
+        DongleSerialWorker._detached.add(self)
+        self.finished.connect(self._release_detached)
+        if self.isFinished():  # ended before finished was connected
+            self._release_detached()
+
+    def _release_detached(self):
+        if self in DongleSerialWorker._detached:
+            DongleSerialWorker._detached.discard(self)
+            self.deleteLater()
+
+    @classmethod
+    def join_detached(cls):
+        """Waits for every worker stopped with wait=False; called before the app exits."""
+        for worker in list(cls._detached):
+            worker.wait()
+
+    def _dispatch(self, job):
+        # Delivered through a queued connection, so this runs on the GUI thread
+        if job.on_done and not job.cancelled and not job.superseded:
+            job.on_done(job)
+
+    # WORKER THREAD
+    def run(self):
+        while True:
+            # Supervise only while a dongle is connected; otherwise sleep until a job arrives
+            supervising = self.client.device is not None
+            try:
+                group = self.jobs.get(timeout=self.SUPERVISE_INTERVAL if supervising else None)
+            except queue.Empty:
+                self._supervise()
+                self._publish_status()
+                continue
+            if group is None:
+                break
+            # One exchange serves the whole group
+            leader = self.jobs.leader(group)
+            if leader:
+                self._execute(leader)
+            group = self.jobs.done(group)
+            for job in group:
+                if job is leader or job.superseded:
+                    continue
+                if leader:
+                    job.copy_result(leader)
+                else:
+                    job.error = "Cancelled."  # joined a read whose waiters all cancelled
+            self._publish_status()
+            for job in group:
+                self.job_finished.emit(job)
+        self.client.drop()
+        self._publish_status()
+
+    def _execute(self, job):
+        """Runs a job, retrying it once if the link drops and comes back mid-job."""
+        run = getattr(self, f"_run_{job.kind}")
+        try:
+            run(job)
+        except OSError as e:  # pyserial's SerialException is an OSError
+            if job.kind not in ("command", "prefetch") or not self._recover_link(str(e)):
+                job.error = str(e)
+                return
+            job.error = None
+            try:
+                run(job)
+            except Exception as e:
+                job.error = str(e)
+        except DongleError as e:
+            job.error = str(e)
+            job.response = e.reply
+        except Exception as e:
+            job.error = str(e)
+
+    def _publish_status(self):
+        if self.client.connected:
+            status = ComStatus.from_serial(self.client.ser, self.client.PORT_TIMEOUT)
+        else:
+            status = ComStatus.idle(self.baud)
+        if status != self.status:
+            self.status = status
+            self.status_changed.emit(status)
+
+    def _run_connect(self, job):
+        """Open the requested port, or the first one found, and perform the CONNECT handshake.
+           A remembered dongle's port is tried first, and discovery only runs if it misses.
+        """
+        self._abort_reconnect.clear()
+        try:
+            result = self.client.handshake(job.port, job.remembered)
+        except DongleError as e:
+            job.port = e.port
+            raise
+        job.port = result.port
+        job.device = result.device
+        job.fast_path = result.fast_path
+        job.latency_ms = result.latency_ms
+        job.response = "OK"
+
+    def _run_command(self, job):
+        """Sends one protocol command and reads its reply line."""
+        reply = self.client.request(job.command)
+        job.response, job.latency_ms = reply.line, reply.latency_ms
+
+    def _run_prefetch(self, job):
+        """Reads STATUS and every slot in one burst right after the handshake."""
+        snapshot = self.client.read_all()
+        job.slots = snapshot.slots
+        if snapshot.status:
+            job.occupied, job.capacity = snapshot.status.occupied, snapshot.status.capacity
+        job.latency_ms = snapshot.latency_ms
+
+    def _run_disconnect(self, job):
+        """Sends DISCONNECT, reads the optional BYE and closes the port."""
+        self._abort_reconnect.clear()
+        reply = self.client.hangup()
+        job.response, job.latency_ms = reply.line, reply.latency_ms
+
+    # LINK SUPERVISION
+    def _supervise(self):
+        """Idle-time link check: port still enumerated, and a heartbeat after a quiet spell."""
+        if self.client.device is None or not self.client.connected:
+            return
+        if not self.client.port_present():
+            self._recover_link(f"{self.client.port} was removed.")
+            return
+        if self.HEARTBEAT_INTERVAL and time.monotonic() - self.client.last_traffic >= self.HEARTBEAT_INTERVAL:
+            try:
+                self.client.request("STATUS")
+            except (DongleError, OSError) as e:
+                self._recover_link(str(e))
+
+    def _recover_link(self, reason):
+        """Closes the dead port and lets the client retry the handshake with backoff
+           until the same device answers again or a disconnect/stop aborts.
+           Returns True once the link is restored.
+        """
+        if self.client.device is None:
+            return False
+        self._record_link("lost", reason)  # the handler logs it on the panel from link_state_changed
+        self.client.drop()
+        self._publish_status()
+        self.link_state_changed.emit("lost", reason)
+
+        port = self.client.reconnect(self._abort_reconnect)
+        if port is None:
+            return False
+        self._record_link("restored", port)
+        self._publish_status()
+        self.link_state_changed.emit("restored", port)
+        return True
+
+    def _record_link(self, state, detail):
+        if self.client.event_log:
+            self.client.event_log.record(port=self.client.port, event=f"link_{state}", detail=detail)
@@ -0,0 +1,191 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: Multi-dongle workspace with one tab, handler and serial worker per device.
+
+import time
+from PyQt5.QtWidgets import (
+    QComboBox, QHBoxLayout, QLabel, QPushButton, QTabWidget, QSizePolicy
+)
+from PyQt5.QtCore import Qt, QDateTime, QThread, pyqtSignal
+
+from BaseInterface import BaseInterface
+from DongleClient import DongleClient, PortRegistry  # pyserial loads on the first scan, off the GUI thread
+from DongleSerialWorker import DongleSerialWorker
+from DongleWorkspaceTab import DongleWorkspaceTab
+from LogPanel import LogPanel
+
+
+class PortScanner(QThread):
+    """Enumerates serial ports off the GUI thread; on Windows this can take
+       hundreds of milliseconds.
+    """
+
+    ports_found = pyqtSignal(list)  # [(device, description)]
+
+    def run(self):
+        try:
+            ports = DongleClient.list_ports()
+        except Exception as e:
+            print(f"\033[91m[Error] Could not list serial ports: {e}\033[0m")
+            ports = []
+        self.ports_found.emit(ports)
+
+
+class DongleWorkspace(BaseInterface):
+    """Workspace screen for operators managing several dongles at once.
+       Every tab runs its own serial worker, so bulk reads such as "Get Code 1
+       from all" go out to every device concurrently. All tabs share the main
+       handler's event log, which that handler closes.
+    """
+
+    def __init__(self, handler, window):
+        super().__init__(handler)
+        self.main_window = window
+        self.event_log = handler.event_log  # one writer per log file; it rotates the file
+        self.scanner = PortScanner()
+        self.scanner.ports_found.connect(self._on_ports_found)
+        self.scanner.finished.connect(self._on_scan_finished)
+        self._rescan = False  # refresh requested while a scan was running
+        # The tabs log to the handler's writer, so they stop before the handler closes it
+        handler.on_shutdown = self.shutdown
+
+    def build(self):
+        title = QLabel("Workspace — one tab per connected dongle")
+        title.setAlignment(Qt.AlignCenter)
+        self.layout.addWidget(title)
+
+        # Port picker
+        connect_row = QHBoxLayout()
+        self.port_box = QComboBox()
+        self.port_box.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        refresh_btn = QPushButton("Refresh")
+        connect_btn = QPushButton("Connect")
+        connect_all_btn = QPushButton("Connect All")
+        refresh_btn.clicked.connect(self.refresh_ports)
+        connect_btn.clicked.connect(self.connect_selected)
+        connect_all_btn.clicked.connect(self.connect_all)
+        for widget in (self.port_box, refresh_btn, connect_btn, connect_all_btn):
+            connect_row.addWidget(widget)
+        self.layout.addLayout(connect_row)
+
+        # Bulk operations
+        bulk_row = QHBoxLayout()
+        for code_id in (1, 2, 3):
+            btn = QPushButton(f"Get Code {code_id} from all")
+            btn.clicked.connect(lambda _, code_id=code_id: self.fetch_all(code_id))
+            bulk_row.addWidget(btn)
+        self.layout.addLayout(bulk_row)
+
+        self.tab_widget = QTabWidget()
+        self.tab_widget.setTabsClosable(True)
+        self.tab_widget.tabCloseRequested.connect(self._on_tab_close_requested)
+        self.layout.addWidget(self.tab_widget, stretch=1)
+
+        self.log_panel = LogPanel(DongleWorkspaceTab.LOG_LINES)
+        self.log_panel.setMaximumHeight(120)
+        self.layout.addWidget(self.log_panel)
+
+        back_row = QHBoxLayout()
+        back_btn = QPushButton("Back")
+        back_btn.clicked.connect(self.handler.show_first_interface)
+        back_row.addStretch()
+        back_row.addWidget(back_btn)
+        self.layout.addLayout(back_row)
+
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.refresh_ports()
+
+    # DEVICES
+    def tabs(self):
+        return [self.tab_widget.widget(i) for i in range(self.tab_widget.count())]
+
+    def refresh_ports(self):
+        """Rescans the serial ports in the background; the picker updates when it ends."""
+        if self.scanner.isRunning():
+            self._rescan = True
+        else:
+            self.scanner.start()
+
+    def _on_ports_found(self, ports):
+        """Lists the serial ports that have no tab and are not open elsewhere in the app."""
+        open_ports = {tab.port for tab in self.tabs()}
+        self.port_box.clear()
+        for device, description in ports:
+            if device not in open_ports and PortRegistry.owner(device) is None:
+                self.port_box.addItem(f"{device} — {description}", device)
+
+    def _on_scan_finished(self):
+        if self._rescan:
+            self._rescan = False
+            self.scanner.start()
+
+    def connect_selected(self):
+        port = self.port_box.currentData()
+        if port:
+            self.add_device(port)
+
+    def connect_all(self):
+        for i in range(self.port_box.count()):
+            self.add_device(self.port_box.itemData(i))
+
+    def add_device(self, port):
+        if any(tab.port == port for tab in self.tabs()):
+            return
+        tab = DongleWorkspaceTab(self, port, self.event_log)
+        self.tab_widget.addTab(tab, port)
+        self.log_event(f"[Connecting] {port}...")
+        self.refresh_ports()
+
+    def close_tab(self, tab):
+        index = self.tab_widget.indexOf(tab)
+        if index < 0:
+            return
+        self.tab_widget.removeTab(index)
+        tab.shutdown(wait=False)  # a handshake or reconnect in flight must not freeze the window
+        tab.deleteLater()
+        self.refresh_ports()
+
+    def _on_tab_close_requested(self, index):
+        tab = self.tab_widget.widget(index)
+        if tab.handler.is_connected:
+            tab.handler.disconnect_stm()  # the tab closes itself once BYE arrives
+        else:
+            self.close_tab(tab)
+
+    # BULK OPERATIONS
+    def fetch_all(self, code_id):
+        """Reads one slot from every connected dongle at once and logs each result."""
+        tabs = [tab for tab in self.tabs() if tab.handler.is_connected]
+        if not tabs:
+            self.log_event("[Error] No connected dongles.", "error")
+            return
+
+        self.log_event(f"[Get Code {code_id}] Reading from {len(tabs)} dongle(s)...", "action")
+        started = time.perf_counter()
+        remaining = [len(tabs)]
+
+        def done(port, value, error):
+            if error:
+                self.log_event(f"[Error] {port} Code {code_id}: {error}", "error")
+            else:
+                self.log_event(f"[Retrieved] {port} Code {code_id}: {value or '(empty)'}", "success")
+            remaining[0] -= 1
+            if not remaining[0]:
+                elapsed = (time.perf_counter() - started) * 1000
+                self.log_event(f"[DEBUG] Code {code_id} read from {len(tabs)} dongle(s) in {elapsed:.1f} ms")
+
+        for tab in tabs:
+            tab.handler.fetch_code(code_id, lambda value, error, port=tab.port: done(port, value, error))
+
+    # LOGGING
+    def log_event(self, message, category="info"):
+        timestamp = QDateTime.currentDateTime().toString("hh:mm:ss")
+        self.log_panel.append_event(timestamp, message, category)
+
+    def shutdown(self):
+        """Stops every tab's worker, including those of tabs already closed."""
+        self.scanner.wait()
+        for tab in self.tabs():
+            tab.shutdown()
+        DongleSerialWorker.join_detached()
@@ -0,0 +1,62 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: One workspace tab, acting as the GUI of a handler bound to a single dongle.
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel
+from PyQt5.QtCore import Qt
+
+from DongleSTMHandler import DongleSTMHandler
+from DongleSTMInterface import DongleSTMInterface
+
+
+class DongleWorkspaceTab(QWidget):
+    """Hosts the STM interface of one dongle inside the workspace.
+       The tab owns its handler and serial worker; the handler navigates through the
+       same setup_*_interface calls it uses in the single-device window.
+    """
+
+    # Operators keep 20+ tabs open, so each log holds less than the single-device view
+    LOG_LINES = 500
+
+    def __init__(self, workspace, port, event_log):
+        super().__init__()
+        self.workspace = workspace
+        self.port = port
+        self.window = workspace.main_window  # parent for the handler's dialogs
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        self.status_label = QLabel(f"Connecting to {port}...")
+        self.status_label.setAlignment(Qt.AlignCenter)
+        self.layout.addWidget(self.status_label)
+
+        self.handler = DongleSTMHandler(self, None, event_log=event_log, popups=False)
+        self.handler.on_connect_failed = self._on_connect_failed
+        self.stm_screen = None
+        self.handler.attempt_connect(port)
+
+    # NAVIGATION (called by the handler)
+    def prepare_stm_interface(self):
+        """Builds the hidden STM screen while the handshake is in flight."""
+        if self.stm_screen is None:
+            self.stm_screen = DongleSTMInterface(self.handler, log_lines=self.LOG_LINES)
+            self.stm_screen.hide()
+            self.layout.addWidget(self.stm_screen)
+
+    def setup_stm_interface(self):
+        self.prepare_stm_interface()
+        self.status_label.hide()
+        self.stm_screen.show()
+        self.stm_screen.start_session()
+
+    def setup_home_interface(self):
+        """The dongle was disconnected, so its tab goes away."""
+        self.workspace.close_tab(self)
+
+    def _on_connect_failed(self, job):
+        self.workspace.log_event(f"[Error] {self.port}: {job.error or job.response}", "error")
+        self.workspace.close_tab(self)
+
+    def shutdown(self, wait=True):
+        self.handler.shutdown(wait)
@@ -0,0 +1,131 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: Background JSON Lines event log with batched flushes, rotation and compression.
+
+import os
+import glob
+import gzip
+import json
+import time
+import queue
+import shutil
+import threading
+
+APP_DIR = os.path.join(os.path.expanduser("~"), ".stm32donglelock")
+DEFAULT_LOG_PATH = os.path.join(APP_DIR, "logs", "events.jsonl")
+
+
+class EventLogWriter:
+    """Persists session events as JSON Lines without blocking the caller.
+
+       record() only puts a dict on a queue. A daemon thread drains the queue in
+       batches, writes and flushes once per batch, and rotates the file when it
+       exceeds max_bytes or is older than max_age seconds. Rotated files are named
+       events-YYYYmmdd-HHMMSS.jsonl (gzip-compressed when compress is set) and only
+       the newest `backups` are kept. If the queue is full, records are counted in
+       `dropped` instead of stalling the caller.
+    """
+
+    _STOP = object()
+
+    def __init__(self, path=DEFAULT_LOG_PATH, max_bytes=5 * 1024 * 1024, max_age=24 * 3600,
+                 backups=10, compress=True, flush_interval=0.5, batch_size=512, queue_size=100000):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.backups = backups
+        self.compress = compress
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.dropped = 0
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._file = None
+        self._size = 0
+        self._opened_at = 0.0
+        self._thread = threading.Thread(target=self._run, name="event-log-writer", daemon=True)
+        self._thread.start()
+
+    # CALLER SIDE
+    def record(self, **fields):
+        """Queues one event. Never blocks; a timestamp is added here."""
+        fields["ts"] = time.time()
+        try:
+            self._queue.put_nowait(fields)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self, timeout=5.0):
+        """Writes everything still queued and closes the file."""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join(timeout)
+
+    # WRITER THREAD
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = []
+            try:
+                batch.append(self._queue.get(timeout=self.flush_interval))
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            if self._STOP in batch:
+                stopping = True
+                batch = [record for record in batch if record is not self._STOP]
+            try:
+                if batch:
+                    self._write(batch)
+                self._rotate_if_due()
+            except OSError as e:
+                print(f"\033[91m[Error] Event log write failed: {e}\033[0m")
+
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _write(self, batch):
+        if self._file is None:
+            self._open()
+        lines = []
+        for record in batch:
+            ts = record["ts"]
+            record["ts"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(ts)) + f".{int(ts * 1000) % 1000:03d}"
+            lines.append(json.dumps(record, separators=(",", ":"), default=str))
+        data = "\n".join(lines) + "\n"
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data.encode())
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._size = self._file.tell()
+        self._opened_at = time.time()
+
+    def _rotate_if_due(self):
+        if self._file is None or self._size == 0:
+            return
+        if self._size < self.max_bytes and time.time() - self._opened_at < self.max_age:
+            return
+
+        self._file.close()
+        self._file = None
+        base, ext = os.path.splitext(self.path)
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        rotated, n = f"{base}-{stamp}{ext}", 1
+        while os.path.exists(rotated) or os.path.exists(rotated + ".gz"):
+            rotated, n = f"{base}-{stamp}.{n}{ext}", n + 1
+        os.replace(self.path, rotated)
+        if self.compress:
+            with open(rotated, "rb") as src, gzip.open(rotated + ".gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(rotated)
+
+        old = sorted(glob.glob(f"{glob.escape(base)}-*{ext}*"), key=os.path.getmtime)
+        for stale in old[:-self.backups] if self.backups else old:
+            os.remove(stale)
@@ -0,0 +1,131 @@
+"""
+Async Runtime Module
+Runs an asyncio event loop together with Qt's so GUI handlers can be coroutines
+Authors: Dube Kagiso and Xolisile Buqwana
+Date: 19 October 2026
+"""
+
+import asyncio
+import traceback
+from PyQt5.QtCore import QObject, QTimer
+from PyQt5.QtWidgets import QApplication
+
+try:
+    import qasync  # optional: runs asyncio directly on Qt's event loop
+except ImportError:
+    qasync = None
+
+
+class SteppedEventLoop(QObject):
+    """Fallback used when qasync is not installed.
+
+    While tasks are pending, a Qt timer gives a plain asyncio loop one
+    non-blocking iteration every STEP_MS. Ready callbacks and finished I/O
+    threads are handled on the next step, so a reply reaches its coroutine at
+    most STEP_MS late. With nothing pending the timer is stopped.
+    """
+
+    STEP_MS = 10
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.loop = asyncio.new_event_loop()
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.step)
+
+    def start(self):
+        if not self.timer.isActive():
+            self.timer.start(self.STEP_MS)
+
+    def stop(self):
+        self.timer.stop()
+
+    def step(self):
+        if self.loop.is_running():  # a nested Qt event loop, e.g. a modal dialog opened by a callback
+            return
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+
+
+class AsyncRuntime:
+    """One asyncio loop per application, running inside the Qt event loop.
+
+    Backends:
+        qasync   asyncio runs on Qt's own event loop (used when qasync is installed)
+        stepped  a Qt timer steps a plain asyncio loop (SteppedEventLoop)
+
+    spawn() starts a coroutine as a task and reports its exception, if any, on
+    the console. Slots start handlers with spawn() and keep the tasks they may
+    have to cancel. exec() runs the application, then cancels and awaits
+    whatever is still pending, and returns the application's exit code. Quit
+    with exit(code) to return something other than 0 under qasync, whose loop
+    does not hand Qt's exit code back.
+    """
+
+    BACKENDS = ("qasync", "stepped")
+    _instance = None
+
+    @classmethod
+    def instance(cls, app=None, backend=None):
+        """Returns the application's runtime, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls(app or QApplication.instance(), backend)
+        return cls._instance
+
+    def __init__(self, app, backend=None):
+        backend = backend or ("qasync" if qasync else "stepped")
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown event loop backend: {backend} (expected one of {', '.join(self.BACKENDS)})")
+        if backend == "qasync" and qasync is None:
+            raise ValueError("The qasync backend needs the qasync package (pip install qasync)")
+        self.app = app
+        self.backend = backend
+        if backend == "qasync":
+            self.loop = qasync.QEventLoop(app)
+        else:
+            self.driver = SteppedEventLoop(app)
+            self.loop = self.driver.loop
+        asyncio.set_event_loop(self.loop)
+        self.tasks = set()
+        self.exit_code = 0
+
+    def spawn(self, coro):
+        task = self.loop.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self._finished)
+        if self.backend == "stepped":
+            self.driver.start()
+        return task
+
+    def _finished(self, task):
+        self.tasks.discard(task)
+        if self.backend == "stepped" and not self.tasks:
+            self.driver.stop()
+        if not task.cancelled() and task.exception() is not None:
+            error = task.exception()
+            print(f"\033[91m[Error] Unhandled error in {task.get_coro().__qualname__}: {error}\033[0m")
+            traceback.print_exception(type(error), error, error.__traceback__)
+
+    def exit(self, code=0):
+        """Quits the application with code, which exec() then returns."""
+        self.exit_code = code
+        self.app.exit(code)
+
+    def exec(self):
+        """Runs the application until it quits and returns its exit code."""
+        if self.backend == "qasync":
+            # qasync's supported pattern: run the loop until the application is about to quit
+            closing = self.loop.create_future()
+            self.app.aboutToQuit.connect(lambda: closing.done() or closing.set_result(None))
+            self.loop.run_until_complete(closing)
+            code = self.exit_code
+        else:
+            code = self.app.exec_()
+
+        pending = list(self.tasks)
+        for task in pending:
+            task.cancel()
+        if pending:
+            self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self.loop.close()
+        return code
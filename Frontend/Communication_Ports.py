@@ -7,13 +7,58 @@ Date: 14 October 2025
 
 import serial
 import serial.tools.list_ports
+import itertools
+import threading
 import time
+from collections import deque
 from typing import Optional, List, Tuple
 
+
+class Ticket:
+    """A command's place in a port's queue and, once answered, its response"""
+
+    __slots__ = ("number", "command", "wait_response", "timeout", "response", "latency_ms",
+                 "_done", "_lead")
+
+    def __init__(self, number: int, command: str, wait_response: bool = True,
+                 timeout: Optional[float] = None):
+        self.number = number
+        self.command = command
+        self.wait_response = wait_response
+        self.timeout = timeout
+        self.response: Optional[str] = None
+        self.latency_ms = 0.0
+        self._done: Optional[threading.Event] = None  # only queued tickets wait on one
+        self._lead = False  # the ticket's thread is the dispatcher
+
+    def __repr__(self):
+        return f"Ticket(#{self.number} {self.command.split(':')[0]} -> {self.response!r})"
+
+
 class CommunicationPorts:
-    """Handles serial communication with STM dongle using UART protocol"""
+    """
+    Handles serial communication with STM dongle using UART protocol
+
+    send_command() and request() are thread-safe: any number of threads may
+    share one instance, e.g. a status poller and the user's actions. Each
+    command draws a ticket. A caller that finds the port idle becomes the
+    dispatcher: it runs its own ticket, then the tickets queued behind it in
+    FIFO order, writing each command and handing it the reply line that
+    follows, before waking its thread. After DISPATCH_BATCH tickets it passes
+    the role to the next waiting thread, so no caller is held up for long and
+    the port never sits idle while a woken thread is being scheduled.
+
+    The firmware keeps a single RX buffer and does not tag its replies, so one
+    command on the wire at a time, matched to the next reply line, is the only
+    correlation it supports. After a timeout, or a command sent without
+    waiting, the next ticket drops whatever arrived late before writing, so a
+    stray reply does not reach another caller.
+
+    send_data() and receive_data() stay raw single-threaded I/O.
+    """
     
-    def __init__(self, port: str, baudrate: int = 115200, timeout: float = 2.0):
+    def __init__(self, port: str, baudrate: int = 115200, timeout: float = 2.0,
+                 verbose: bool = True):
         """
         Initialize communication port parameters
         
@@ -21,11 +66,20 @@ class CommunicationPorts:
             port: COM port name (e.g., 'COM3', '/dev/ttyUSB0')
             baudrate: Communication speed in bits per second (default: 115200)
             timeout: Read timeout in seconds
+            verbose: Print every message sent and received (disable for stress runs)
         """
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
+        self.verbose = verbose
         self.connection: Optional[serial.Serial] = None
+
+        # Request dispatch (see class docstring)
+        self._queue_lock = threading.Lock()
+        self._queue: deque = deque()  # tickets waiting for the dispatcher
+        self._dispatching = False
+        self._numbers = itertools.count(1)
+        self._stale = False  # a reply may still be in flight for an earlier ticket
         
     def open_connection(self) -> bool:
         """
@@ -86,7 +140,8 @@ class CommunicationPorts:
                 
             self.connection.write(data.encode('utf-8'))
             self.connection.flush()  # Ensure data is sent immediately
-            print(f"→ Sent: {data.strip()}")
+            if self.verbose:
+                print(f"→ Sent: {data.strip()}")
             return True
             
         except serial.SerialException as e:
@@ -124,10 +179,12 @@ class CommunicationPorts:
                 self.connection.timeout = original_timeout
             
             if data:
-                print(f"← Received: {data}")
+                if self.verbose:
+                    print(f"← Received: {data}")
                 return data
             else:
-                print("⚠ No data received (timeout)")
+                if self.verbose:
+                    print("⚠ No data received (timeout)")
                 return None
                 
         except serial.SerialException as e:
@@ -140,22 +197,89 @@ class CommunicationPorts:
             print(f"Unexpected error while receiving: {e}")
             return None
     
-    def send_command(self, command: str, wait_response: bool = True) -> Optional[str]:
+    def send_command(self, command: str, wait_response: bool = True,
+                     timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Send a command and optionally wait for response (thread-safe)
+        
+        Args:
+            command: Command string to send
+            wait_response: Whether to wait for a response
+            timeout: Optional custom timeout for the response
+            
+        Returns:
+            str: Response data if wait_response=True, "" if sent without waiting,
+                 None if sending failed or no response arrived
         """
-        Send a command and optionally wait for response
+        return self.request(command, wait_response, timeout).response
+
+    def request(self, command: str, wait_response: bool = True,
+                timeout: Optional[float] = None) -> Ticket:
+        """
+        Queue a command behind those of other threads and run it in turn
         
         Args:
             command: Command string to send
             wait_response: Whether to wait for a response
+            timeout: Optional custom timeout for the response
             
         Returns:
-            str: Response data if wait_response=True, None otherwise
+            Ticket: The command's ticket, with its response and latency filled in
         """
-        if self.send_data(command):
-            if wait_response:
-                return self.receive_data()
-            return ""
-        return None
+        ticket = Ticket(next(self._numbers), command, wait_response, timeout)
+        with self._queue_lock:
+            if self._dispatching:
+                ticket._done = threading.Event()
+                self._queue.append(ticket)
+            else:
+                self._dispatching = True
+                ticket._lead = True
+        if not ticket._lead:
+            ticket._done.wait()
+            if not ticket._lead:
+                return ticket  # answered by the dispatcher
+        self._run_dispatcher(ticket)
+        return ticket
+
+    DISPATCH_BATCH = 32  # tickets one thread runs before handing the dispatcher role on
+
+    def _run_dispatcher(self, ticket: Ticket) -> None:
+        """Run ticket, then the queue in order, until it is empty or the batch is used up"""
+        current, served = ticket, 0
+        while True:
+            try:
+                self._dispatch(current)
+            finally:
+                if current is not ticket:
+                    current._done.set()
+            served += 1
+            with self._queue_lock:
+                if not self._queue:
+                    self._dispatching = False
+                    return
+                current = self._queue.popleft()
+                if served >= self.DISPATCH_BATCH:
+                    current._lead = True
+                    current._done.set()  # its own thread carries on dispatching
+                    return
+
+    def _dispatch(self, ticket: Ticket) -> None:
+        """Exchange one ticket's command and reply; only the dispatcher calls this"""
+        if self._stale and self.is_connected():
+            try:
+                self.connection.reset_input_buffer()  # late replies belong to earlier tickets
+            except Exception as e:
+                print(f"Error flushing late replies: {e}")
+        started = time.perf_counter()
+        if not self.send_data(ticket.command):
+            return
+        if ticket.wait_response:
+            ticket.response = self.receive_data(ticket.timeout)
+            self._stale = ticket.response is None
+        else:
+            ticket.response = ""
+            self._stale = True
+        ticket.latency_ms = (time.perf_counter() - started) * 1000
     
     def is_connected(self) -> bool:
         """
@@ -172,7 +296,8 @@ class CommunicationPorts:
             try:
                 self.connection.reset_input_buffer()
                 self.connection.reset_output_buffer()
-                print("Buffers flushed")
+                if self.verbose:
+                    print("Buffers flushed")
             except Exception as e:
                 print(f"Error flushing buffers: {e}")
     
@@ -0,0 +1,274 @@
+"""
+Dongle Emulator Module
+Software model of the STM Dongle firmware (main.c) behind a serial-port interface
+Authors: Dube Kagiso and Xolisile Buqwana
+Date: 19 October 2026
+"""
+
+import threading
+import time
+from typing import Optional
+
+from Communication_Ports import CommunicationPorts
+
+
+class DongleEmulator:
+    """
+    Serial-port stand-in that runs the firmware's command handling
+
+    Implements the subset of the pyserial Serial API used by the host code
+    (write/readline/read_until/read/in_waiting/flush/reset_*_buffer/close).
+
+    In the default synchronous mode every complete command is answered inside
+    write(), which isolates host-side cost for benchmarks. In realtime mode a
+    background thread plays the firmware main loop: bytes land in one shared
+    64-byte RX buffer as they arrive, the loop only picks up a command every
+    poll_interval, and CONNECT/DISCONNECT stall the loop for connect_hold
+    seconds. A command that arrives before the previous one was picked up
+    overwrites it, exactly as on the board.
+    """
+
+    RX_BUFFER_SIZE = 64
+    MAX_CODE_LENGTH = 19
+    TX_BUFFER_SIZE = 80
+
+    def __init__(self, port: str = "EMU", baudrate: int = 115200, timeout: Optional[float] = 2.0,
+                 realtime: bool = False, poll_interval: float = 0.01, connect_hold: float = 1.0):
+        """
+        Create an emulated dongle
+
+        Args:
+            port: Name reported as the port
+            baudrate: Reported baudrate (no line timing is simulated)
+            timeout: Read timeout in seconds, None to block
+            realtime: Model the firmware main loop and RX buffer overruns
+            poll_interval: Main loop period in seconds (HAL_Delay(10) on the board)
+            connect_hold: Seconds the loop stalls after CONNECT/DISCONNECT
+        """
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.bytesize = 8
+        self.parity = "N"
+        self.stopbits = 1
+        self.xonxoff = False
+        self.rtscts = False
+        self.dsrdtr = False
+        self.is_open = True
+
+        self.realtime = realtime
+        self.poll_interval = poll_interval
+        self.connect_hold = connect_hold
+
+        self.access_codes = ["", "", ""]
+        self.commands_processed = 0
+        self.commands_overwritten = 0
+
+        # Firmware RX state (HAL_UART_RxCpltCallback)
+        self._rx_buffer = bytearray(self.RX_BUFFER_SIZE)
+        self._rx_index = 0
+        self._cmd_ready = False
+
+        self._tx = bytearray()
+        self._lock = threading.Lock()
+        self._tx_ready = threading.Condition(self._lock)
+
+        self._loop = None
+        if realtime:
+            self._loop = threading.Thread(target=self._main_loop, name=f"emulator-{port}", daemon=True)
+            self._loop.start()
+
+    # Serial API
+
+    def write(self, data: bytes) -> int:
+        """Feed bytes to the emulated UART receive interrupt"""
+        if not self.is_open:
+            raise IOError("Emulated port is closed")
+        with self._lock:
+            for value in data:
+                self._receive_byte(value)
+                if not self.realtime and self._cmd_ready:
+                    self._cmd_ready = False
+                    self._process(self._take_command())
+        return len(data)
+
+    def readline(self) -> bytes:
+        """Read up to and including the next newline, or whatever arrived before the timeout"""
+        return self.read_until(b"\n")
+
+    def read_until(self, expected: bytes = b"\n", size: Optional[int] = None) -> bytes:
+        """Read until expected is seen, size bytes were read, or the timeout expires"""
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        with self._tx_ready:
+            while True:
+                end = self._tx.find(expected)
+                if end >= 0:
+                    end += len(expected)
+                    if size is not None:
+                        end = min(end, size)
+                    return self._take_tx(end)
+                if size is not None and len(self._tx) >= size:
+                    return self._take_tx(size)
+                if not self._wait(deadline):
+                    return self._take_tx(len(self._tx) if size is None else min(size, len(self._tx)))
+
+    def read(self, size: int = 1) -> bytes:
+        """Read size bytes, or fewer if the timeout expires"""
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        with self._tx_ready:
+            while len(self._tx) < size:
+                if not self._wait(deadline):
+                    break
+            return self._take_tx(min(size, len(self._tx)))
+
+    @property
+    def in_waiting(self) -> int:
+        with self._lock:
+            return len(self._tx)
+
+    def flush(self) -> None:
+        """Writes are delivered immediately, nothing to drain"""
+
+    def reset_input_buffer(self) -> None:
+        with self._lock:
+            self._tx.clear()
+
+    def reset_output_buffer(self) -> None:
+        """No output is queued on the host side"""
+
+    def close(self) -> None:
+        with self._tx_ready:
+            self.is_open = False
+            self._tx_ready.notify_all()
+
+    # Firmware model
+
+    def _receive_byte(self, value: int) -> None:
+        """One UART RX interrupt, mirrors HAL_UART_RxCpltCallback"""
+        if value in (0x0D, 0x0A):
+            if self._rx_index > 0:
+                self._rx_buffer[self._rx_index] = 0
+                if self._cmd_ready:
+                    self.commands_overwritten += 1
+                self._cmd_ready = True
+                self._rx_index = 0
+        elif self._rx_index < self.RX_BUFFER_SIZE - 1:
+            self._rx_buffer[self._rx_index] = value
+            self._rx_index += 1
+        else:
+            # Buffer full
+            self._rx_index = 0
+
+    def _take_command(self) -> str:
+        """Copy the pending command out of the shared RX buffer (strncpy up to NUL)"""
+        end = self._rx_buffer.find(0)
+        raw = self._rx_buffer[:end if end >= 0 else self.RX_BUFFER_SIZE - 1]
+        return raw.decode("latin-1")
+
+    def _main_loop(self) -> None:
+        """Firmware while(1) loop: poll cmd_ready every poll_interval"""
+        while self.is_open:
+            time.sleep(self.poll_interval)
+            with self._lock:
+                if not self._cmd_ready:
+                    continue
+                command = self._take_command()
+                self._cmd_ready = False
+                hold = self._process(command)
+            if hold:
+                time.sleep(hold)
+
+    def _process(self, cmd: str) -> float:
+        """
+        Mirror of process_command() in main.c
+
+        Returns:
+            float: Seconds the firmware blocks after replying
+        """
+        self.commands_processed += 1
+        hold = 0.0
+
+        if cmd == "CONNECT":
+            self._send("OK")
+            hold = self.connect_hold
+        elif cmd.startswith("GET_CODE_"):
+            i = ord(cmd[9]) - ord("1") if len(cmd) > 9 else -1
+            if 0 <= i < 3:
+                # char msg[50]
+                self._send(f"CODE_{i + 1}:{self.access_codes[i]}"[:49])
+            else:
+                self._send("ERR:INVALID_SLOT")
+        elif cmd.startswith("SET_CODE_"):
+            i = ord(cmd[9]) - ord("1") if len(cmd) > 9 else -1
+            colon = cmd.find(":")
+            if 0 <= i < 3 and colon >= 0:
+                self.access_codes[i] = cmd[colon + 1:colon + 1 + self.MAX_CODE_LENGTH]
+                self._send("SAVED")
+            else:
+                self._send("ERR:INVALID_FORMAT")
+        elif cmd == "DISCONNECT":
+            self._send("BYE")
+            hold = self.connect_hold
+        elif cmd == "STATUS":
+            stored = sum(1 for code in self.access_codes if code)
+            self._send(f"STATUS:OK,CODES:{stored}/3")
+        else:
+            self._send("ERR:UNKNOWN_CMD")
+
+        return hold if self.realtime else 0.0
+
+    def _send(self, msg: str) -> None:
+        """send_message(): drop anything that does not fit the 80-byte TX buffer"""
+        line = (msg + "\n").encode("latin-1")
+        if len(line) < self.TX_BUFFER_SIZE:
+            self._tx.extend(line)
+            self._tx_ready.notify_all()
+
+    def _take_tx(self, count: int) -> bytes:
+        data = bytes(self._tx[:count])
+        del self._tx[:count]
+        return data
+
+    def _wait(self, deadline: Optional[float]) -> bool:
+        """Wait for TX data; False once the deadline passed or the port closed"""
+        if not self.is_open:
+            return False
+        if deadline is None:
+            self._tx_ready.wait()
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        self._tx_ready.wait(remaining)
+        return True
+
+
+class EmulatedCommunicationPorts(CommunicationPorts):
+    """CommunicationPorts wired to a DongleEmulator instead of a real COM port"""
+
+    def __init__(self, port: str = "EMU", baudrate: int = 115200, timeout: float = 2.0,
+                 verbose: bool = True, **emulator_options):
+        """
+        Args:
+            port: Name reported for the emulated port
+            baudrate: Reported baudrate
+            timeout: Read timeout in seconds
+            verbose: Print every message sent and received
+            **emulator_options: Passed through to DongleEmulator (realtime, poll_interval, ...)
+        """
+        super().__init__(port, baudrate=baudrate, timeout=timeout, verbose=verbose)
+        self.emulator_options = emulator_options
+
+    def open_connection(self) -> bool:
+        """Attach a fresh emulated dongle"""
+        self.connection = DongleEmulator(self.port, self.baudrate, self.timeout, **self.emulator_options)
+        if self.verbose:
+            print(f"✓ Emulated connection opened on {self.port}")
+        return True
+
+
+# Example usage
+if __name__ == "__main__":
+    with EmulatedCommunicationPorts(realtime=True) as comm:
+        for command in ["CONNECT", "SET_CODE_1:secret", "GET_CODE_1", "STATUS", "DISCONNECT"]:
+            comm.send_command(command)
@@ -0,0 +1,266 @@
+"""
+Shadow Renderer Module
+Draws the drop shadows of the Frontend GUI and measures what repaints cost
+Authors: Dube Kagiso and Xolisile Buqwana
+Date: 19 October 2026
+"""
+
+import os
+import math
+import time
+from typing import NamedTuple, Tuple
+from PyQt5 import sip
+from PyQt5.QtWidgets import (QApplication, QGraphicsDropShadowEffect, QGraphicsScene,
+                             QGraphicsPixmapItem, QGraphicsBlurEffect)
+from PyQt5.QtCore import Qt, QObject, QEvent, QRectF
+from PyQt5.QtGui import QColor, QImage, QPainter, QPixmap
+
+
+class ShadowSpec(NamedTuple):
+    """Parameters of one drop shadow, matching QGraphicsDropShadowEffect's"""
+    blur: float                      # blur radius in pixels
+    color: Tuple[int, int, int, int] # RGBA
+    offset: Tuple[int, int]          # (dx, dy)
+    radius: int                      # border-radius of the widget casting it
+
+
+class NinePatchShadow:
+    """Pre-blurred shadow tiles, rendered once per (spec, device pixel ratio).
+
+    The tile is the blurred shadow of a rounded rectangle just big enough to hold
+    both corners plus a one pixel wide middle. Drawing a shadow of any size copies
+    the four corners as they are and stretches the edges and centre, so a repaint
+    costs nine pixmap blits instead of an offscreen render and a blur pass.
+    """
+
+    _tiles = {}  # (spec, dpr) -> QPixmap
+
+    @staticmethod
+    def padding(spec):
+        """How far the blur reaches past the shadow's rectangle"""
+        return int(math.ceil(spec.blur))
+
+    @classmethod
+    def tile(cls, spec, dpr=1.0):
+        key = (spec, dpr)
+        pixmap = cls._tiles.get(key)
+        if pixmap is None:
+            pixmap = cls._tiles[key] = cls._render(spec, dpr)
+        return pixmap
+
+    @classmethod
+    def _render(cls, spec, dpr):
+        pad = cls.padding(spec)
+        core = 2 * (spec.radius + pad) + 1
+        size = int(math.ceil((core + 2 * pad) * dpr))
+
+        # Opaque shape, blurred with the same filter the drop shadow effect uses
+        shape = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+        shape.fill(Qt.transparent)
+        painter = QPainter(shape)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.scale(dpr, dpr)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(Qt.black)
+        painter.drawRoundedRect(QRectF(pad, pad, core, core), spec.radius, spec.radius)
+        painter.end()
+
+        scene = QGraphicsScene()
+        item = QGraphicsPixmapItem(QPixmap.fromImage(shape))
+        blur = QGraphicsBlurEffect()
+        blur.setBlurRadius(spec.blur * dpr)
+        blur.setBlurHints(QGraphicsBlurEffect.PerformanceHint)
+        item.setGraphicsEffect(blur)
+        scene.addItem(item)
+
+        tile = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+        tile.fill(Qt.transparent)
+        painter = QPainter(tile)
+        bounds = QRectF(0, 0, size, size)
+        scene.render(painter, bounds, bounds)
+        # Keep the blurred alpha, take the colour (and its alpha) from the spec
+        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+        painter.fillRect(tile.rect(), QColor(*spec.color))
+        painter.end()
+
+        pixmap = QPixmap.fromImage(tile)
+        pixmap.setDevicePixelRatio(dpr)
+        return pixmap
+
+    @classmethod
+    def draw(cls, painter, rect, spec, dpr=1.0):
+        """Paints the shadow of a widget occupying rect (in the painter's coordinates)"""
+        pixmap = cls.tile(spec, dpr)
+        pad = cls.padding(spec)
+        target = QRectF(rect).translated(*spec.offset).adjusted(-pad, -pad, pad, pad)
+        tile_size = pixmap.width() / dpr
+        corner = spec.radius + 2 * pad
+        cx = min(corner, target.width() / 2)
+        cy = min(corner, target.height() / 2)
+
+        src_x = (0, cx, tile_size - cx, tile_size)
+        src_y = (0, cy, tile_size - cy, tile_size)
+        dst_x = (target.left(), target.left() + cx, target.right() - cx, target.right())
+        dst_y = (target.top(), target.top() + cy, target.bottom() - cy, target.bottom())
+        for i in range(3):
+            for j in range(3):
+                dst = QRectF(dst_x[i], dst_y[j], dst_x[i + 1] - dst_x[i], dst_y[j + 1] - dst_y[j])
+                if dst.isEmpty():
+                    continue
+                src = QRectF(src_x[i] * dpr, src_y[j] * dpr,
+                             (src_x[i + 1] - src_x[i]) * dpr, (src_y[j + 1] - src_y[j]) * dpr)
+                painter.drawPixmap(dst, pixmap, src)
+
+    @classmethod
+    def shadow_rect(cls, rect, spec):
+        pad = cls.padding(spec)
+        return rect.translated(*spec.offset).adjusted(-pad, -pad, pad, pad)
+
+
+class _ShadowHost(QObject):
+    """Paints the nine-patch shadows of a widget's children, after the widget's
+    own background and before the children themselves."""
+
+    def __init__(self, widget):
+        super().__init__(widget)
+        self.widget = widget
+        self.casters = []
+        widget.installEventFilter(self)
+
+    @classmethod
+    def of(cls, widget):
+        host = widget.findChild(cls, "", Qt.FindDirectChildrenOnly)
+        return host or cls(widget)
+
+    def eventFilter(self, obj, event):
+        if obj is not self.widget or event.type() != QEvent.Paint or not self.casters:
+            return False
+        obj.event(event)  # background first, so the shadows land on top of it
+
+        area = event.rect()
+        dpr = obj.devicePixelRatioF()
+        painter = QPainter(obj)
+        painter.setClipRegion(event.region())
+        for caster in list(self.casters):
+            if sip.isdeleted(caster):
+                self.casters.remove(caster)
+                continue
+            geometry = caster.widget.geometry()
+            if caster.widget.isVisible() and NinePatchShadow.shadow_rect(geometry, caster.spec).intersects(area):
+                NinePatchShadow.draw(painter, geometry, caster.spec, dpr)
+        painter.end()
+        return True
+
+
+class _ShadowCaster(QObject):
+    """Registers a widget's shadow with its parent's host and repaints the parent
+    when the widget moves, resizes, shows or hides."""
+
+    REPAINT_EVENTS = (QEvent.Move, QEvent.Resize, QEvent.Show, QEvent.Hide)
+
+    def __init__(self, widget, spec):
+        super().__init__(widget)
+        self.widget = widget
+        self.spec = spec
+        self.host = None
+        widget.installEventFilter(self)
+        self._attach()
+
+    def _attach(self):
+        if self.host is not None and not sip.isdeleted(self.host) and self in self.host.casters:
+            self.host.casters.remove(self)
+        parent = self.widget.parentWidget()
+        self.host = _ShadowHost.of(parent) if parent else None
+        if self.host:
+            self.host.casters.append(self)
+            parent.update()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.ParentChange:
+            self._attach()
+        elif event.type() in self.REPAINT_EVENTS and self.widget.parentWidget():
+            self.widget.parentWidget().update()
+        return False
+
+
+class ShadowRenderer:
+    """Entry point for giving a widget a drop shadow.
+
+    Modes:
+        ninepatch  cached, pre-blurred tiles painted by the parent (default)
+        effect     one QGraphicsDropShadowEffect per widget, rendered offscreen
+                   and blurred on every repaint
+
+    Both modes take the same ShadowSpec and look the same. The mode comes from
+    the DONGLE_SHADOWS environment variable or set_mode(), and applies to widgets
+    given a shadow afterwards.
+    """
+
+    MODES = ("ninepatch", "effect")
+    mode = os.environ.get("DONGLE_SHADOWS", "ninepatch")
+
+    @classmethod
+    def set_mode(cls, mode):
+        if mode not in cls.MODES:
+            raise ValueError(f"Unknown shadow mode: {mode} (expected one of {', '.join(cls.MODES)})")
+        cls.mode = mode
+
+    @classmethod
+    def apply(cls, widget, spec):
+        if cls.mode == "effect":
+            shadow = QGraphicsDropShadowEffect()
+            shadow.setBlurRadius(spec.blur)
+            shadow.setColor(QColor(*spec.color))
+            shadow.setOffset(*spec.offset)
+            widget.setGraphicsEffect(shadow)
+        else:
+            _ShadowCaster(widget, spec)
+
+
+class PaintMeter(QObject):
+    """Times every repaint pass of a window and counts the paint events in it.
+
+    A pass starts when Qt delivers the window's UpdateRequest and covers every
+    widget repainted in it, including effect rendering and blurs. report() prints
+    the averages, so the two shadow modes can be compared on the same machine.
+    """
+
+    def __init__(self, window, label=None):
+        super().__init__(window)
+        self.window = window
+        self.label = label or ShadowRenderer.mode
+        self.frames = 0
+        self.paint_events = 0
+        self.total_ms = 0.0
+        self.worst_ms = 0.0
+        QApplication.instance().installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            self.paint_events += 1
+        elif event.type() == QEvent.UpdateRequest and obj is self.window:
+            started = time.perf_counter()
+            obj.event(event)
+            elapsed = (time.perf_counter() - started) * 1000
+            self.frames += 1
+            self.total_ms += elapsed
+            self.worst_ms = max(self.worst_ms, elapsed)
+            return True
+        return False
+
+    def summary(self):
+        return {
+            "mode": self.label,
+            "frames": self.frames,
+            "paint_events": self.paint_events,
+            "avg_frame_ms": self.total_ms / self.frames if self.frames else 0.0,
+            "avg_paint_ms": self.total_ms / self.paint_events if self.paint_events else 0.0,
+            "worst_frame_ms": self.worst_ms,
+        }
+
+    def report(self):
+        s = self.summary()
+        print(f"[DEBUG] Paint stats ({s['mode']}): {s['frames']} frames, {s['paint_events']} paint events, "
+              f"avg {s['avg_frame_ms']:.2f} ms/frame, {s['avg_paint_ms']:.3f} ms/paint event, "
+              f"worst {s['worst_frame_ms']:.2f} ms")
+        return s
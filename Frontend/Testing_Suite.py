@@ -8,15 +8,17 @@ Date: 14 October 2025
 import sys
 import time
 from Communication_Ports import CommunicationPorts
-from Protocol_Handler import ProtocolHandler, PROTOCOL_DOCUMENTATION
+from Dongle_Emulator import EmulatedCommunicationPorts
+from Protocol_Handler import ProtocolHandler, Message, MessageType, PROTOCOL_DOCUMENTATION
 
 
 class DongleTester:
     """Test suite for dongle communication"""
     
-    def __init__(self, port_name=None):
-        """Initialize tester with optional port name"""
+    def __init__(self, port_name=None, emulate=False):
+        """Initialize tester with optional port name, or against the firmware emulator"""
         self.port_name = port_name
+        self.emulate = emulate
         self.comm = None
         self.protocol = ProtocolHandler()
         
@@ -56,7 +58,9 @@ class DongleTester:
         print("TEST 1: Connection")
         print("="*60)
         
-        if not self.port_name:
+        if self.emulate:
+            self.port_name = self.port_name or "EMU"
+        elif not self.port_name:
             self.port_name = self.select_port()
             
         if not self.port_name:
@@ -66,7 +70,10 @@ class DongleTester:
         print(f"\n→ Testing connection to {self.port_name}...")
         
         try:
-            self.comm = CommunicationPorts(self.port_name, baudrate=9600, timeout=2.0)
+            if self.emulate:
+                self.comm = EmulatedCommunicationPorts(self.port_name, timeout=2.0, realtime=True)
+            else:
+                self.comm = CommunicationPorts(self.port_name, baudrate=9600, timeout=2.0)
             
             if not self.comm.open_connection():
                 print("❌ Failed to open port")
@@ -217,6 +224,241 @@ class DongleTester:
             print(f"❌ Error: {e}")
             return False
     
+    def _timed_exchange(self, command, timeout):
+        """
+        Send one command and wait for its reply
+
+        Args:
+            command: Protocol command to send
+            timeout: Seconds to wait for the reply line
+
+        Returns:
+            Tuple[Optional[str], float]: (response or None on timeout, latency in seconds)
+        """
+        started = time.perf_counter()
+        if not self.comm.send_data(command):
+            return None, time.perf_counter() - started
+        response = self.comm.receive_data(timeout_override=timeout)
+        return response, time.perf_counter() - started
+
+    @staticmethod
+    def _read_back_value(response):
+        """Extract the stored value from a firmware CODE_N:value reply"""
+        if not response:
+            return None
+        msg = Message.from_string(response)
+        if not msg.msg_type.startswith(MessageType.CODE.value):
+            return None
+        return msg.payload or ""
+
+    @staticmethod
+    def _percentile(values, fraction):
+        """Nearest-rank percentile of an unsorted list"""
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+        return ordered[index]
+
+    def test_stress(self, duration=30.0, target_rate=None, slots=(1, 2, 3),
+                    op_timeout=1.0, windows=10):
+        """
+        Hammer SET_CODE_N/GET_CODE_N for a fixed duration
+
+        Each SET is verified by reading the slot back with GET_CODE_N. Runs in
+        a tight loop when target_rate is None, otherwise paces exchanges so
+        that target_rate commands are sent per second.
+
+        Args:
+            duration: Test length in seconds
+            target_rate: Commands per second, or None for as fast as possible
+            slots: Code slots to cycle through
+            op_timeout: Per-command reply deadline in seconds
+            windows: Number of time slices used to report latency drift
+
+        Returns:
+            dict: Throughput, error/timeout rates and latency drift, or None if not connected
+        """
+        print("\n" + "="*60)
+        rate_text = f"{target_rate:g} cmd/s" if target_rate else "tight loop"
+        print(f"STRESS TEST: {duration:g}s, {rate_text}")
+        print("="*60)
+
+        if not self.comm or not self.comm.is_connected():
+            print("❌ Not connected")
+            return None
+
+        verbose = self.comm.verbose
+        self.comm.verbose = False
+        samples = []  # (seconds since start, latency) of answered commands
+        counts = {"ok": 0, "error": 0, "timeout": 0}
+        verified = mismatches = 0
+        sent = 0
+
+        start = time.perf_counter()
+        end = start + duration
+        try:
+            while time.perf_counter() < end:
+                slot = slots[(sent // 2) % len(slots)]
+                # Firmware truncates stored codes to 19 characters
+                value = f"S{(sent // 2) % 1000000:06d}"
+
+                for step in ("set", "get"):
+                    if target_rate:
+                        delay = start + sent / target_rate - time.perf_counter()
+                        if delay > 0:
+                            time.sleep(delay)
+
+                    if step == "set":
+                        command = self.protocol.create_set_code_message(slot, value)
+                    else:
+                        command = self.protocol.create_get_code_message(slot)
+                    response, latency = self._timed_exchange(command, op_timeout)
+                    sent += 1
+
+                    if response is None:
+                        counts["timeout"] += 1
+                        # A late reply would be mistaken for the next one
+                        self.comm.flush_buffers()
+                        break
+
+                    samples.append((time.perf_counter() - start, latency))
+                    if step == "set":
+                        if self.protocol.is_saved_response(response):
+                            counts["ok"] += 1
+                        else:
+                            counts["error"] += 1
+                            break
+                    else:
+                        if self._read_back_value(response) == value:
+                            counts["ok"] += 1
+                            verified += 1
+                        else:
+                            counts["error"] += 1
+                            mismatches += 1
+        except KeyboardInterrupt:
+            print("\n⚠ Stress test interrupted")
+        finally:
+            self.comm.verbose = verbose
+
+        elapsed = time.perf_counter() - start
+        total = sum(counts.values())
+
+        # Latency drift: median/p95 per equal time slice of the run
+        drift_rows = []
+        slice_len = elapsed / windows
+        for w in range(windows):
+            lo, hi = w * slice_len, (w + 1) * slice_len
+            lat = [l for t, l in samples if lo <= t < hi]
+            if lat:
+                drift_rows.append((lo, hi, len(lat),
+                                   self._percentile(lat, 0.5) * 1000,
+                                   self._percentile(lat, 0.95) * 1000))
+
+        report = {
+            "duration_s": elapsed,
+            "target_rate": target_rate,
+            "commands": total,
+            "ops_per_sec": total / elapsed if elapsed else 0.0,
+            "verified_sets_per_sec": verified / elapsed if elapsed else 0.0,
+            "ok": counts["ok"],
+            "errors": counts["error"],
+            "timeouts": counts["timeout"],
+            "readback_mismatches": mismatches,
+            "error_rate": counts["error"] / total if total else 0.0,
+            "timeout_rate": counts["timeout"] / total if total else 0.0,
+            "latency_p50_ms": self._percentile([l for _, l in samples], 0.5) * 1000,
+            "latency_p95_ms": self._percentile([l for _, l in samples], 0.95) * 1000,
+            "latency_drift_ms": (drift_rows[-1][3] - drift_rows[0][3]) if len(drift_rows) > 1 else 0.0,
+        }
+
+        print(f"\nCommands sent:        {total} in {elapsed:.1f}s")
+        print(f"Sustained throughput: {report['ops_per_sec']:.1f} cmd/s "
+              f"({report['verified_sets_per_sec']:.1f} verified SETs/s)")
+        print(f"Errors:               {counts['error']} ({report['error_rate']:.2%}), "
+              f"{mismatches} read-back mismatches")
+        print(f"Timeouts:             {counts['timeout']} ({report['timeout_rate']:.2%})")
+        print(f"Latency p50 / p95:    {report['latency_p50_ms']:.2f} / {report['latency_p95_ms']:.2f} ms")
+        print("\nLatency drift:")
+        print(f"{'window':>15} {'cmds':>7} {'p50 ms':>9} {'p95 ms':>9}")
+        for lo, hi, n, p50, p95 in drift_rows:
+            print(f"{lo:6.1f}-{hi:6.1f}s {n:>7} {p50:>9.2f} {p95:>9.2f}")
+        print(f"Drift (last - first p50): {report['latency_drift_ms']:+.2f} ms")
+        return report
+
+    def test_rx_ceiling(self, gaps_ms=(20, 15, 10, 7, 5, 3, 2, 1, 0), burst=20, quiet=0.3):
+        """
+        Find the command rate at which the firmware starts dropping commands
+
+        The firmware receives one byte per interrupt into a single 64-byte
+        buffer that the main loop only drains every 10 ms, so a command that
+        completes before the previous one was picked up overwrites it. Each
+        step sends a burst of GET_CODE_1 commands without waiting for replies,
+        spaced gap_ms apart, then counts the replies.
+
+        Args:
+            gaps_ms: Inter-command gaps to try, from slow to fast
+            burst: Commands per burst
+            quiet: Seconds of silence that end reply collection
+
+        Returns:
+            dict: Per-gap results and the highest loss-free command rate, or None if not connected
+        """
+        print("\n" + "="*60)
+        print("RX CEILING: pipelined bursts of GET_CODE_1")
+        print("="*60)
+
+        if not self.comm or not self.comm.is_connected():
+            print("❌ Not connected")
+            return None
+
+        verbose = self.comm.verbose
+        self.comm.verbose = False
+        command = self.protocol.create_get_code_message(1)
+        rows = []
+        ceiling = None
+        try:
+            for gap in gaps_ms:
+                self.comm.flush_buffers()
+                started = time.perf_counter()
+                for n in range(burst):
+                    self.comm.send_data(command)
+                    if gap and n < burst - 1:
+                        time.sleep(gap / 1000.0)
+                send_time = time.perf_counter() - started
+
+                replies = errors = 0
+                while True:
+                    response = self.comm.receive_data(timeout_override=quiet)
+                    if response is None:
+                        break
+                    if self._read_back_value(response) is not None:
+                        replies += 1
+                    else:
+                        errors += 1
+
+                offered = (burst - 1) / send_time if send_time > 0 else float("inf")
+                dropped = burst - replies
+                rows.append({"gap_ms": gap, "offered_rate": offered, "replies": replies,
+                             "dropped": dropped, "errors": errors})
+                if dropped == 0 and errors == 0:
+                    ceiling = offered if ceiling is None else max(ceiling, offered)
+        except KeyboardInterrupt:
+            print("\n⚠ Ceiling search interrupted")
+        finally:
+            self.comm.verbose = verbose
+            self.comm.flush_buffers()
+
+        print(f"{'gap ms':>7} {'offered cmd/s':>14} {'replies':>8} {'dropped':>8} {'errors':>7}")
+        for row in rows:
+            print(f"{row['gap_ms']:>7} {row['offered_rate']:>14.1f} {row['replies']:>8} "
+                  f"{row['dropped']:>8} {row['errors']:>7}")
+        if ceiling is None:
+            print("\n❌ Commands were dropped at every tested rate")
+        else:
+            print(f"\n✓ Highest loss-free pipelined rate: {ceiling:.1f} cmd/s")
+        return {"burst": burst, "rows": rows, "ceiling_rate": ceiling}
+
     def run_full_test_suite(self):
         """Run complete test suite"""
         print("\n" + "="*60)
@@ -286,7 +528,8 @@ def main():
     print("\nThis tool tests the communication between PC and STM dongle.")
     print("Make sure your STM board is connected and running the firmware.")
     
-    tester = DongleTester()
+    # --emulate runs every test against the firmware model in Dongle_Emulator
+    tester = DongleTester(emulate="--emulate" in sys.argv)
     
     while True:
         print("\n" + "="*60)
@@ -297,6 +540,8 @@ def main():
         print("3. Manual Test (Interactive)")
         print("4. View Protocol Documentation")
         print("5. List Available Ports")
+        print("6. Stress Test (Throughput)")
+        print("7. Find RX Ceiling (Pipelined Bursts)")
         print("q. Quit")
         
         choice = input("\nSelect option: ").strip().lower()
@@ -313,6 +558,12 @@ def main():
             print(PROTOCOL_DOCUMENTATION)
         elif choice == '5':
             CommunicationPorts.list_available_ports()
+        elif choice == '6':
+            stress_test(tester)
+        elif choice == '7':
+            if not tester.comm or not tester.comm.is_connected():
+                tester.test_connection()
+            tester.test_rx_ceiling()
         elif choice == 'q':
             print("\nGoodbye!")
             break
@@ -320,6 +571,23 @@ def main():
             print("Invalid option. Try again.")
 
 
+def stress_test(tester):
+    """Prompt for stress parameters and run the throughput test"""
+    if not tester.comm or not tester.comm.is_connected():
+        if not tester.test_connection():
+            return
+
+    try:
+        duration = float(input("Duration in seconds [30]: ").strip() or 30)
+        rate = input("Target rate in cmd/s (blank for tight loop): ").strip()
+        target_rate = float(rate) if rate else None
+    except ValueError:
+        print("Please enter a number.")
+        return
+
+    tester.test_stress(duration=duration, target_rate=target_rate)
+
+
 def manual_test(tester):
     """Interactive manual testing"""
     if not tester.comm or not tester.comm.is_connected():
@@ -5,26 +5,39 @@ Authors: Dube Kagiso and Xolisile Buqwana
 Date: 14 October 2025
 """
 
+import os
 import sys
+import asyncio
+import argparse
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QLabel, QComboBox, 
-                             QInputDialog, QMessageBox, QFrame, QGraphicsDropShadowEffect)
+                             QInputDialog, QFrame, QDialog)
 from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QFont, QColor
+from PyQt5.QtGui import QFont
 
 # Import our custom modules
-from Communication_Ports import CommunicationPorts
-from Protocol_Handler import ProtocolHandler
+from Shadow_Renderer import ShadowRenderer, ShadowSpec, PaintMeter
+from Async_Runtime import AsyncRuntime
+
+# Shared with the desktop app in the repository root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ClipboardService import ClipboardService
+from DongleClient import DongleClient, DongleError
+from AsyncDongleClient import AsyncDongleClient
+from ToastNotifier import ToastNotifier
 
 
 class ModernButton(QPushButton):
     """Custom styled button with hover effects"""
+    SHADOW = ShadowSpec(blur=15, color=(0, 0, 0, 60), offset=(0, 4), radius=12)
+
     def __init__(self, text, color="#4F46E5"):
         super().__init__(text)
         self.color = color
         self.setMinimumHeight(50)
         self.setCursor(Qt.PointingHandCursor)
         self.update_style()
+        ShadowRenderer.apply(self, self.SHADOW)
         
     def update_style(self, hover=False):
         """Update button style"""
@@ -50,62 +63,72 @@ class ModernButton(QPushButton):
             }}
         """
         self.setStyleSheet(style)
-        
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setColor(QColor(0, 0, 0, 60))
-        shadow.setOffset(0, 4)
-        self.setGraphicsEffect(shadow)
 
 
 class StatusLabel(QLabel):
     """Animated status label with color coding"""
+    COLORS = {
+        "success": "#10B981",
+        "error": "#EF4444",
+        "warning": "#F59E0B",
+        "info": "#3B82F6"
+    }
+
+    STYLESHEET = """
+        QLabel {
+            background: #F3F4F6;
+            border-radius: 8px;
+            padding: 10px;
+            font-size: 13px;
+            color: #6B7280;
+        }
+    """
+
+    # One stylesheet per variant, built once. Swapping the label's sheet is
+    # about 3.5x cheaper than switching a [status] property selector and
+    # re-polishing (gui.status_update in BenchmarkSuite.py).
+    STATUS_STYLESHEETS = {name: f"""
+        QLabel {{
+            background: {color}22;
+            border-left: 4px solid {color};
+            border-radius: 8px;
+            padding: 10px 15px;
+            font-size: 13px;
+            color: {color};
+            font-weight: 600;
+        }}
+    """ for name, color in COLORS.items()}
+
     def __init__(self, text=""):
         super().__init__(text)
         self.setAlignment(Qt.AlignCenter)
         self.setMinimumHeight(40)
-        self.setStyleSheet("""
-            QLabel {
-                background: #F3F4F6;
-                border-radius: 8px;
-                padding: 10px;
-                font-size: 13px;
-                color: #6B7280;
-            }
-        """)
+        self.setStyleSheet(self.STYLESHEET)
+        self.status_type = None
         
     def set_status(self, text, status_type="info"):
         """Set status with color coding"""
-        colors = {
-            "success": "#10B981",
-            "error": "#EF4444",
-            "warning": "#F59E0B",
-            "info": "#3B82F6"
-        }
         self.setText(text)
-        color = colors.get(status_type, colors["info"])
-        self.setStyleSheet(f"""
-            QLabel {{
-                background: {color}22;
-                border-left: 4px solid {color};
-                border-radius: 8px;
-                padding: 10px 15px;
-                font-size: 13px;
-                color: {color};
-                font-weight: 600;
-            }}
-        """)
+        status_type = status_type if status_type in self.COLORS else "info"
+        if status_type != self.status_type:
+            self.status_type = status_type
+            self.setStyleSheet(self.STATUS_STYLESHEETS[status_type])
 
 
 class DongleLockGUI(QMainWindow):
     """Main GUI Application for Dongle Lock System"""
-    
+    CARD_SHADOW = ShadowSpec(blur=20, color=(0, 0, 0, 30), offset=(0, 4), radius=16)
+
     def __init__(self):
         super().__init__()
-        self.comm_port = None  # CommunicationPorts instance
+        self.session = None  # AsyncDongleClient of the connected dongle
         self.is_connected = False
-        self.protocol = ProtocolHandler()  # Protocol handler
+        self.runtime = AsyncRuntime.instance()
+        self.tasks = set()  # running handlers, cancelled when the window closes
+        self._closing = None  # shut_down() task once the window was asked to close
+        self._shut_down = False
+        self.clipboard = ClipboardService.instance()  # clears copied codes after a timeout
+        self.toasts = ToastNotifier.for_widget(self)  # non-blocking notifications
         self.init_ui()
         
     def init_ui(self):
@@ -156,11 +179,7 @@ class DongleLockGUI(QMainWindow):
             }
         """)
         
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        shadow.setOffset(0, 4)
-        header_frame.setGraphicsEffect(shadow)
+        ShadowRenderer.apply(header_frame, self.CARD_SHADOW)
         
         layout = QVBoxLayout(header_frame)
         
@@ -191,11 +210,7 @@ class DongleLockGUI(QMainWindow):
             }
         """)
         
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        shadow.setOffset(0, 4)
-        frame.setGraphicsEffect(shadow)
+        ShadowRenderer.apply(frame, self.CARD_SHADOW)
         
         layout = QVBoxLayout(frame)
         layout.setSpacing(15)
@@ -238,7 +253,8 @@ class DongleLockGUI(QMainWindow):
                 margin-right: 10px;
             }
         """)
-        self.refresh_ports()
+        self.port_combo.addItem("Scanning for COM ports...", None)
+        self.spawn(self.refresh_ports())
         port_layout.addWidget(self.port_combo, 1)
         
         refresh_btn = QPushButton("↻")
@@ -258,14 +274,14 @@ class DongleLockGUI(QMainWindow):
                 background: #4338CA;
             }
         """)
-        refresh_btn.clicked.connect(self.refresh_ports)
+        refresh_btn.clicked.connect(lambda: self.spawn(self.refresh_ports()))
         port_layout.addWidget(refresh_btn)
         
         layout.addLayout(port_layout)
         
         # Connect button
         self.connect_btn = ModernButton("Connect to Dongle", "#4F46E5")
-        self.connect_btn.clicked.connect(self.connect_dongle)
+        self.connect_btn.clicked.connect(lambda: self.spawn(self.connect_dongle()))
         layout.addWidget(self.connect_btn)
         
         return frame
@@ -281,11 +297,7 @@ class DongleLockGUI(QMainWindow):
             }
         """)
         
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        shadow.setOffset(0, 4)
-        frame.setGraphicsEffect(shadow)
+        ShadowRenderer.apply(frame, self.CARD_SHADOW)
         
         layout = QVBoxLayout(frame)
         layout.setSpacing(15)
@@ -302,7 +314,7 @@ class DongleLockGUI(QMainWindow):
         
         for i in range(3):
             btn = ModernButton(f"Get Code {i+1}", colors[i])
-            btn.clicked.connect(lambda checked, idx=i+1: self.get_code(idx))
+            btn.clicked.connect(lambda checked, idx=i+1: self.spawn(self.get_code(idx)))
             layout.addWidget(btn)
             self.code_buttons.append(btn)
         
@@ -313,11 +325,34 @@ class DongleLockGUI(QMainWindow):
         layout.addWidget(self.disconnect_btn)
         
         return frame
-        
-    def refresh_ports(self):
-        """Refresh available COM ports"""
+
+    def spawn(self, coro):
+        """Runs a handler coroutine; it is cancelled if the window closes first"""
+        task = self.runtime.spawn(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    async def ask_text(self, title, label):
+        """QInputDialog.getText without a nested event loop: the dialog is
+        window-modal and awaited, so replies and timers keep running meanwhile"""
+        dialog = QInputDialog(self)
+        dialog.setWindowTitle(title)
+        dialog.setLabelText(label)
+        dialog.setTextValue("")
+        finished = asyncio.get_running_loop().create_future()
+        dialog.finished.connect(lambda result: finished.done() or finished.set_result(result))
+        dialog.open()
+        try:
+            result = await finished
+            return dialog.textValue(), result == QDialog.Accepted
+        finally:
+            dialog.deleteLater()
+        
+    async def refresh_ports(self):
+        """Refresh available COM ports, off the GUI thread"""
+        ports = await AsyncDongleClient.list_ports()
         self.port_combo.clear()
-        ports = CommunicationPorts.list_available_ports()
         
         for port_device, port_desc in ports:
             self.port_combo.addItem(f"{port_device} - {port_desc}", port_device)
@@ -332,188 +367,171 @@ class DongleLockGUI(QMainWindow):
             if hasattr(self, 'status_label'):
                 self.status_label.set_status(f"Found {len(ports)} COM port(s)", "info")
             
-    def connect_dongle(self):
+    async def connect_dongle(self):
         """Connect to the STM dongle"""
         port = self.port_combo.currentData()
         
         if port is None:
             self.status_label.set_status("⚠ No COM port selected", "error")
-            QMessageBox.warning(self, "No Port", "Please select a valid COM port")
+            self.toasts.notify("No Port", "Please select a valid COM port", "error")
             return
         
         self.status_label.set_status("Connecting...", "info")
-        QApplication.processEvents()  # Update UI
+        self.connect_btn.setEnabled(False)
+        session = AsyncDongleClient()
         
         try:
-            # Create communication port instance
-            self.comm_port = CommunicationPorts(port=port, baudrate=115200, timeout=2.0)
-            
-            # Open connection
-            if not self.comm_port.open_connection():
-                raise Exception("Failed to open serial port")
-            
-            # Send CONNECT message using protocol handler
-            connect_msg = self.protocol.create_connect_message()
-            response = self.comm_port.send_command(connect_msg, wait_response=True)
-            
-            # Check response
-            if response and self.protocol.is_ok_response(response):
-                self.is_connected = True
-                self.status_label.set_status("Connected successfully!", "success")
-                
-                # Hide connection section, show controls
-                self.connection_frame.hide()
-                self.controls_frame.show()
-                
-            else:
-                raise Exception(f"Invalid response from dongle: {response}")
-                
-        except Exception as e:
+            # Open the port and perform the CONNECT handshake
+            await session.open(port)
+            self.session = session
+            self.is_connected = True
+            self.status_label.set_status("Connected successfully!", "success")
+
+            # Hide connection section, show controls
+            self.connection_frame.hide()
+            self.controls_frame.show()
+
+        except DongleError as e:
             self.status_label.set_status(f"✗ Connection failed: {str(e)}", "error")
-            QMessageBox.critical(self, "Connection Error", 
-                               f"Device Not Found\n\n{str(e)}\n\nPlease check:\n"
-                               f"- STM board is powered on\n"
-                               f"- Correct COM port is selected\n"
-                               f"- STM firmware is running")
-            if self.comm_port:
-                self.comm_port.close_connection()
-                self.comm_port = None
+            self.toasts.notify("Connection Error",
+                               f"Device Not Found: {str(e)}\n"
+                               f"Check that the STM board is powered on, the correct COM port "
+                               f"is selected and the STM firmware is running.", "error")
+            await session.aclose()
+        except asyncio.CancelledError:
+            await asyncio.shield(session.aclose())
+            raise
+        finally:
+            self.connect_btn.setEnabled(True)
                 
-    def get_code(self, code_num):
+    async def get_code(self, code_num):
         """Get code from dongle"""
-        if not self.is_connected or not self.comm_port:
+        if not self.is_connected or not self.session:
             self.status_label.set_status("✗ Not connected to dongle", "error")
             return
         
         # Validate code number
-        if not self.protocol.validate_code_number(code_num):
+        if code_num not in DongleClient.SLOTS:
             self.status_label.set_status(f"Invalid code number: {code_num}", "error")
             return
         
+        button = self.code_buttons[code_num - 1]
+        button.setEnabled(False)  # one request per slot at a time
         try:
-            # Send GET_CODE_N message
-            get_msg = self.protocol.create_get_code_message(code_num)
-            response = self.comm_port.send_command(get_msg, wait_response=True)
-            
-            if not response:
-                self.status_label.set_status("No response from dongle", "error")
-                return
+            # Send GET_CODE_N (or serve it from this session's cache)
+            read = await self.session.get_code(code_num)
             
             # Check if code slot is empty
-            if self.protocol.is_empty_response(response):
+            if read.empty:
                 # Code doesn't exist, prompt for new code
-                code, ok = QInputDialog.getText(
-                    self, 
+                code, ok = await self.ask_text(
                     f"Set Code {code_num}", 
-                    f"Code slot {code_num} is empty.\nEnter new access code:",
-                    text=""
+                    f"Code slot {code_num} is empty.\nEnter new access code:"
                 )
                 
                 if ok and code:
                     # Validate code
-                    is_valid, error_msg = self.protocol.validate_code_value(code)
-                    if not is_valid:
+                    error_msg = DongleClient.validate_code(code)
+                    if error_msg:
                         self.status_label.set_status(f"Invalid code: {error_msg}", "error")
-                        QMessageBox.warning(self, "Invalid Code", error_msg)
+                        self.toasts.notify("Invalid Code", error_msg, "error")
                         return
                     
                     # Send SET_CODE_N message
-                    set_msg = self.protocol.create_set_code_message(code_num, code)
-                    confirm = self.comm_port.send_command(set_msg, wait_response=True)
+                    result = await self.session.set_code(code_num, code)
                     
-                    if confirm and self.protocol.is_saved_response(confirm):
+                    if result.saved:
                         # Copy to clipboard
-                        clipboard = QApplication.clipboard()
-                        clipboard.setText(code)
+                        self.clipboard.copy_secret(code)
                         self.status_label.set_status(
                             f"✓ Code {code_num} saved and copied to clipboard", 
                             "success"
                         )
                     else:
                         self.status_label.set_status(
-                            f"Failed to save code: {confirm}", 
+                            f"Failed to save code: {result.reply}", 
                             "error"
                         )
                 else:
                     self.status_label.set_status("Operation cancelled", "info")
                     
-            elif self.protocol.is_code_response(response):
-                # Code exists, extract and copy to clipboard
-                code = self.protocol.extract_code_from_response(response)
-                
-                if code:
-                    clipboard = QApplication.clipboard()
-                    clipboard.setText(code)
-                    self.status_label.set_status(
-                        f"Code {code_num} copied to clipboard", 
-                        "success"
-                    )
-                    
-                    # Show preview of code (first 3 chars + ***)
-                    preview = code[:3] + "***" if len(code) > 3 else code
-                    QMessageBox.information(
-                        self, 
-                        f"Code {code_num} Retrieved", 
-                        f"Code preview: {preview}\n\n"
-                        f"Full code has been copied to clipboard."
-                    )
-                else:
-                    self.status_label.set_status("Failed to extract code", "error")
-                    
             else:
+                # Code exists, copy to clipboard
+                code = read.value
+                self.clipboard.copy_secret(code)
                 self.status_label.set_status(
-                    f"Unexpected response: {response}", 
-                    "error"
+                    f"Code {code_num} copied to clipboard", 
+                    "success"
+                )
+                
+                # Show preview of code (first 3 chars + ***)
+                preview = code[:3] + "***" if len(code) > 3 else code
+                self.toasts.notify(
+                    f"Code {code_num} Retrieved", 
+                    f"Code preview: {preview}\n"
+                    f"Full code has been copied to clipboard.",
+                    "success"
                 )
                 
         except Exception as e:
             self.status_label.set_status(f"Error: {str(e)}", "error")
-            QMessageBox.critical(self, "Communication Error", str(e))
+            self.toasts.notify("Communication Error", str(e), "error")
+        finally:
+            button.setEnabled(True)
             
     def disconnect_dongle(self):
         """Disconnect from dongle and exit"""
-        if self.is_connected and self.comm_port:
+        # Closing the window sends DISCONNECT and clears the clipboard
+        self.close()
+
+    async def shut_down(self):
+        """Cancels running handlers, then disconnects and closes the window"""
+        current = asyncio.current_task()
+        pending = [task for task in self.tasks if task is not current]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        if self.is_connected and self.session:
             try:
-                # Send DISCONNECT message
-                disconnect_msg = self.protocol.create_disconnect_message()
-                self.comm_port.send_command(disconnect_msg, wait_response=False)
-                
-                # Close connection
-                self.comm_port.close_connection()
-                self.is_connected = False
-                
+                # Send DISCONNECT behind anything still on the wire, then close the port
+                await self.session.aclose()
             except Exception as e:
                 print(f"Error during disconnect: {e}")
-        
+            self.is_connected = False
+            self.session = None
+
         # Clear clipboard for security
-        clipboard = QApplication.clipboard()
-        clipboard.clear()
-        
-        # Close application
+        self.clipboard.clear()
+        self._shut_down = True
         self.close()
         
     def closeEvent(self, event):
         """Handle window close event"""
-        if self.is_connected:
-            # Send disconnect message
-            try:
-                if self.comm_port:
-                    disconnect_msg = self.protocol.create_disconnect_message()
-                    self.comm_port.send_command(disconnect_msg, wait_response=False)
-                    self.comm_port.close_connection()
-            except:
-                pass
-            
-            # Clear clipboard
-            clipboard = QApplication.clipboard()
-            clipboard.clear()
-        
-        event.accept()
+        if self._shut_down or not (self.tasks or self.is_connected):
+            event.accept()
+            return
+        # Finish asynchronously so the GUI never waits on the serial port
+        event.ignore()
+        self.hide()
+        if self._closing is None:
+            self._closing = self.spawn(self.shut_down())
 
 
 def main():
     """Main application entry point"""
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="Dongle Lock Manager")
+    parser.add_argument("--shadows", choices=ShadowRenderer.MODES, default=ShadowRenderer.mode,
+                        help="ninepatch: cached shadow tiles (default), effect: Qt blur effects")
+    parser.add_argument("--paint-stats", action="store_true",
+                        help="print average repaint cost when the window closes")
+    parser.add_argument("--loop", choices=AsyncRuntime.BACKENDS, default=None,
+                        help="asyncio integration: qasync if installed (default), or stepped")
+    args, qt_args = parser.parse_known_args()
+    ShadowRenderer.set_mode(args.shadows)
+
+    app = QApplication(sys.argv[:1] + qt_args)
+    runtime = AsyncRuntime.instance(app, args.loop)
     
     # Set application-wide font
     app.setFont(QFont("Segoe UI", 10))
@@ -524,9 +542,12 @@ def main():
     
     # Create and show main window
     window = DongleLockGUI()
+    if args.paint_stats:
+        meter = PaintMeter(window)
+        app.aboutToQuit.connect(meter.report)
     window.show()
     
-    sys.exit(app.exec_())
+    sys.exit(runtime.exec())
 
 
 if __name__ == "__main__":
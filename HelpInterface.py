@@ -1,5 +1,5 @@
 # Authors: Buqwana Xolisile and Kagiso Dube 
-# Version: 06/10/2025
+# Version: 19/10/2026
 # Project: EEE3095S Project
 # Class Description: Initializes the Help Interface class.
 
@@ -8,6 +8,7 @@ from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
 
 from BaseInterface import BaseInterface
+from ThemeUI import ThemeUI
 
 
 class HelpInterface(BaseInterface):
@@ -52,14 +53,7 @@ class HelpInterface(BaseInterface):
             </div>
         """)
  
-        text.setStyleSheet("""
-            QTextEdit {
-                border: none;
-                background-color: #ffffff;
-                color: #000000;
-                border-radius: 6px;
-            }
-        """)
+        ThemeUI.set_role(text, "document")
 
         text.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.layout.addWidget(text)
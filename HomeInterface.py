@@ -1,12 +1,11 @@
 # Authors: Buqwana Xolisile and Kagiso Dube
-# Version: 21/10/2025
+# Version: 19/10/2026
 # Project: EEE3095S Project
 # Class Description: Initializes the Home Interface.
 
 from PyQt5.QtWidgets import QLabel, QPushButton, QHBoxLayout, QSizePolicy
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPixmap
 from BaseInterface import BaseInterface
+from Assets import Assets
 
 class HomeInterface(BaseInterface):
     """Home screen interface."""
@@ -17,7 +16,7 @@ class HomeInterface(BaseInterface):
         # Title row with icon and label
         self.title_layout = QHBoxLayout()
         self.title_icon = QLabel()
-        self.title_icon.setPixmap(QPixmap(r"C:\Users\xolisile\OneDrive - University of Cape Town\EEE3095S\EEE3095S PROJECT\assets\Home_Logo.png").scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        self.title_icon.setPixmap(Assets.pixmap("home_logo", 32))
         self.title_label = QLabel("Welcome — please choose an action")
 
         self.title_layout.addStretch()
@@ -30,16 +29,20 @@ class HomeInterface(BaseInterface):
         # Buttons row
         btns = QHBoxLayout()
         connect_btn = QPushButton("Connect Dongle")
+        workspace_btn = QPushButton("Workspace")
         help_btn = QPushButton("Help")
         exit_btn = QPushButton("Exit")
 
         connect_btn.clicked.connect(self.handler.show_second_interface)
+        workspace_btn.clicked.connect(self.handler.show_workspace)
         help_btn.clicked.connect(self.handler.show_help)
         exit_btn.clicked.connect(self.handler.confirm_and_exit)
 
         btns.addStretch()
         btns.addWidget(connect_btn)
         btns.addSpacing(12)
+        btns.addWidget(workspace_btn)
+        btns.addSpacing(12)
         btns.addWidget(help_btn)
         btns.addSpacing(12)
         btns.addWidget(exit_btn)
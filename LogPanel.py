@@ -0,0 +1,61 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: Bounded log view that batches appends into at most one repaint per frame.
+
+import html
+from collections import deque
+
+from PyQt5.QtWidgets import QPlainTextEdit
+from PyQt5.QtCore import QTimer
+
+
+class LogPanel(QPlainTextEdit):
+    """Read-only log view for long sessions.
+       The document keeps at most max_lines blocks, dropping the oldest, and pending
+       lines wait in a ring buffer until the frame timer flushes them in one go.
+    """
+
+    MAX_LINES = 2000
+    FRAME_MS = 16
+
+    COLORS = {
+        "error": "#E63946",
+        "success": "#007F00",
+        "action": "#0077B6",
+        "info": "#003344",
+    }
+
+    def __init__(self, max_lines=MAX_LINES, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.setMaximumBlockCount(max_lines)
+
+        # Lines beyond max_lines would be trimmed right away, so never hold more
+        self._pending = deque(maxlen=max_lines)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FRAME_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def append_event(self, timestamp, message, category="info"):
+        """Queues one log line; the panel repaints on the next frame tick."""
+        color = self.COLORS.get(category, self.COLORS["info"])
+        self._pending.append(
+            f'<span style="color:gray;">[{timestamp}]</span> '
+            f'<span style="color:{color};">{html.escape(message)}</span>'
+        )
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self):
+        """Writes every pending line and scrolls to the newest one."""
+        if not self._pending:
+            return
+        scrollbar = self.verticalScrollBar()
+        self.setUpdatesEnabled(False)
+        while self._pending:
+            self.appendHtml(self._pending.popleft())
+        self.setUpdatesEnabled(True)
+        scrollbar.setValue(scrollbar.maximum())
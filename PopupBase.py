@@ -1,5 +1,5 @@
 # Authors: Buqwana Xolisile and Kagiso Dube
-# Version: 06/10/2025
+# Version: 19/10/2026
 # Project: EEE3095S Project
 # Class Description: Parent class for all pop ups.
 
@@ -18,7 +18,7 @@ class PopupBase(QDialog):
         self.setModal(True)
         self.setFixedSize(320, 140)
         self._build_ui(message)
-        self.setStyleSheet(ThemeUI.get_stylesheet())
+        ThemeUI.apply()
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
 
 
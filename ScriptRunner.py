@@ -0,0 +1,269 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: Runs dongle command scripts, one per port in parallel, with per-step timing.
+
+import os
+import sys
+import time
+import shlex
+import argparse
+import threading
+from typing import List, NamedTuple
+
+from DongleClient import DongleClient, DongleError
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+FRONTEND_DIR = os.path.join(ROOT_DIR, "Frontend")
+
+
+class ScriptStep(NamedTuple):
+    source: str
+    line_no: int
+    action: str
+    args: tuple
+
+    def describe(self):
+        shown = self.args[:1] if self.action == "set" else self.args  # values stay off the console
+        return " ".join((self.action,) + tuple(shlex.quote(arg) for arg in shown))
+
+
+class StepResult(NamedTuple):
+    step: ScriptStep
+    ok: bool
+    detail: str
+    elapsed_ms: float
+    cached: bool = False
+
+
+class ScriptRunner:
+    """Runs one command script against one dongle.
+
+       Script syntax, one step per line, '#' starts a comment:
+           connect [PORT]        handshake (PORT overrides the one given on the command line)
+           set N VALUE           store VALUE in slot N (quote values with spaces)
+           clear N               empty slot N
+           get N                 read slot N
+           expect N VALUE        read slot N from the device and fail unless it holds
+                                 VALUE ("" for empty)
+           status [K/3]          read STATUS, optionally expecting K stored codes
+           sleep SECONDS         pause, e.g. to watch the LCD
+           disconnect            send DISCONNECT and close the port
+
+       Steps run back to back: each command is written as soon as the previous reply
+       lands, with no settle sleeps. The firmware has a single RX buffer, so commands
+       to one dongle cannot overlap on the wire; files for different ports run in
+       parallel instead. A get after a confirmed write resolves to that write through
+       the session cache without a round trip, unless the runner was built with
+       use_cache=False. An expect is a read-back check, so it always sends GET_CODE.
+
+       Usage:
+           python ScriptRunner.py scripts/smoke.txt@COM7
+           python ScriptRunner.py a.txt@COM7 b.txt@COM8          both dongles at once
+           python ScriptRunner.py scripts/smoke.txt --emulate    firmware emulator, no hardware
+           python ScriptRunner.py scripts/smoke.txt@COM7 --no-cache
+    """
+
+    # action -> (min args, max args)
+    ACTIONS = {
+        "connect": (0, 1),
+        "set": (2, 2),
+        "clear": (1, 1),
+        "get": (1, 1),
+        "expect": (2, 2),
+        "status": (0, 1),
+        "sleep": (1, 1),
+        "disconnect": (0, 0),
+    }
+
+    def __init__(self, steps, port=None, port_factory=None, use_cache=True, stop_on_failure=False,
+                 report=None):
+        self.steps = steps
+        self.port = port
+        self.use_cache = use_cache
+        self.stop_on_failure = stop_on_failure
+        self.report = report or (lambda result: None)
+        self.client = DongleClient(port=port, port_factory=port_factory)
+        self.results: List[StepResult] = []
+        self.elapsed_ms = 0.0
+
+    # PARSING
+    @classmethod
+    def parse(cls, path) -> List[ScriptStep]:
+        """Reads a script file. Raises ValueError naming file:line on a bad step."""
+        name = os.path.basename(path)
+        steps = []
+        with open(path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                try:
+                    tokens = shlex.split(line, comments=True)
+                except ValueError as e:
+                    raise ValueError(f"{name}:{line_no}: {e}")
+                if not tokens:
+                    continue
+                action, args = tokens[0].lower(), tuple(tokens[1:])
+                if action not in cls.ACTIONS:
+                    raise ValueError(f"{name}:{line_no}: unknown step '{action}'")
+                low, high = cls.ACTIONS[action]
+                if not low <= len(args) <= high:
+                    raise ValueError(f"{name}:{line_no}: '{action}' takes {low}-{high} arguments, got {len(args)}")
+                if action in ("set", "clear", "get", "expect") and args[0] not in ("1", "2", "3"):
+                    raise ValueError(f"{name}:{line_no}: slot must be 1, 2 or 3, got '{args[0]}'")
+                if action == "sleep":
+                    try:
+                        float(args[0])
+                    except ValueError:
+                        raise ValueError(f"{name}:{line_no}: sleep takes seconds, got '{args[0]}'")
+                steps.append(ScriptStep(name, line_no, action, args))
+        return steps
+
+    # EXECUTION
+    def run(self) -> bool:
+        """Runs every step and returns True if all of them passed."""
+        started = time.perf_counter()
+        try:
+            for step in self.steps:
+                result = self._run_step(step)
+                self.results.append(result)
+                self.report(result)
+                if not result.ok and (step.action == "connect" or self.stop_on_failure):
+                    break
+        finally:
+            try:
+                self.client.close()
+            except (DongleError, OSError):
+                self.client.drop()
+            self.elapsed_ms = (time.perf_counter() - started) * 1000
+        return self.passed
+
+    @property
+    def passed(self):
+        return all(result.ok for result in self.results) and len(self.results) == len(self.steps)
+
+    def _run_step(self, step):
+        started = time.perf_counter()
+        try:
+            ok, detail, cached = getattr(self, f"_do_{step.action}")(*step.args)
+        except (DongleError, OSError, ValueError) as e:
+            ok, detail, cached = False, str(e), False
+        return StepResult(step, ok, detail, (time.perf_counter() - started) * 1000, cached)
+
+    def _do_connect(self, port=None):
+        result = self.client.open(port or self.port)
+        route = "remembered port" if result.fast_path else "handshake"
+        return True, f"{result.port} ({route})", False
+
+    def _do_set(self, slot, value):
+        result = self.client.set_code(int(slot), value)
+        return result.saved, result.reply, False
+
+    def _do_clear(self, slot):
+        result = self.client.clear_code(int(slot))
+        return result.saved, result.reply, False
+
+    def _do_get(self, slot):
+        read = self.client.get_code(int(slot), use_cache=self.use_cache)
+        return True, "empty" if read.empty else f"{len(read.value)} chars", read.cached
+
+    def _do_expect(self, slot, expected):
+        read = self.client.get_code(int(slot), use_cache=False)  # checks the device, never the cache
+        if read.value == expected:
+            return True, "match", read.cached
+        shown = "empty" if read.empty else f"'{read.value}'"
+        return False, f"expected '{expected}', got {shown}", read.cached
+
+    def _do_status(self, expected=None):
+        status = self.client.status()
+        actual = f"{status.occupied}/{status.capacity}"
+        if expected is not None and expected != actual:
+            return False, f"expected {expected} codes, got {actual}", False
+        return True, f"{actual} codes", False
+
+    def _do_sleep(self, seconds):
+        time.sleep(float(seconds))
+        return True, "", False
+
+    def _do_disconnect(self):
+        reply = self.client.close()
+        return True, reply.line if reply else "not connected", False
+
+
+def emulated_ports(realtime):
+    """port_factory that opens a firmware emulator per port name. Slots live as long
+       as the process, like the board's RAM, so a reconnect sees earlier writes.
+    """
+    if FRONTEND_DIR not in sys.path:
+        sys.path.append(FRONTEND_DIR)
+    from Dongle_Emulator import DongleEmulator
+    boards = {}  # port -> access_codes shared by every emulator opened on it
+
+    def open_port(port, baud, timeout):
+        emulator = DongleEmulator(port, baud, timeout, realtime=realtime)
+        emulator.access_codes = boards.setdefault(port, emulator.access_codes)
+        return emulator
+    return open_port
+
+
+def main():
+    parser = argparse.ArgumentParser(description="STM32 Dongle Lock script runner")
+    parser.add_argument("scripts", nargs="+", metavar="FILE[@PORT]",
+                        help="script file, optionally bound to a port; files run in parallel")
+    parser.add_argument("--emulate", action="store_true", help="run against the firmware emulator")
+    parser.add_argument("--realtime", action="store_true",
+                        help="with --emulate, model the firmware main loop and its 1 s CONNECT stall")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="send every get to the device instead of resolving it from earlier writes "
+                             "(expect always does)")
+    parser.add_argument("--stop-on-failure", action="store_true", help="stop a script at its first failed step")
+    args = parser.parse_args()
+
+    port_factory = emulated_ports(args.realtime) if args.emulate else None
+    print_lock = threading.Lock()
+
+    def report(result):
+        status = "\033[92mok\033[0m  " if result.ok else "\033[91mFAIL\033[0m"
+        origin = f"{result.step.source}:{result.step.line_no}"
+        source = " (cache)" if result.cached else ""
+        with print_lock:
+            print(f"[{origin:<18}] {result.step.describe():<28} {status} {result.elapsed_ms:>9.2f} ms  "
+                  f"{result.detail}{source}")
+
+    runners = []
+    for index, spec in enumerate(args.scripts, 1):
+        path, _, port = spec.partition("@")
+        try:
+            steps = ScriptRunner.parse(path)
+        except (OSError, ValueError) as e:
+            print(f"\033[91m[Error] {e}\033[0m")
+            sys.exit(2)
+        if args.emulate and not port:
+            port = f"EMU{index}"
+        runners.append(ScriptRunner(steps, port or None, port_factory, use_cache=not args.no_cache,
+                                    stop_on_failure=args.stop_on_failure, report=report))
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=runner.run, name=f"script-{i}") for i, runner in enumerate(runners)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    total_ms = (time.perf_counter() - started) * 1000
+
+    print()
+    for runner, spec in zip(runners, args.scripts):
+        passed = sum(result.ok for result in runner.results)
+        cached = sum(result.cached for result in runner.results)
+        port = runner.client.port or runner.port or "--"
+        print(f"{spec}: {passed}/{len(runner.steps)} steps passed on {port} in {runner.elapsed_ms:.1f} ms "
+              f"({cached} served from cache)")
+        for command, stats in sorted(runner.client.metrics.snapshot().items()):
+            print(f"    {command:<12} x{stats.count:<4} avg {stats.avg_ms:8.2f} ms  max {stats.max_ms:8.2f} ms"
+                  f"  timeouts {stats.timeouts}  errors {stats.errors}")
+    failed = [spec for runner, spec in zip(runners, args.scripts) if not runner.passed]
+    print(f"\n{len(runners) - len(failed)}/{len(runners)} scripts passed in {total_ms:.1f} ms.")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
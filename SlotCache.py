@@ -0,0 +1,95 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: Write-through cache of the dongle's code slots, versioned by device session.
+
+import os
+import time
+
+
+class SlotCache:
+    """Caches slot values read from or confirmed by the STM for the current session.
+
+       Entries are tagged with the session ID they were read in and expire after ttl
+       seconds, so a reconnect (new session) or a stale entry always goes back to the
+       wire. An empty string means the slot is known to be empty on the device.
+       Whether a slot holds a code is tracked apart from its value and does not
+       expire: only the device (a confirmed read or write) or forget() changes it.
+       Values are held in bytearrays that are overwritten with zeros on eviction;
+       strings already handed out by get() are Python's and cannot be wiped.
+    """
+
+    def __init__(self, ttl=300.0):
+        self.ttl = ttl
+        self.session_id = None
+        self._entries = {}  # code_id -> (bytearray value, session_id, stored_at)
+        self._occupied = {}  # code_id -> True (holds a code) or False (empty), this session
+
+    # SESSION
+    def new_session(self):
+        """Drops every entry and starts a fresh session. Returns the new session ID."""
+        self.clear()
+        self._occupied.clear()
+        self.session_id = os.urandom(16).hex()  # uuid4-grade randomness without importing uuid
+        return self.session_id
+
+    def end_session(self):
+        self.clear()
+        self._occupied.clear()
+        self.session_id = None
+
+    # ACCESS
+    def get(self, code_id):
+        """Returns the cached value, "" for a known-empty slot, or None on a miss."""
+        entry = self._entries.get(code_id)
+        if entry is None:
+            return None
+        value, session_id, stored_at = entry
+        if session_id != self.session_id or time.monotonic() - stored_at > self.ttl:
+            self.evict(code_id)
+            return None
+        return value.decode()
+
+    def put(self, code_id, value):
+        """Stores a value confirmed by the device. Ignored outside a session."""
+        if self.session_id is None:
+            return
+        self.evict(code_id)
+        self._entries[code_id] = (bytearray(value.encode()), self.session_id, time.monotonic())
+        self._occupied[code_id] = bool(value)
+
+    def evict(self, code_id):
+        """Removes an entry's value, overwriting it in memory first. Occupancy is kept."""
+        entry = self._entries.pop(code_id, None)
+        if entry is not None:
+            value = entry[0]
+            value[:] = bytes(len(value))
+
+    def forget(self, code_id):
+        """Evicts a slot whose device state is unknown, e.g. after a failed write."""
+        self.evict(code_id)
+        self._occupied.pop(code_id, None)
+
+    def clear(self):
+        for code_id in list(self._entries):
+            self.evict(code_id)
+
+    # OCCUPANCY
+    def occupied(self, code_id):
+        """True if the slot holds a code, False if it is empty, None if not known."""
+        if self.session_id is None:
+            return None
+        return self._occupied.get(code_id)
+
+    # CONTAINER PROTOCOL (slots holding a code)
+    def stored_ids(self):
+        return [code_id for code_id in sorted(self._occupied) if self.occupied(code_id)]
+
+    def __contains__(self, code_id):
+        return bool(self.occupied(code_id))
+
+    def __len__(self):
+        return len(self.stored_ids())
+
+    def __bool__(self):
+        return len(self) > 0
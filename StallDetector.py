@@ -0,0 +1,248 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: Opt-in event-loop stall detector with per-slot timing and stack samples.
+
+import os
+import sys
+import time
+import inspect
+import functools
+import importlib
+import threading
+from collections import Counter, deque
+from PyQt5.QtCore import QTimer
+
+from EventLogWriter import APP_DIR
+
+DEFAULT_REPORT_PATH = os.path.join(APP_DIR, "stall_report.txt")
+
+
+class SlotStats:
+    __slots__ = ("calls", "total_ms", "max_ms", "slow_calls")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.slow_calls = 0  # calls that took longer than the stall threshold
+
+
+class StallDetector:
+    """Finds what freezes the GUI. Off unless DONGLE_STALL_DETECT is set (to 1 for
+       the default report path, or to a file path).
+
+       - A heartbeat timer on the GUI thread measures event-loop latency: how late
+         each beat fires compared to its interval.
+       - Methods of the watched classes are wrapped to record their wall time on the
+         GUI thread; this covers button slots, worker callbacks (_dispatch), the COM
+         panel update and log_event.
+       - A watchdog thread notices when the heartbeat stops and samples the GUI
+         thread's stack while the stall lasts, attributing it to the slot running.
+       - Every REPORT_INTERVAL seconds, and on exit, a ranked report is written.
+
+       The steady-state cost is two perf_counter() calls per wrapped call, a timer
+       event every HEARTBEAT_MS and a sleeping thread; stacks are only walked
+       during stalls. Enabling it imports the watched modules up front.
+    """
+
+    HEARTBEAT_MS = 50
+    STALL_MS = 200          # heartbeat later than this is a stall
+    SAMPLE_INTERVAL = 0.05  # watchdog period in seconds
+    STACK_DEPTH = 12
+    REPORT_INTERVAL = 60.0
+    TOP_SLOTS = 20
+    TOP_STACKS = 8
+    LATENCY_WINDOW = 1200   # beats kept for percentiles (one minute at 50 ms)
+
+    # module -> (class, methods); None wraps every plain method the class defines
+    WATCHED = {
+        "DongleSTMHandler": ("DongleSTMHandler", None),
+        "DongleSTMInterface": ("DongleSTMInterface", ("build", "start_session",
+                                                      "update_slot_marks", "update_com_info")),
+        "DongleInterfaceInit": ("DongleInterfaceInit", ("build_screen", "show_screen")),
+        "DongleSerialWorker": ("DongleSerialWorker", ("_dispatch",)),
+        "LogPanel": ("LogPanel", ("append_event", "flush")),
+        "ToastNotifier": ("ToastNotifier", ("notify",)),
+        "DongleWorkspace": ("DongleWorkspace", None),
+    }
+
+    @classmethod
+    def from_env(cls):
+        """Returns a detector if DONGLE_STALL_DETECT is set, otherwise None."""
+        setting = os.environ.get("DONGLE_STALL_DETECT", "")
+        if setting in ("", "0"):
+            return None
+        return cls(DEFAULT_REPORT_PATH if setting == "1" else setting)
+
+    def __init__(self, report_path=DEFAULT_REPORT_PATH):
+        self.report_path = report_path
+        self.slots = {}                 # "Class.method" -> SlotStats
+        self.stall_slots = Counter()    # slot running when a stall was caught -> stalls
+        self.stacks = Counter()         # stack tuple -> samples taken during stalls
+        self.latency = deque(maxlen=self.LATENCY_WINDOW)
+        self.beats = 0
+        self.stalls = 0
+        self.stall_ms = 0.0
+        self.max_latency_ms = 0.0
+        self._active = []               # wrapped slots currently running on the GUI thread
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._gui_thread = None
+        self._last_beat = 0.0
+        self._started = 0.0
+        self._dirty = False
+
+    # SETUP
+    def install(self, app):
+        """Wraps the watched methods and starts the heartbeat, watchdog and reports.
+           Call on the GUI thread before the windows are built, so that signal
+           connections pick up the wrapped methods.
+        """
+        self._gui_thread = threading.get_ident()
+        for module_name, (class_name, methods) in self.WATCHED.items():
+            owner = getattr(importlib.import_module(module_name), class_name)
+            names = methods or [name for name, value in vars(owner).items()
+                                if inspect.isfunction(value) and not name.startswith("__")]
+            for name in names:
+                self.wrap(owner, name)
+
+        self._started = self._last_beat = time.monotonic()
+        self.heartbeat = QTimer(app)
+        self.heartbeat.timeout.connect(self._beat)
+        self.heartbeat.start(self.HEARTBEAT_MS)
+        self.report_timer = QTimer(app)
+        self.report_timer.timeout.connect(self._periodic_report)
+        self.report_timer.start(int(self.REPORT_INTERVAL * 1000))
+        app.aboutToQuit.connect(self.stop)
+        threading.Thread(target=self._watch, name="stall-watchdog", daemon=True).start()
+        print(f"[DEBUG] Stall detector on, reporting to {self.report_path}")
+
+    def stop(self):
+        self._stop.set()
+        self.heartbeat.stop()
+        self.report_timer.stop()
+        self.write_report()
+
+    def wrap(self, owner, name):
+        """Replaces owner.name with a timed wrapper, once."""
+        func = vars(owner).get(name)
+        if not inspect.isfunction(func) or getattr(func, "_stall_timed", False):
+            return
+        label = f"{owner.__name__}.{name}"
+        stats = self.slots.setdefault(label, SlotStats())
+        code = func.__code__
+        # PyQt drops surplus signal arguments (clicked's `checked`) only when the
+        # TypeError comes from the slot itself, so the wrapper trims them instead.
+        max_args = None if code.co_flags & inspect.CO_VARARGS else code.co_argcount
+        detector = self
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            if max_args is not None and len(args) > max_args:
+                args = args[:max_args]
+            if threading.get_ident() != detector._gui_thread:
+                return func(*args, **kwargs)
+            detector._active.append(label)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = (time.perf_counter() - started) * 1000
+                detector._active.pop()
+                stats.calls += 1
+                stats.total_ms += elapsed
+                if elapsed > stats.max_ms:
+                    stats.max_ms = elapsed
+                if elapsed > detector.STALL_MS:
+                    stats.slow_calls += 1
+                detector._dirty = True
+
+        timed._stall_timed = True
+        setattr(owner, name, timed)
+
+    # GUI THREAD
+    def _beat(self):
+        now = time.monotonic()
+        late_ms = max(0.0, (now - self._last_beat) * 1000 - self.HEARTBEAT_MS)
+        self._last_beat = now
+        self.beats += 1
+        self.latency.append(late_ms)
+        if late_ms > self.max_latency_ms:
+            self.max_latency_ms = late_ms
+        if late_ms > self.STALL_MS:
+            self.stalls += 1
+            self.stall_ms += late_ms
+            self._dirty = True
+
+    def _periodic_report(self):
+        if self._dirty:
+            self.write_report()
+
+    # WATCHDOG THREAD
+    def _watch(self):
+        in_stall = False
+        while not self._stop.wait(self.SAMPLE_INTERVAL):
+            if (time.monotonic() - self._last_beat) * 1000 < self.HEARTBEAT_MS + self.STALL_MS:
+                in_stall = False
+                continue
+            frame = sys._current_frames().get(self._gui_thread)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None and len(stack) < self.STACK_DEPTH:
+                stack.append(f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno} "
+                              f"{frame.f_code.co_name}")
+                frame = frame.f_back
+            with self._lock:
+                self.stacks[tuple(reversed(stack))] += 1
+                if not in_stall:
+                    self.stall_slots[self._active[-1] if self._active else "(outside watched slots)"] += 1
+            in_stall = True
+
+    # REPORT
+    def render_report(self):
+        uptime = time.monotonic() - self._started
+        latency = sorted(self.latency)
+
+        def percentile(fraction):
+            return latency[min(len(latency) - 1, int(fraction * len(latency)))] if latency else 0.0
+
+        lines = [
+            f"Stall report {time.strftime('%Y-%m-%d %H:%M:%S')} (uptime {uptime:.0f} s)",
+            f"Event loop: {self.beats} beats every {self.HEARTBEAT_MS} ms, lateness p50 {percentile(0.5):.1f} ms, "
+            f"p99 {percentile(0.99):.1f} ms, max {self.max_latency_ms:.1f} ms",
+            f"Stalls over {self.STALL_MS} ms: {self.stalls} ({self.stall_ms / 1000:.2f} s frozen in total)",
+            "",
+            "Slowest slots (by worst call):",
+            f"  {'slot':<44} {'calls':>7} {'total ms':>10} {'avg ms':>8} {'max ms':>9} {'slow':>5} {'stalls':>6}",
+        ]
+        ranked = sorted(((label, s) for label, s in self.slots.items() if s.calls),
+                        key=lambda item: item[1].max_ms, reverse=True)
+        for label, s in ranked[:self.TOP_SLOTS]:
+            lines.append(f"  {label:<44} {s.calls:>7} {s.total_ms:>10.1f} {s.total_ms / s.calls:>8.2f} "
+                         f"{s.max_ms:>9.1f} {s.slow_calls:>5} {self.stall_slots.get(label, 0):>6}")
+
+        with self._lock:
+            stacks = self.stacks.most_common(self.TOP_STACKS)
+            outside = self.stall_slots.get("(outside watched slots)", 0)
+        if outside:
+            lines.append(f"  {'(outside watched slots)':<44} {'':>7} {'':>10} {'':>8} {'':>9} {'':>5} {outside:>6}")
+        lines += ["", "GUI thread stacks sampled during stalls (most frequent first):"]
+        if not stacks:
+            lines.append("  none")
+        for stack, samples in stacks:
+            lines.append(f"  {samples} sample(s), ~{samples * self.SAMPLE_INTERVAL * 1000:.0f} ms:")
+            lines += [f"      {entry}" for entry in stack]
+        return "\n".join(lines) + "\n"
+
+    def write_report(self):
+        self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.report_path) or ".", exist_ok=True)
+            tmp_path = self.report_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(self.render_report())
+            os.replace(tmp_path, self.report_path)
+        except OSError as e:
+            print(f"\033[91m[Error] Could not write stall report: {e}\033[0m")
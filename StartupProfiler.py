@@ -0,0 +1,186 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: Measures cold start (import breakdown and time to first frame) against a budget.
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class StartupProfiler:
+    """Launches the GUI in fresh interpreters and reports where cold start goes.
+
+       Each run starts `python -X importtime StartupProfiler.py --child`, which builds
+       the application through Dongle.create(), waits for the first paint and exits.
+       The parent collects:
+         - time to first frame, from process spawn to the first Paint event;
+         - the import tree from -X importtime, ranked by cumulative time;
+         - which deferred modules (serial stack, clipboard, non-home screens) were
+           already imported when the home screen painted, which should be none.
+
+       Usage:
+           python StartupProfiler.py                      5 runs, offscreen
+           python StartupProfiler.py --runs 10 --top 25   more runs, longer import list
+           python StartupProfiler.py --budget-ms 800      exit 1 if the median exceeds 800 ms
+           python StartupProfiler.py --onscreen           paint on the real display
+    """
+
+    # Modules that must only load on first use, never before the home screen is up
+    DEFERRED = (
+        "serial",
+        "serial.tools.list_ports",
+        "DongleSerialWorker",
+        "ClipboardService",
+        "DongleSTMInterface",
+        "ConnectedInterface",
+        "HelpInterface",
+        "DongleWorkspace",
+        "DongleWorkspaceTab",
+        "ExitPopup",
+        "DongleInputPopup",
+        "CodeSelectPopup",
+        "PopupBase",
+        "ToastNotifier",
+    )
+    CHILD_TIMEOUT = 30.0  # seconds a child may take to paint before the run is abandoned
+    MARKER = "[STARTUP]"
+
+    def __init__(self, runs=5, offscreen=True):
+        self.runs = runs
+        self.offscreen = offscreen
+        self.first_frames = []   # ms from spawn to first paint, one per run
+        self.imports = {}        # top-level module -> list of cumulative ms, one per run
+        self.loaded_early = set()
+
+    # MEASUREMENT
+    def run(self):
+        for i in range(self.runs):
+            first_frame, imports, loaded = self.run_once()
+            self.first_frames.append(first_frame)
+            for name, cumulative in imports.items():
+                self.imports.setdefault(name, []).append(cumulative)
+            self.loaded_early.update(loaded)
+            print(f"  run {i + 1}/{self.runs}: first frame {first_frame:8.1f} ms")
+        return statistics.median(self.first_frames)
+
+    def run_once(self):
+        env = dict(os.environ)
+        if self.offscreen:
+            env["QT_QPA_PLATFORM"] = "offscreen"
+        command = [sys.executable, "-X", "importtime", os.path.abspath(__file__), "--child"]
+        started = time.time()
+        result = subprocess.run(command, cwd=ROOT_DIR, env=env, capture_output=True,
+                                text=True, timeout=self.CHILD_TIMEOUT)
+        first_frame, loaded = None, []
+        for line in result.stdout.splitlines():
+            if line.startswith(self.MARKER):
+                key, _, value = line[len(self.MARKER):].strip().partition(" ")
+                if key == "first_frame":
+                    first_frame = (float(value) - started) * 1000
+                elif key == "loaded" and value:
+                    loaded = value.split(",")
+        if first_frame is None:
+            raise RuntimeError(f"GUI exited without painting (code {result.returncode}):\n{result.stderr[-2000:]}")
+        return first_frame, self.parse_importtime(result.stderr), loaded
+
+    @staticmethod
+    def parse_importtime(stderr):
+        """Returns {top-level module: cumulative ms} from -X importtime output.
+           Lines look like 'import time:  self [us] | cumulative | <indent>name',
+           with two spaces of indent per nesting level.
+        """
+        imports = {}
+        for line in stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            fields = line[len("import time:"):].split("|")
+            if len(fields) != 3 or not fields[1].strip().isdigit():
+                continue  # header row
+            name = fields[2].rstrip()
+            if len(name) - len(name.lstrip()) > 1:
+                continue  # nested import, already counted in its parent
+            imports[name.strip()] = imports.get(name.strip(), 0) + int(fields[1]) / 1000
+        return imports
+
+    # REPORTING
+    def report(self, top=15):
+        median = statistics.median(self.first_frames)
+        print(f"\nTime to first frame: median {median:.1f} ms, "
+              f"min {min(self.first_frames):.1f} ms, max {max(self.first_frames):.1f} ms")
+
+        ranked = sorted(((statistics.median(v), k) for k, v in self.imports.items()), reverse=True)
+        total = sum(ms for ms, _ in ranked)
+        print(f"\nTop-level imports by cumulative time (total {total:.1f} ms):")
+        for ms, name in ranked[:top]:
+            print(f"  {name:<45} {ms:>10.1f} ms {ms / total if total else 0:>7.1%}")
+
+        if self.loaded_early:
+            print(f"\n\033[93m[WARNING] Loaded before first frame: {', '.join(sorted(self.loaded_early))}\033[0m")
+        else:
+            print("\nNo deferred module loaded before first frame.")
+        return median
+
+    # CHILD SIDE
+    @staticmethod
+    def child():
+        """Builds the GUI, prints the first-paint timestamp and the deferred modules loaded, then quits."""
+        from PyQt5.QtCore import QObject, QEvent, QTimer
+        from Dongle import Dongle
+
+        app, main_GUI = Dongle.create([sys.argv[0]])
+
+        class FirstFrame(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Paint and not self.property("seen"):
+                    self.setProperty("seen", True)
+                    print(f"{StartupProfiler.MARKER} first_frame {time.time():.6f}")
+                    loaded = [m for m in StartupProfiler.DEFERRED if m in sys.modules]
+                    print(f"{StartupProfiler.MARKER} loaded {','.join(loaded)}", flush=True)
+                    QTimer.singleShot(0, app.quit)
+                return False
+
+        watcher = FirstFrame()
+        app.installEventFilter(watcher)
+        QTimer.singleShot(int(StartupProfiler.CHILD_TIMEOUT * 1000), app.quit)
+        app.exec_()
+        main_GUI.handler.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="STM32 Dongle Lock cold start profiler")
+    parser.add_argument("--runs", type=int, default=5, help="cold starts to measure (default: 5)")
+    parser.add_argument("--top", type=int, default=15, help="top-level imports to list (default: 15)")
+    parser.add_argument("--budget-ms", type=float,
+                        help="exit non-zero if the median time to first frame exceeds this")
+    parser.add_argument("--onscreen", action="store_true", help="use the real display instead of offscreen")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        StartupProfiler.child()
+        return
+
+    profiler = StartupProfiler(runs=args.runs, offscreen=not args.onscreen)
+    profiler.run()
+    median = profiler.report(args.top)
+    failed = False
+    if args.budget_ms is not None:
+        if median > args.budget_ms:
+            print(f"\n[Error] Median first frame {median:.1f} ms is over the {args.budget_ms:.0f} ms budget.")
+            failed = True
+        else:
+            print(f"\nWithin the {args.budget_ms:.0f} ms budget.")
+    if profiler.loaded_early:
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
 # Authors: Buqwana Xolisile and Kagiso Dube
-# Version: 21/10/2025
+# Version: 19/10/2026
 # Project: EEE3095S Project
 # Class Description: Centralized STM32CubeProgrammer inspired UI theme.
 
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt
+
+
 class ThemeUI:
     PRIMARY_BG = "#05244b"
     SECONDARY_BG = "#3b546c"
@@ -14,8 +18,37 @@ class ThemeUI:
     BORDER_COLOR = "#687d94"
     SUCCESS_LIME = "#c2c43f"
 
+    _stylesheet = None  # rendered once, on first use
+
     @staticmethod
     def get_stylesheet() -> str:
+        """Returns the application stylesheet, rendering it only on the first call."""
+        if ThemeUI._stylesheet is None:
+            ThemeUI._stylesheet = ThemeUI._render()
+        return ThemeUI._stylesheet
+
+    @staticmethod
+    def apply(app=None):
+        """Sets the stylesheet on the QApplication, once; later calls are no-ops."""
+        app = app or QApplication.instance()
+        if app is not None and app.property("themeApplied") is not True:
+            app.setStyleSheet(ThemeUI.get_stylesheet())
+            app.setProperty("themeApplied", True)
+
+    @staticmethod
+    def set_role(widget, role: str, name: str = "role"):
+        """Selects a styled variant through a dynamic property.
+           Re-polishes only when the value changes on a widget that is already styled.
+        """
+        if widget.property(name) == role:
+            return
+        widget.setProperty(name, role)
+        if widget.testAttribute(Qt.WA_WState_Polished):
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+
+    @staticmethod
+    def _render() -> str:
         return f"""
             QWidget {{
                 background-color: {ThemeUI.PRIMARY_BG};
@@ -61,7 +94,7 @@ class ThemeUI:
                 color: #888888;
             }}
 
-            QLineEdit, QTextEdit {{
+            QLineEdit, QTextEdit, QPlainTextEdit {{
                 background-color: {ThemeUI.SURFACE_BG};
                 border: 1px solid {ThemeUI.BORDER_COLOR};
                 border-radius: 6px;
@@ -70,7 +103,7 @@ class ThemeUI:
                 selection-background-color: {ThemeUI.ACCENT_BLUE};
             }}
 
-            QTextEdit {{
+            QTextEdit, QPlainTextEdit {{
                 font-family: Consolas, monospace;
                 font-size: 12px;
             }}
@@ -103,4 +136,158 @@ class ThemeUI:
             QScrollBar::handle:vertical:hover {{
                 background: {ThemeUI.HOVER_BLUE};
             }}
+
+            /* ROLES: variants are picked with ThemeUI.set_role(), never with widget stylesheets */
+
+            QLabel[role="section"] {{
+                color: white;
+            }}
+
+            QWidget[role="banner"], QWidget[role="banner"] QLabel {{
+                background-color: white;
+            }}
+
+            QFrame[role="card"] {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                            stop:0 #f2f2f2, stop:1 #e6e6e6);
+                border-radius: 10px;
+            }}
+
+            QFrame[role="panel"] {{
+                background-color: {ThemeUI.PRIMARY_BG};
+                border-radius: 8px;
+            }}
+
+            QFrame[role="info"] {{
+                background-color: #001f3f;
+                border-radius: 8px;
+            }}
+
+            QFrame[role="info"] QLabel {{
+                background: transparent;
+                color: #dee6f3;
+                font-family: Consolas, monospace;
+                font-size: 12px;
+            }}
+
+            QFrame[role="info"] QLabel[role="info-title"] {{
+                color: #7ec8ff;
+                font-weight: 600;
+                font-size: 13px;
+            }}
+
+            QFrame[role="info"] QLabel[role="info-key"] {{
+                color: #9fc4e3;
+            }}
+
+            QFrame[role="info"] QLabel[role="info-value"] {{
+                color: #ffffff;
+                font-weight: 500;
+            }}
+
+            QPlainTextEdit[role="log"] {{
+                background-color: #ffffff;
+                border: none;
+                border-radius: 6px;
+                font-family: Consolas, monospace;
+                font-size: 12px;
+                color: #1a1a1a;
+                padding: 8px;
+            }}
+
+            QTextEdit[role="document"] {{
+                border: none;
+                background-color: #ffffff;
+                color: #000000;
+                border-radius: 6px;
+            }}
+
+            QPushButton[role="standard"], QPushButton[role="confirm"],
+            QPushButton[role="disconnect"], QPushButton[role="help"] {{
+                border: none;
+                border-radius: 8px;
+                font-weight: 600;
+                font-size: 13px;
+            }}
+
+            QPushButton[role="standard"] {{
+                background-color: {ThemeUI.ACCENT_BLUE};
+                color: {ThemeUI.TEXT_COLOR};
+            }}
+
+            QPushButton[role="standard"]:hover {{
+                background-color: {ThemeUI.HOVER_BLUE};
+            }}
+
+            QPushButton[role="standard"]:pressed {{
+                background-color: {ThemeUI.PRESSED_BLUE};
+            }}
+
+            QPushButton[role="confirm"], QPushButton[role="disconnect"] {{
+                background-color: {ThemeUI.SUCCESS_LIME};
+                color: white;
+            }}
+
+            QPushButton[role="confirm"]:hover, QPushButton[role="disconnect"]:hover {{
+                background-color: #d0d246;
+            }}
+
+            QPushButton[role="confirm"]:pressed, QPushButton[role="disconnect"]:pressed {{
+                background-color: #a8aa36;
+            }}
+
+            QPushButton[role="help"] {{
+                background-color: #f2e36b;
+                color: white;
+            }}
+
+            QPushButton[role="help"]:hover {{
+                background-color: #f7eb7a;
+            }}
+
+            QPushButton[role="help"]:pressed {{
+                background-color: #e5d85d;
+            }}
+
+            QPushButton[role="disconnect"] {{
+                padding: 8px 16px;
+                min-height: 38px;
+            }}
+
+            QDialog[role="prompt"] {{
+                background-color: {ThemeUI.PRIMARY_BG};
+                border-radius: 10px;
+                font-family: Segoe UI, Arial;
+                color: white;
+            }}
+
+            QDialog[role="prompt"] QLabel {{
+                color: #dee6f3;
+                font-weight: 600;
+                font-size: 13px;
+            }}
+
+            QDialog[role="prompt"] QLineEdit {{
+                background-color: #ffffff;
+                border: 1px solid #0077b6;
+                border-radius: 6px;
+                padding: 6px;
+                font-size: 13px;
+                color: {ThemeUI.PRIMARY_BG};
+            }}
+
+            QDialog[role="prompt"] QLineEdit:focus {{
+                border: 1px solid {ThemeUI.HOVER_BLUE};
+                background-color: #f0faff;
+            }}
+
+            QDialog[role="prompt"] QPushButton {{
+                padding: 6px 14px;
+                min-width: 80px;
+            }}
+
+            QMessageBox[role="confirm-exit"] QPushButton {{
+                min-width: 90px;
+                min-height: 36px;
+            }}
         """
@@ -0,0 +1,182 @@
+# Authors: Buqwana Xolisile and Kagiso Dube
+# Version: 19/10/2026
+# Project: EEE3095S Project
+# Class Description: Non-modal toast notifications stacked inside a window, with queueing, dedup and rate limiting.
+
+import time
+from collections import deque
+from PyQt5.QtWidgets import QFrame, QLabel, QVBoxLayout
+from PyQt5.QtCore import Qt, QObject, QEvent, QTimer
+
+from ThemeUI import ThemeUI
+
+
+class Toast(QFrame):
+    """One notification card. Click it to dismiss it early."""
+
+    WIDTH = 300
+
+    # Carries its own stylesheet so it looks the same in both GUIs, whatever the app theme
+    STYLESHEET = """
+        QFrame#toast {
+            background: #ffffff;
+            border: 1px solid #d0d7de;
+            border-left: 5px solid #1184d5;
+            border-radius: 8px;
+        }
+        QFrame#toast[level="success"] { border-left-color: #10B981; }
+        QFrame#toast[level="error"] { border-left-color: #EF4444; }
+        QFrame#toast QLabel {
+            background: transparent;
+            border: none;
+            color: #1F2937;
+            font-size: 12px;
+        }
+        QFrame#toast QLabel#toastTitle {
+            font-weight: bold;
+            font-size: 13px;
+        }
+    """
+
+    def __init__(self, notifier, key, title, message, level, count=1):
+        super().__init__(notifier.host)
+        self.notifier = notifier
+        self.key = key
+        self.title = title
+        self.count = count
+        self.setObjectName("toast")
+        self.setStyleSheet(self.STYLESHEET)
+        ThemeUI.set_role(self, level, "level")
+        self.setFixedWidth(self.WIDTH)
+        self.setCursor(Qt.PointingHandCursor)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 8, 12, 8)
+        layout.setSpacing(2)
+        self.title_label = QLabel()
+        self.title_label.setObjectName("toastTitle")
+        self.message_label = QLabel(message)
+        self.message_label.setWordWrap(True)
+        layout.addWidget(self.title_label)
+        layout.addWidget(self.message_label)
+        self._update_title()
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._expire)
+        self.timer.start(int(notifier.duration(level) * 1000))
+
+    def bump(self, count=1):
+        """The same message arrived again: count it and keep the toast up longer."""
+        self.count += count
+        self._update_title()
+        self.timer.start()
+
+    def _expire(self):
+        self.notifier.dismiss(self)
+
+    def _update_title(self):
+        self.title_label.setText(self.title if self.count == 1 else f"{self.title}  ×{self.count}")
+        self.adjustSize()
+
+    def mousePressEvent(self, event):
+        self.notifier.dismiss(self)
+
+
+class ToastNotifier(QObject):
+    """Shows notifications as toasts stacked in the bottom-right corner of host.
+
+       notify() never blocks: the toast appears on top of whatever screen is shown
+       and goes away on its own. At most MAX_VISIBLE toasts are up at once and a new
+       one appears at most every MIN_INTERVAL seconds; the rest wait in a queue of
+       QUEUE_LIMIT, oldest dropped first. A message identical to one already shown
+       or queued is not repeated, its toast counts it instead ("x3").
+       Modal dialogs remain for confirmations only.
+    """
+
+    DURATIONS = {"info": 3.0, "success": 3.0, "error": 6.0}  # seconds on screen
+    MAX_VISIBLE = 4
+    MIN_INTERVAL = 0.2
+    QUEUE_LIMIT = 10
+    MARGIN = 12
+    SPACING = 8
+
+    @classmethod
+    def for_widget(cls, host):
+        """Returns the notifier of host, creating it on first use."""
+        notifier = host.findChild(cls, "", Qt.FindDirectChildrenOnly)
+        return notifier or cls(host)
+
+    def __init__(self, host):
+        super().__init__(host)
+        self.host = host
+        self.visible = []           # Toasts, oldest first
+        self.pending = deque()      # [key, title, message, level, count] waiting to be shown
+        self._next_allowed = 0.0
+        self._pump_timer = QTimer(self)
+        self._pump_timer.setSingleShot(True)
+        self._pump_timer.timeout.connect(self._pump)
+        host.installEventFilter(self)
+
+    @classmethod
+    def duration(cls, level):
+        return cls.DURATIONS.get(level, cls.DURATIONS["info"])
+
+    # API
+    def notify(self, title, message, level="info"):
+        key = (level, title, message)
+        for toast in self.visible:
+            if toast.key == key:
+                toast.bump()
+                return
+        for entry in self.pending:
+            if entry[0] == key:
+                entry[4] += 1
+                return
+        if len(self.pending) >= self.QUEUE_LIMIT:
+            dropped = self.pending.popleft()
+            print(f"[DEBUG] Toast queue full, dropped: {dropped[1]}")
+        self.pending.append([key, title, message, level, 1])
+        self._pump()
+
+    def dismiss(self, toast):
+        if toast in self.visible:
+            self.visible.remove(toast)
+            toast.hide()
+            toast.deleteLater()
+            self._layout()
+            self._pump()
+
+    def clear(self):
+        self.pending.clear()
+        for toast in list(self.visible):
+            self.dismiss(toast)
+
+    # QUEUE
+    def _pump(self):
+        while self.pending and len(self.visible) < self.MAX_VISIBLE:
+            wait = self._next_allowed - time.monotonic()
+            if wait > 0:
+                self._pump_timer.start(int(wait * 1000) + 1)
+                return
+            key, title, message, level, count = self.pending.popleft()
+            toast = Toast(self, key, title, message, level, count)
+            self.visible.append(toast)
+            toast.show()
+            toast.raise_()
+            self._layout()
+            self._next_allowed = time.monotonic() + self.MIN_INTERVAL
+
+    def _layout(self):
+        """Stacks the toasts upwards from the bottom-right corner, newest at the bottom."""
+        y = self.host.height() - self.MARGIN
+        for toast in reversed(self.visible):
+            y -= toast.height()
+            toast.move(self.host.width() - toast.width() - self.MARGIN, y)
+            toast.raise_()
+            y -= self.SPACING
+
+    def eventFilter(self, obj, event):
+        if obj is self.host and event.type() == QEvent.Resize and self.visible:
+            self._layout()
+        return False